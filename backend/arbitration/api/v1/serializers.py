@@ -1,7 +1,15 @@
 from rest_framework import serializers
 
 from arbitration.models import TicketArbitrationData, Ticket, TicketStatus, TicketTypes
-from users.api.v1.serializers import DealershipSerializer
+from users.api.v1.serializers import DealershipSerializer, DEALERSHIP_RELATED
+from utils.prefetch import nested
+
+TICKET_ARBITRATION_RELATED = (
+    "ticket_id__category_id",
+    "ticket_id__status",
+    *nested("ticket_id__buyer_id", DEALERSHIP_RELATED),
+    *nested("ticket_id__seller_id", DEALERSHIP_RELATED),
+)
 
 
 class TicketTypesSerializer(serializers.ModelSerializer):
@@ -63,6 +71,10 @@ class CreateArbitrationTicketSerializer(serializers.Serializer):
     issues = serializers.CharField(required=True)
 
 
+class ArbitrationUploadSignatureSerializer(serializers.Serializer):
+    auction_id = serializers.CharField(required=True)
+
+
 class TicketTypeDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = TicketTypes
@@ -2,10 +2,13 @@ from django.urls import path
 
 from arbitration.api.v1.views import ArbitrationTicketCreateAPIView, TicketListAPIView, TicketStatusListCreateAPIView, \
     TicketTypeListCreateAPIView, TicketStatusDetailAPIView, TicketTypeDetailAPIView, InactiveTicketStatusListAPIView, \
-    InactiveTicketTypeListAPIView, DeleteInactiveTicketStatusAPIView, DeleteInactiveTicketTypeAPIView, TicketDetailAPIView
+    InactiveTicketTypeListAPIView, DeleteInactiveTicketStatusAPIView, DeleteInactiveTicketTypeAPIView, TicketDetailAPIView, \
+    ArbitrationUploadSignatureAPIView, ArbitrationTicketAttachmentsAPIView
 
 urlpatterns = [
     path("request/", ArbitrationTicketCreateAPIView.as_view(), name="create_arbitration_request"),
+    path("request/upload-signature/", ArbitrationUploadSignatureAPIView.as_view(), name="arbitration_upload_signature"),
+    path("request/<int:pk>/attachments/", ArbitrationTicketAttachmentsAPIView.as_view(), name="arbitration_ticket_attachments"),
     path("tickets/", TicketListAPIView.as_view(), name="tickets_list"),
     path("tickets/<int:pk>/", TicketDetailAPIView.as_view(), name="ticket_detail"),
     path("ticket-status/", TicketStatusListCreateAPIView.as_view(), name="ticket_status_list_create"),
@@ -9,12 +9,15 @@ from rest_framework.response import Response
 
 from arbitration.api.v1.serializers import ArbitrationTicketSerializer, CreateArbitrationTicketSerializer, \
     TicketSerializer, TicketStatusSerializer, TicketTypesSerializer, TicketStatusDetailSerializer, \
-    TicketTypeDetailSerializer, RestoreInactiveTicketStatusSerializer, RestoreInactiveTicketTypeSerializer
+    TicketTypeDetailSerializer, RestoreInactiveTicketStatusSerializer, RestoreInactiveTicketTypeSerializer, \
+    ArbitrationUploadSignatureSerializer
 from arbitration.models import Ticket, TicketArbitrationData, TicketAttachment, TicketComment, TicketStatus, TicketTypes
 from auctions.permissions import IsBuyerUserPermission
 from inspections.models import InspectionRequest
 from users.permissions import IsAdminUserPermission
-from utils.cloudinary import upload_file
+from utils.api.v1.serializers import RegisterSignedUploadsSerializer
+from utils.cloudinary import sign_upload, upload_files
+from utils.paginations import AdminCursorPagination
 
 
 class ArbitrationTicketCreateAPIView(APIView):
@@ -88,12 +91,10 @@ class ArbitrationTicketCreateAPIView(APIView):
             ticket_attachments = []
             attachments_list = []
 
-            print("attachment file", request.FILES.getlist('attachments'))
-
-
-            for file in request.FILES.getlist('attachments'):
-                url = upload_file(file, f"arbitration/{auction_id}/attachments")
+            files = request.FILES.getlist('attachments')
+            assets = upload_files([("attachments", file, f"arbitration/{auction_id}/attachments") for file in files])
 
+            for url in (asset.url for asset in assets):
                 ticket_attachments.append(
                     TicketAttachment(
                         ticket_id=ticket,
@@ -114,8 +115,53 @@ class ArbitrationTicketCreateAPIView(APIView):
             return Response({"response": "Arbitration ticket created successfully"}, status=status.HTTP_200_OK)
 
 
+class ArbitrationUploadSignatureAPIView(APIView):
+    permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
+
+    def post(self, request):
+        serializer = ArbitrationUploadSignatureSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        auction_id = serializer.validated_data["auction_id"]
+        dealer = request.user.dealer
+        # Only the winning buyer and the seller attach files to the auction's arbitration
+        get_object_or_404(InspectionRequest, Q(auction_id=auction_id) & (Q(auction_won_id__buyer_id=dealer) | Q(dealer=dealer)))
+
+        return Response(sign_upload(f"arbitration/{auction_id}/attachments", f"arbitration:{auction_id}:{request.user.id}"))
+
+
+class ArbitrationTicketAttachmentsAPIView(APIView):
+    permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
+
+    def post(self, request, pk):
+        ticket = get_object_or_404(Ticket, id=pk, created_by=request.user)
+
+        serializer = RegisterSignedUploadsSerializer(data=request.data, context={"target": f"arbitration:{ticket.auction_id}:{request.user.id}"})
+        serializer.is_valid(raise_exception=True)
+        urls = [upload["url"] for upload in serializer.validated_data["files"]]
+
+        ticket_arbitration = ticket.ticket_arbitrations.order_by("id").first()
+        ticket_comment = ticket.comments.order_by("id").first()
+
+        TicketAttachment.objects.bulk_create([
+            TicketAttachment(
+                ticket_id=ticket,
+                arbitration_id=ticket_arbitration,
+                comment_id=ticket_comment,
+                file_from_type=0,
+                storage=1,
+                file_url=url,
+                created_by=request.user
+            )
+            for url in urls
+        ])
+
+        return Response({"attachments": urls}, status=status.HTTP_201_CREATED)
+
+
 class TicketListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = TicketSerializer
     queryset = Ticket.objects.all()
 
@@ -128,6 +174,7 @@ class TicketDetailAPIView(RetrieveUpdateDestroyAPIView):
 
 class TicketStatusListCreateAPIView(ListCreateAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = None
     serializer_class = TicketStatusSerializer
     queryset = TicketStatus.objects.filter(is_active=True)
 
@@ -144,6 +191,7 @@ class TicketStatusDetailAPIView(RetrieveUpdateDestroyAPIView):
 
 class InactiveTicketStatusListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = None
     serializer_class = TicketStatusSerializer
     queryset = TicketStatus.objects.filter(is_active=False)
 
@@ -156,6 +204,7 @@ class DeleteInactiveTicketStatusAPIView(RetrieveUpdateDestroyAPIView):
 
 class TicketTypeListCreateAPIView(ListCreateAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = None
     serializer_class = TicketTypesSerializer
     queryset = TicketTypes.objects.filter(is_active=True)
 
@@ -172,6 +221,7 @@ class TicketTypeDetailAPIView(RetrieveUpdateDestroyAPIView):
 
 class InactiveTicketTypeListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = None
     serializer_class = TicketTypesSerializer
     queryset = TicketTypes.objects.filter(is_active=False)
 
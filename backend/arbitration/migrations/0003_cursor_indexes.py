@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arbitration', '0002_alter_ticket_category_id'),
+        ('users', '0014_remove_transporter_city_name_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['created_at', 'id'], name='arbitration_created_ca21d8_idx'),
+        ),
+    ]
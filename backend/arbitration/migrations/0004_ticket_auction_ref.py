@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arbitration', '0003_cursor_indexes'),
+        ('auctions', '0012_auction_refs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='auction_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tickets', to='auctions.auctions'),
+        ),
+    ]
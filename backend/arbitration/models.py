@@ -1,5 +1,7 @@
 from django.db import models
 
+from auctions.models import AuctionReferenceMixin
+
 class TicketArbitrationData(models.Model):
     ticket_id = models.ForeignKey("arbitration.Ticket", related_name="ticket_arbitrations", null=True, blank=True, on_delete=models.SET_NULL)
     seller_agreed = models.IntegerField(blank=True, null=True)
@@ -20,11 +22,12 @@ class TicketArbitrationData(models.Model):
     updated_at = models.DateTimeField(auto_now_add=True)
 
 
-class Ticket(models.Model):
+class Ticket(AuctionReferenceMixin, models.Model):
     name = models.CharField(max_length=255, blank=True, null=True)
     email = models.CharField(max_length=255, blank=True, null=True)
     category_id = models.ForeignKey("arbitration.TicketTypes", related_name="tickets", null=True, blank=True, on_delete=models.SET_NULL)
     auction_id = models.CharField(max_length=255, blank=True, null=True)
+    auction_ref = models.ForeignKey("auctions.Auctions", related_name="tickets", on_delete=models.SET_NULL, null=True, blank=True)
     dealer_id = models.CharField(max_length=255, blank=True, null=True)
     location_id = models.CharField(max_length=255, blank=True, null=True)
     buyer_id = models.ForeignKey("users.Dealership", related_name="buyer_tickets", null=True, blank=True, on_delete=models.SET_NULL)
@@ -44,6 +47,11 @@ class Ticket(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+        ]
+
 
 class TicketAttachment(models.Model):
     ticket_id = models.ForeignKey("arbitration.Ticket", related_name='attachments', null=True, blank=True, on_delete=models.SET_NULL)
@@ -1,3 +1,41 @@
+from unittest import mock
+
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from auctions.models import AuctionWon
+from inspections.models import InspectionRequest
+from users.models import Dealership, Role, User
+
+
+def create_user(email, role_name, dealership_name):
+    role, _ = Role.objects.get_or_create(name=role_name, defaults={"status": 1})
+    dealer = Dealership.objects.create(dealership_name=dealership_name)
+
+    return User.objects.create(first_name=dealership_name, last_name="User", email=email, role=role, dealer=dealer)
+
+
+class ArbitrationUploadSignatureTestCase(TestCase):
+    def setUp(self):
+        self.seller = create_user("seller@example.com", "BOTH", "Seller")
+        self.buyer = create_user("buyer@example.com", "BUYER", "Buyer")
+        won = AuctionWon.objects.create(auction_id="A1", buyer_id=self.buyer.dealer)
+        InspectionRequest.objects.create(dealer=self.seller.dealer, auction_id="A1", auction_won_id=won, manual_delivered=0, via_api=0)
+        self.client = APIClient()
+        # Signing needs Cloudinary credentials, only the access check is under test
+        patcher = mock.patch("arbitration.api.v1.views.sign_upload", lambda folder, target: {"folder": folder})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sign(self, user):
+        self.client.force_authenticate(user)
+
+        return self.client.post(reverse("arbitration_upload_signature"), {"auction_id": "A1"}, format="json")
+
+    def test_winning_buyer_and_seller_get_a_signature(self):
+        self.assertEqual(self.sign(self.buyer).data["folder"], "arbitration/A1/attachments")
+        self.assertEqual(self.sign(self.seller).status_code, 200)
 
-# Create your tests here.
+    def test_other_buyers_are_refused(self):
+        self.assertEqual(self.sign(create_user("other@example.com", "BUYER", "Other")).status_code, 404)
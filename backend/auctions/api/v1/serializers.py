@@ -1,21 +1,28 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
 from rest_framework import serializers
 
 from inspections.models import InspectionRequest, VehicleInspectionReport
 from users.models import Dealership, User, DealerLocation
+from auctions.engine import BidRejected, get_bid_engine
 from auctions.models import Auctions, AuctionBids, AuctionProxies, AuctionOffers, AuctionNegotiations, AuctionWon
+from auctions.search import LIGHTS, STAGES, mark_auctions_changed
 from inspections.api.v1.serializers import InspectionRequestSerializer, VehicleInspectionSerializer
+from inspections.utils import report_summaries
 from users.api.v1.serializers import DealershipSerializer, UserDetailSerializer, DealerLocationSerializer
 from transportation.models import TransportationJob, TransportationJobTracking
 from transportation.api.v1.serializers import TransportationJobSerializer, TransportationJobTrackingSerializer
+from utils.prefetch import auction_related, instance_values
 
 
 class SendToAuctionSerializer(serializers.ModelSerializer):
     request_id = serializers.PrimaryKeyRelatedField(queryset=InspectionRequest.objects.all(), required=True)
     auction_type = serializers.IntegerField(required=True)
-    reserve_price = serializers.CharField(required=True)
+    reserve_price = serializers.DecimalField(max_digits=12, decimal_places=2, required=True)
     credit_use_for_inspection_fee = serializers.IntegerField(required=True)
     credit_use_for_selling_fee = serializers.IntegerField(required=True)
-    bid_start_from_price = serializers.CharField(read_only=True)
+    bid_start_from_price = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
 
     class Meta:
         model = Auctions
@@ -52,18 +59,16 @@ class SendToAuctionSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         inspection_request = validated_data["request_id"]
         dealer = inspection_request.dealer
-        reserve_price = float(validated_data.get("reserve_price"))
+        reserve_price = validated_data.get("reserve_price")
 
         if validated_data.get("auction_type") == 1:
-            bid_start_from_price = 0.00
+            bid_start_from_price = Decimal("0.00")
         elif validated_data.get("auction_type") == 2:
-            bid_start_from_price = reserve_price / 2
+            bid_start_from_price = (reserve_price / 2).quantize(Decimal("0.01"))
         elif validated_data.get("auction_type") == 3:
-            bid_start_from_price = reserve_price - 3000
-            if bid_start_from_price < 0:
-                bid_start_from_price = 0.00
+            bid_start_from_price = max(reserve_price - 3000, Decimal("0.00"))
         else:
-            bid_start_from_price = 0.00  # Fallback
+            bid_start_from_price = Decimal("0.00")  # Fallback
 
         auction_run_time = 600 # static for now
         inspection_request.count_down = auction_run_time
@@ -92,6 +97,7 @@ class SendToAuctionSerializer(serializers.ModelSerializer):
                 "status": 0,
             }
         )
+        mark_auctions_changed([auction.id])
 
         return auction
 
@@ -141,15 +147,7 @@ class UpcomingAuctionsSerializer(serializers.ModelSerializer):
         return None
 
     def get_inspection_reports(self, obj):
-        print(f"Request ID type: {type(obj.request_id)}")
-
-        reports = VehicleInspectionReport.objects.filter(request_id=obj.request_id)
-        print("reports", reports)
-
-        if reports.exists():
-            return list(reports.values())
-
-        return None
+        return report_summaries(obj.request_id.inspection_reports.all()) if obj.request_id else None
 
 
 class AuctionsLiveSerializer(serializers.ModelSerializer):
@@ -189,18 +187,13 @@ class AuctionsLiveSerializer(serializers.ModelSerializer):
         )
 
     def get_inspection_reports(self, obj):
-        reports = VehicleInspectionReport.objects.filter(request_id=obj.request_id)
-
-        if reports.exists():
-            return list(reports.values())
-
-        return None
+        return report_summaries(obj.request_id.inspection_reports.all()) if obj.request_id else None
 
     def get_last_bid_id(self, obj):
-        last_bid_id = AuctionBids.objects.filter(auction_id=obj.auction_id)
+        last_bid_id = auction_related(obj, "bids", AuctionBids.objects.all())
 
-        if last_bid_id.exists():
-            return list(last_bid_id.values())
+        if last_bid_id:
+            return instance_values(last_bid_id)
 
         return None
 
@@ -252,6 +245,25 @@ class MarketplaceSerializer(serializers.ModelSerializer):
         )
 
 
+class MarketplaceSearchSerializer(serializers.Serializer):
+    stage = serializers.MultipleChoiceField(choices=list(STAGES), required=False)
+    make = serializers.ListField(child=serializers.CharField(max_length=255), required=False)
+    model = serializers.ListField(child=serializers.CharField(max_length=255), required=False)
+    year = serializers.ListField(child=serializers.CharField(max_length=255), required=False)
+    state = serializers.ListField(child=serializers.CharField(max_length=255), required=False)
+    lights = serializers.ListField(child=serializers.ChoiceField(choices=list(LIGHTS)), required=False)
+    min_odometer = serializers.IntegerField(min_value=0, required=False)
+    max_odometer = serializers.IntegerField(min_value=0, required=False)
+    min_price = serializers.IntegerField(min_value=0, required=False)
+    max_price = serializers.IntegerField(min_value=0, required=False)
+
+    def validate(self, attrs):
+        # Query strings give an empty selection rather than none, both mean live auctions
+        attrs["stages"] = tuple(STAGES[stage] for stage in attrs.pop("stage", None) or ["live"])
+
+        return attrs
+
+
 class BuyingCurrentBidsSerializer(serializers.ModelSerializer):
     request_id = InspectionRequestSerializer(read_only=True)
     inspection_reports = serializers.SerializerMethodField()
@@ -282,12 +294,7 @@ class BuyingCurrentBidsSerializer(serializers.ModelSerializer):
         return AuctionOfferSerializer(offers, many=True).data
 
     def get_inspection_reports(self, obj):
-        reports = VehicleInspectionReport.objects.filter(request_id=obj.request_id)
-
-        if reports.exists():
-            return list(reports.values())
-
-        return None
+        return report_summaries(obj.request_id.inspection_reports.all()) if obj.request_id else None
 
     # def get_auction_won_detail(self, obj):
     #     buyer = self.context["request"].user.dealer
@@ -327,17 +334,12 @@ class ActiveBuyingAuctionSerializer(serializers.ModelSerializer):
         )
 
     def get_offers(self, obj):
-        offers = AuctionOffers.objects.filter(auction_id=obj.auction_id)
+        offers = auction_related(obj, "offers", AuctionOffers.objects.all())
 
         return AuctionOfferSerializer(offers, many=True).data
 
     def get_inspection_reports(self, obj):
-        reports = VehicleInspectionReport.objects.filter(request_id=obj.request_id)
-
-        if reports.exists():
-            return list(reports.values())
-
-        return None
+        return report_summaries(obj.request_id.inspection_reports.all()) if obj.request_id else None
 
     # def get_auction_won_detail(self, obj):
     #     buyer = self.context["request"].user.dealer
@@ -382,21 +384,16 @@ class AuctionNegotiationSerializer(serializers.ModelSerializer):
         )
 
     def get_highest_offer(self, obj):
-        offers = AuctionOffers.objects.filter(auction_id=obj.auction_id)
+        offers = auction_related(obj, "offers", AuctionOffers.objects.all())
 
-        if offers.exists():
-            highest_offer = offers.order_by("-amount").first()
+        if offers:
+            highest_offer = max(offers, key=lambda offer: offer.amount or 0)
             return AuctionOfferSerializer(highest_offer).data
 
         return None
 
     def get_inspection_reports(self, obj):
-        reports = VehicleInspectionReport.objects.filter(request_id=obj.request_id)
-
-        if reports.exists():
-            return list(reports.values())
-
-        return None
+        return report_summaries(obj.request_id.inspection_reports.all()) if obj.request_id else None
 
 
 class AuctionNegotiationOfferUpdateSerializer(serializers.ModelSerializer):
@@ -488,42 +485,33 @@ class AuctionCreateBidSerializer(serializers.ModelSerializer):
         )
 
     def validate(self, attrs):
-        if not Auctions.objects.filter(auction_id=attrs["auction_id"]).exists():
+        if get_bid_engine().get_state(attrs["auction_id"]) is None:
             raise serializers.ValidationError({"error": "No Auction exists"})
 
         if attrs["bid"] % 50 != 0 and attrs["bid"] % 100 != 0:
             raise serializers.ValidationError({"error": "Bid must be a multiple of 50 or 100"})
 
-        if AuctionBids.objects.filter(auction_id=attrs["auction_id"], bid__gte=attrs["bid"]).exists():
-            raise serializers.ValidationError({"error": "Enter bid amount greater than highest auction"})
-
-        auction_bids = AuctionBids.objects.filter(auction_id=attrs["auction_id"])
-
-        if auction_bids.exists() and auction_bids.last().buyer_user_id == self.context["request"].user:
-            raise serializers.ValidationError({"error": "Buyer already have highest bid"})
-
         return attrs
 
     def create(self, validated_data):
-        buyer_dealer = self.context["request"].user.dealer
-        auction = Auctions.objects.get(auction_id=validated_data["auction_id"])
-        auction.request_id.status = 21
-        auction.request_id.buyer_id = buyer_dealer
-        auction.request_id.save()
-
         buyer_user_id = self.context["request"].user
         buyer_id = buyer_user_id.dealer
 
-        validated_data["request_id"] = auction.request_id
-        validated_data["buyer_id"] = buyer_id
-        validated_data["buyer_user_id"] = buyer_user_id
-
-        auction_bid = AuctionBids.objects.create(**validated_data)
-
-        auction.last_bid_id = auction_bid
-        auction.save(update_fields=["last_bid_id"])
-
-        return auction_bid
+        try:
+            bid, _ = get_bid_engine().place_bid(validated_data["auction_id"], validated_data["bid"], buyer_id.id, buyer_user_id.id)
+        except BidRejected as e:
+            raise serializers.ValidationError({"error": str(e)})
+
+        # The row itself is written by the process_bid_queue worker
+        return AuctionBids(
+            auction_id=bid["auction_id"],
+            request_id_id=bid["request_id"],
+            buyer_id=buyer_id,
+            buyer_user_id=buyer_user_id,
+            bid=bid["bid"],
+            status=0,
+            created_at=datetime.fromtimestamp(bid["created_at"], tz=timezone.utc),
+        )
 
 class AuctionOfferSerializer(serializers.ModelSerializer):
     request_id = InspectionRequestSerializer(read_only=True)
@@ -602,30 +590,27 @@ class AuctionSoldSerializer(serializers.ModelSerializer):
         )
 
     def get_inspection_reports(self, obj):
-        reports = VehicleInspectionReport.objects.filter(request_id=obj.request_id)
-
-        if reports.exists():
-            return list(reports.values())
-
-        return None
+        return report_summaries(obj.request_id.inspection_reports.all()) if obj.request_id else None
 
     def get_offers(self, obj):
         buyer_user = self.context["request"].user.dealer
+        buyer_id = buyer_user.id if buyer_user else None
 
-        auction_offers = AuctionOffers.objects.filter(auction_id=obj.auction_id, buyer_id=buyer_user).order_by("-amount")
+        auction_offers = [offer for offer in auction_related(obj, "offers", AuctionOffers.objects.all()) if offer.buyer_id_id == buyer_id]
 
-        if auction_offers.exists():
-            return AuctionOfferSerializer(auction_offers.first()).data
+        if auction_offers:
+            return AuctionOfferSerializer(max(auction_offers, key=lambda offer: offer.amount or 0)).data
 
         return None
 
     def get_bids(self, obj):
         buyer_user = self.context["request"].user.dealer
+        buyer_id = buyer_user.id if buyer_user else None
 
-        auction_bids = AuctionBids.objects.filter(auction_id=obj.auction_id, buyer_id=buyer_user).order_by("-bid")
+        auction_bids = [bid for bid in auction_related(obj, "bids", AuctionBids.objects.all()) if bid.buyer_id_id == buyer_id]
 
-        if auction_bids.exists():
-            return AuctionBidsSerializer(auction_bids.first()).data
+        if auction_bids:
+            return AuctionBidsSerializer(max(auction_bids, key=lambda bid: bid.bid or 0)).data
 
         return None
 
@@ -657,10 +642,9 @@ class AuctionProxySerializer(serializers.ModelSerializer):
         if not auction:
             raise serializers.ValidationError({"error": "No live auction doesn't exists"})
 
-        latest_auction = auction.first()
-        latest_bid = latest_auction.last_bid_id
+        state = get_bid_engine().get_state(attrs["auction_id"])
 
-        if latest_bid and latest_bid.bid >= attrs["proxy_amount"]:
+        if state and state["high_bid"] >= attrs["proxy_amount"]:
             raise serializers.ValidationError({"error": "Proxy amount is less than the highest bid"})
 
         return attrs
@@ -753,24 +737,19 @@ class AuctionWonSerializer(serializers.ModelSerializer):
         )
 
     def get_inspection_reports(self, obj):
-        reports = VehicleInspectionReport.objects.filter(request_id=obj.request_id)
-
-        if reports.exists():
-            return list(reports.values())
-
-        return None
+        return report_summaries(obj.request_id.inspection_reports.all()) if obj.request_id else None
 
     def get_vehicle_delivery_location(self, obj):
         dealer = self.context["request"].user.dealer
         dealer_locations = DealerLocation.objects.filter(dealership=dealer)
 
-        return DealerLocationSerializer(dealer_locations).data
+        return DealerLocationSerializer(dealer_locations, many=True).data
 
     def get_title_delivery_location(self, obj):
         dealer = self.context["request"].user.dealer
         dealer_locations = DealerLocation.objects.filter(dealership=dealer)
 
-        return DealerLocationSerializer(dealer_locations).data
+        return DealerLocationSerializer(dealer_locations, many=True).data
 
     def get_transportation_job(self, obj):
         transportation_jobs = TransportationJob.objects.filter(auction_id=obj.auction_id, request_id__transportation_taken=1)
@@ -8,6 +8,7 @@ from auctions.api.v1.views import (
     AuctionsWonListAPIView,
     MarketplaceListAPIView,
     MarketplaceDetailAPIView,
+    MarketplaceFacetsAPIView,
     AuctionBuyingCurrentListAPIView,
     AuctionBuyingInNegotiationListAPIView,
     AuctionBuyingWonListAPIView,
@@ -27,6 +28,8 @@ from auctions.api.v1.views import (
     CreateAuctionProxyAPIView,
     StopAuctionLiveAPIView,
     CheckoutSessionCreateAPIView,
+    AuctionStreamTicketAPIView,
+    auction_event_stream,
 )
 
 
@@ -38,7 +41,10 @@ urlpatterns = [
     path("live/", AuctionsLiveListAPIView.as_view(), name="auctions_live_list"),
     path("won/", AuctionsWonListAPIView.as_view(), name="auctions_won_list"),
     path("marketplace/", MarketplaceListAPIView.as_view(), name="marketplace_auctions_list"),
+    path("marketplace/facets/", MarketplaceFacetsAPIView.as_view(), name="marketplace_facets"),
     path("marketplace/<int:pk>/", MarketplaceDetailAPIView.as_view(), name="marketplace_auction_detail"),
+    path("marketplace/<str:auction_id>/stream/", auction_event_stream, name="marketplace_auction_stream"),
+    path("marketplace/<str:auction_id>/stream/ticket/", AuctionStreamTicketAPIView.as_view(), name="marketplace_auction_stream_ticket"),
     path("current-buying/", AuctionBuyingCurrentListAPIView.as_view(), name="auction_buying_current_list"),
     path("buying-in-negotiation/", AuctionBuyingInNegotiationListAPIView.as_view(), name="auction_buying_in_negotiation_list"),
     path("buying-won/", AuctionBuyingWonListAPIView.as_view(), name="auction_buying_won_list"),
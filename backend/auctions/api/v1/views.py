@@ -1,10 +1,15 @@
 import os
+import json
+import asyncio
 import stripe
 import datetime
-from datetime import timedelta
 from datetime import datetime
 
-from django.db.models import Q
+from asgiref.sync import sync_to_async
+from django.core import signing
+from django.db import transaction
+from django.db.models import Prefetch, Q
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.conf import settings
@@ -13,33 +18,71 @@ from rest_framework import status
 from rest_framework.generics import ListAPIView, CreateAPIView, RetrieveUpdateDestroyAPIView, ListCreateAPIView, RetrieveAPIView, UpdateAPIView, RetrieveUpdateAPIView
 from rest_framework.settings import api_settings
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 # from djstripe.models import Customer
 from rest_framework.permissions import IsAuthenticated
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
 
+from auctions.engine import BidRejected, get_bid_engine
+from auctions.filters import AuctionConditionFilter
 from auctions.permissions import IsBuyerUserPermission
-from auctions.tasks import send_auction_bid_won_email, send_vehicle_sold_buyer_email, send_vehicle_sold_seller_email
+from auctions.search import LIVE, get_marketplace_index, mark_auctions_changed
+from auctions.streams import get_event_hub
+from auctions.tasks import send_vehicle_sold_buyer_email, send_vehicle_sold_seller_email
 from auctions.utils import handle_negotiation_bid
 from communications.choices import PriorityChoices
-from communications.models import Notification
+from communications.utils import notification_event, notify, send_notifications
 from inspections.permissions import IsSellerUserPermission
 from users.permissions import IsAdminUserPermission
 from auctions.api.v1.serializers import UpcomingAuctionsSerializer, AuctionsLiveSerializer, MarketplaceSerializer, \
     ActiveBuyingAuctionSerializer, AuctionCreateBidSerializer, AuctionOfferSerializer, AuctionSoldSerializer, \
     AuctionWonSerializer, BuyingCurrentBidsSerializer, AuctionNegotiationSerializer, AuctionNegotiationUpdateSerializer, \
     AuctionNegotiationOfferUpdateSerializer, AuctionBuyNowSerializer, AuctionProxySerializer, \
-    BuyerConfirmationSerializer, AuctionStopSerializer
+    BuyerConfirmationSerializer, AuctionStopSerializer, MarketplaceSearchSerializer
 from auctions.models import Auctions, AuctionBids, AuctionOffers, AuctionNegotiations, AuctionWon, AuctionProxies
-from inspections.models import InspectionRequest
-from inspections.api.v1.serializers import InspectionRequestSerializer
+from inspections.models import InspectionRequest, VehicleInspectionReport
+from inspections.utils import REPORT_SUMMARY_FIELDS
+from inspections.api.v1.serializers import InspectionRequestSerializer, INSPECTION_REQUEST_RELATED
+from users.api.v1.serializers import DEALERSHIP_RELATED, USER_DETAIL_RELATED
+from users.models import User
+from utils.prefetch import PrefetchPlanMixin, nested
+from utils.paginations import AdminCursorPagination
 from auctions.api.v1.serializers import CheckoutSessionCreateSerializer
 from django.conf import settings
 
 stripe.api_key = settings.STRIPE_LIVE_SECRET_KEY if settings.STRIPE_LIVE_MODE else settings.STRIPE_TEST_SECRET_KEY
 
-class UpcomingAuctionsListAPIView(ListAPIView):
+# Prefetch plans for list views, see utils.prefetch.PrefetchPlanMixin
+AUCTION_REQUEST_PREFETCH = (
+    Prefetch("request_id__inspection_reports", queryset=VehicleInspectionReport.objects.only(*REPORT_SUMMARY_FIELDS)),
+    *nested("request_id", INSPECTION_REQUEST_RELATED),
+)
+
+AUCTION_OFFERS_PREFETCH = AuctionOffers.objects.select_related("request_id").prefetch_related(
+    *nested("request_id", INSPECTION_REQUEST_RELATED),
+    *nested("dealer_id", DEALERSHIP_RELATED),
+    *nested("buyer_id", DEALERSHIP_RELATED),
+)
+
+
+def close_bidding(auction_id):
+    # Dropped only once the auction leaving live has committed, or the engine would reload it as still live
+    transaction.on_commit(lambda: get_bid_engine().close(auction_id))
+
+
+class UpcomingAuctionsListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
     serializer_class = UpcomingAuctionsSerializer
+    filterset_class = AuctionConditionFilter
     queryset = Auctions.objects.filter(request_id__auction_status=1)
+    select_related_fields = ("request_id",)
+    prefetch_related_fields = (
+        *AUCTION_REQUEST_PREFETCH,
+        *nested("dealer_id", DEALERSHIP_RELATED),
+        *nested("created_by", USER_DETAIL_RELATED),
+        *nested("updated_by", USER_DETAIL_RELATED),
+    )
 
 
 class UpcomingAuctionRetrieveAPIView(RetrieveAPIView):
@@ -50,9 +93,11 @@ class UpcomingAuctionRetrieveAPIView(RetrieveAPIView):
         return get_object_or_404(Auctions, Q(id=self.kwargs.get("pk")), request_id__auction_status=1)
 
 
-class AuctionsRunListAPIView(ListAPIView):
+class AuctionsRunListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = InspectionRequestSerializer
+    prefetch_related_fields = INSPECTION_REQUEST_RELATED
 
     def get_queryset(self):
         return InspectionRequest.objects.filter(status=20).exclude(auctions__isnull=True).order_by('-id')
@@ -67,6 +112,8 @@ class AdminSendToAuctionAPIView(APIView):
         if not ids:
             return Response({"error": "No Inspection Request id's found"})
 
+        events = []
+
         for id in ids:
             try:
                 inspection = get_object_or_404(InspectionRequest, id=id)
@@ -74,99 +121,81 @@ class AdminSendToAuctionAPIView(APIView):
                 inspection.auction_date = timezone.now()
                 inspection.save()
 
-                dealer_user = inspection.dealer.users.first()
-
                 Auctions.objects.filter(request_id=inspection).update(status=1)
+                mark_auctions_changed(Auctions.objects.filter(request_id=inspection).values_list("id", flat=True))
 
-                Notification.objects.create(
+                events.append(notification_event(
                     title="Auction Live",
                     text=f"Your auction with auction id {inspection.auction_id} is live now",
                     priority=PriorityChoices.LOW,
-                    user=dealer_user
-                )
+                    dealerships=[inspection.dealer_id]
+                ))
 
             except InspectionRequest.DoesNotExist:
                 continue
 
+        send_notifications(events)
+
         return Response({'detail': 'Sent to auction successfully.'}, status=status.HTTP_200_OK)
 
 
-class AuctionsLiveListAPIView(ListAPIView):
+class AuctionsLiveListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = AuctionsLiveSerializer
     queryset = Auctions.objects.filter(status=1)
+    select_related_fields = ("request_id",)
+    prefetch_related_fields = AUCTION_REQUEST_PREFETCH
+    prefetch_by_auction_id = {"bids": AuctionBids.objects.all()}
 
 
-class AuctionsWonListAPIView(ListAPIView):
+class AuctionsWonListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = InspectionRequestSerializer
+    prefetch_related_fields = INSPECTION_REQUEST_RELATED
 
     def get_queryset(self):
         return InspectionRequest.objects.select_related('dealer').filter(status__gte=4, status__lt=20).exclude(auction_id__isnull=True)
 
 
-class MarketplaceListAPIView(ListAPIView):
+class MarketplaceListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
     serializer_class = MarketplaceSerializer
+    filterset_class = AuctionConditionFilter
+    select_related_fields = ("request_id", "last_bid_id", "last_proxy_id")
+    prefetch_related_fields = nested("request_id", INSPECTION_REQUEST_RELATED)
 
     def get_queryset(self):
         user = self.request.user
-        current_time = timezone.now()
-
-        auctions = Auctions.objects.select_related('request_id').exclude(dealer_id=user.dealer_id).filter(status=1)
 
-        valid_auctions = []
+        # Expired auctions are closed by the close_auctions worker; hide them until it does
+        return Auctions.objects.select_related('request_id').exclude(dealer_id=user.dealer_id).filter(status=1) \
+            .filter(Q(closes_at__isnull=True) | Q(closes_at__gt=timezone.now()))
 
-        # Iterate over each auction
-        for auction in auctions:
-            # Get all AuctionBids for this auction, ordered by created_at
-            auction_bids = AuctionBids.objects.filter(auction_id=auction.auction_id).order_by('created_at')
-
-            if auction_bids.exists():
-                # Get the first bid's created_at timestamp
-                first_bid_time = auction_bids.first().created_at
-
-                # Check if the time difference between the first bid and the current UTC time is less than or equal to 10 minutes
-                if current_time - first_bid_time <= timedelta(minutes=10):
-                    valid_auctions.append(auction)
-                else:
-                    auction.status = 0
-                    auction.save()
-
-                    buyer_user = auction.last_bid_id.buyer_id.users.first()
-                    seller_user = auction.dealer_id.users.first()
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        serializer = MarketplaceSearchSerializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        filters = serializer.validated_data
 
-                    AuctionNegotiations.objects.create(
-                        auction_id = auction.auction_id,
-                        request_id = auction.request_id,
-                        dealer_id = auction.dealer_id,
-                        buyer_id = auction.last_bid_id.buyer_id,
-                        bid_id = auction.last_bid_id,
-                        amount = auction.last_bid_id.bid,
-                        changed_amount = auction.last_bid_id.bid,
-                        price_change_requested_by_buyer = True
-                    )
+        if set(filters) - {"stages"}:
+            ids, facets = get_marketplace_index().search(filters, stages=(LIVE,), exclude_dealer=self.request.user.dealer_id)
+            queryset = queryset.filter(id__in=ids)
 
-                    Notification.objects.create(
-                        title="Auction Bid Won",
-                        text=f"Congratulations! You have won the bid with the highest bid of {auction.last_bid_id.bid} for auction {auction.auction_id}",
-                        priority=PriorityChoices.MEDIUM,
-                        user=buyer_user
-                    )
+        return queryset
 
-                    Notification.objects.create(
-                        title="Auction Bid Won",
-                        text=f"A buyer named as {buyer_user.full_name} won the auction that have auction {auction.auction_id}",
-                        priority=PriorityChoices.MEDIUM,
-                        user=seller_user
-                    )
 
-                    send_auction_bid_won_email(auction.last_bid_id.buyer_user_id, auction.auction_id)
-            else:
-                valid_auctions.append(auction)
+class MarketplaceFacetsAPIView(APIView):
+    permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
 
-        return valid_auctions
+    def get(self, request):
+        serializer = MarketplaceSearchSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        filters = serializer.validated_data
+        ids, facets = get_marketplace_index().search(filters, stages=filters["stages"], exclude_dealer=request.user.dealer_id)
 
+        return Response({"count": len(ids), "facets": facets})
 
 
 class MarketplaceDetailAPIView(RetrieveAPIView):
@@ -180,9 +209,11 @@ class MarketplaceDetailAPIView(RetrieveAPIView):
         return get_object_or_404(queryset, pk=self.kwargs.get("pk"))
 
 
-class AuctionBuyingCurrentListAPIView(ListAPIView):
+class AuctionBuyingCurrentListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
     serializer_class = BuyingCurrentBidsSerializer
+    select_related_fields = ("request_id", "last_bid_id")
+    prefetch_related_fields = AUCTION_REQUEST_PREFETCH
 
     def get_queryset(self):
         user = self.request.user
@@ -191,9 +222,16 @@ class AuctionBuyingCurrentListAPIView(ListAPIView):
 
 
 # Use Auction negotiation model here
-class AuctionBuyingInNegotiationListAPIView(ListAPIView):
+class AuctionBuyingInNegotiationListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
     serializer_class = AuctionNegotiationSerializer
+    select_related_fields = ("request_id", "bid_id")
+    prefetch_related_fields = (
+        *AUCTION_REQUEST_PREFETCH,
+        *nested("buyer_id", DEALERSHIP_RELATED),
+        *nested("dealer_id", DEALERSHIP_RELATED),
+    )
+    prefetch_by_auction_id = {"offers": AUCTION_OFFERS_PREFETCH}
 
     def get_queryset(self):
         user = self.request.user
@@ -201,9 +239,11 @@ class AuctionBuyingInNegotiationListAPIView(ListAPIView):
         return AuctionNegotiations.objects.select_related('request_id').exclude(dealer_id=user.dealer_id).filter(request_id__status=21, buyer_id=user.dealer)
 
 
-class AuctionBuyingWonListAPIView(ListAPIView):
+class AuctionBuyingWonListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
     serializer_class = BuyingCurrentBidsSerializer
+    select_related_fields = ("request_id", "last_bid_id")
+    prefetch_related_fields = AUCTION_REQUEST_PREFETCH
 
     def get_queryset(self):
         user = self.request.user
@@ -211,9 +251,12 @@ class AuctionBuyingWonListAPIView(ListAPIView):
         return Auctions.objects.select_related('request_id').exclude(dealer_id=user.dealer_id).filter(status=0, last_bid_id__buyer_user_id=user)
 
 
-class AuctionSellingCurrentListAPIView(ListAPIView):
+class AuctionSellingCurrentListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsSellerUserPermission]
     serializer_class = ActiveBuyingAuctionSerializer
+    select_related_fields = ("request_id", "last_bid_id")
+    prefetch_related_fields = AUCTION_REQUEST_PREFETCH
+    prefetch_by_auction_id = {"offers": AUCTION_OFFERS_PREFETCH}
 
     def get_queryset(self):
         user = self.request.user
@@ -222,9 +265,16 @@ class AuctionSellingCurrentListAPIView(ListAPIView):
 
 
 # Use Auction negotiation model here
-class AuctionSellingInNegotiationListAPIView(ListAPIView):
+class AuctionSellingInNegotiationListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsSellerUserPermission]
     serializer_class = AuctionNegotiationSerializer
+    select_related_fields = ("request_id", "bid_id")
+    prefetch_related_fields = (
+        *AUCTION_REQUEST_PREFETCH,
+        *nested("buyer_id", DEALERSHIP_RELATED),
+        *nested("dealer_id", DEALERSHIP_RELATED),
+    )
+    prefetch_by_auction_id = {"offers": AUCTION_OFFERS_PREFETCH}
 
     def get_queryset(self):
         user = self.request.user
@@ -250,6 +300,9 @@ class SellerNegotiationUpdateAPIView(UpdateAPIView):
         instance = serializer.save()
         handle_negotiation_bid(instance)
 
+        if instance.is_accepted == 1:
+            close_bidding(instance.auction_id)
+
 
 class BuyerNegotiationUpdateAPIView(UpdateAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
@@ -267,15 +320,21 @@ class BuyerNegotiationUpdateAPIView(UpdateAPIView):
         instance = serializer.save()
         handle_negotiation_bid(instance)
 
+        if instance.is_accepted == 1:
+            close_bidding(instance.auction_id)
+
 
 # class BuyerNegotiationOfferUpdateAPIView(UpdateAPIView):
 #     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
 #     serializer_class = AuctionNegotiationOfferUpdateSerializer
 
 
-class AuctionSellingSoldListAPIView(ListAPIView):
+class AuctionSellingSoldListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsSellerUserPermission]
     serializer_class = ActiveBuyingAuctionSerializer
+    select_related_fields = ("request_id", "last_bid_id")
+    prefetch_related_fields = AUCTION_REQUEST_PREFETCH
+    prefetch_by_auction_id = {"offers": AUCTION_OFFERS_PREFETCH}
 
     def get_queryset(self):
         user = self.request.user
@@ -288,63 +347,14 @@ class CreateAuctionBidCreateAPIView(CreateAPIView):
     serializer_class = AuctionCreateBidSerializer
     queryset = AuctionBids.objects.all()
 
-    def perform_create(self, serializer):
-        instance = serializer.save()
-        buyer_user = instance.buyer_id.users.first()
-        seller_user = instance.request_id.dealer.users.first()
-
-        Notification.objects.create(
-            title="You are the Highest Bidder",
-            text=f"You are the highest bidder for auction {instance.auction_id}",
-            priority=PriorityChoices.MEDIUM,
-            user=buyer_user
-        )
-
-        Notification.objects.create(
-            title="New Bid from buyer",
-            text=f"A buyer has posted a bid of ${instance.bid} for auction {instance.auction_id}",
-            priority=PriorityChoices.MEDIUM,
-            user=seller_user
-        )
 
-        auction = get_object_or_404(Auctions, auction_id=instance.auction_id)
-        auction_proxy = AuctionProxies.objects.filter(auction_id=instance.auction_id)
-
-        if auction_proxy.exists():
-            highest_proxy = auction_proxy.order_by("-proxy_amount").first()
-
-            if instance.bid < highest_proxy.proxy_amount and instance.bid + 100 < highest_proxy.proxy_amount and instance.buyer_id != highest_proxy.buyer_id:
-                new_auction_bid = AuctionBids.objects.create(
-                    auction_id=instance.auction_id,
-                    request_id=instance.request_id,
-                    buyer_id=highest_proxy.buyer_id,
-                    buyer_user_id=highest_proxy.created_by,
-                    bid=instance.bid + 100,
-                    status=0
-                )
-
-                Notification.objects.create(
-                    title="You bid has been crossed",
-                    text=f"A buyer has posted a bid of ${instance.bid + 100} higher than your bid ${instance.bid} for auction {instance.auction_id}",
-                    priority=PriorityChoices.MEDIUM,
-                    user=buyer_user
-                )
-
-                Notification.objects.create(
-                    title="New Bid from buyer",
-                    text=f"A buyer has posted a bid of ${instance.bid + 100} for auction {instance.auction_id}",
-                    priority=PriorityChoices.MEDIUM,
-                    user=seller_user
-                )
-
-                auction.last_bid_id = new_auction_bid
-                auction.save()
-
-
-class OfferNowListAPIView(ListAPIView):
+class OfferNowListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
     serializer_class = ActiveBuyingAuctionSerializer
     queryset = Auctions.objects.prefetch_related("request_id").filter(status=0, request_id__status=21)
+    select_related_fields = ("request_id", "last_bid_id")
+    prefetch_related_fields = AUCTION_REQUEST_PREFETCH
+    prefetch_by_auction_id = {"offers": AUCTION_OFFERS_PREFETCH}
 
 
 class CreateAuctionOfferAPIView(CreateAPIView):
@@ -353,9 +363,12 @@ class CreateAuctionOfferAPIView(CreateAPIView):
     queryset = AuctionOffers.objects.all()
 
 
-class SoldListAPIView(ListAPIView):
+class SoldListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
     serializer_class = AuctionSoldSerializer
+    select_related_fields = ("request_id", "won_bid_id")
+    prefetch_related_fields = AUCTION_REQUEST_PREFETCH
+    prefetch_by_auction_id = {"offers": AUCTION_OFFERS_PREFETCH, "bids": AuctionBids.objects.all()}
 
     def get_queryset(self):
         user = self.request.user
@@ -397,6 +410,7 @@ class AcceptNegotiationBidAPIView(APIView):
         AuctionOffers.objects.filter(id=bid_id, auction_id=auction_id).update(is_accepted=True)
         AuctionOffers.objects.filter(auction_id=auction_id).exclude(id=bid_id).update(is_expire=True)
         AuctionOffers.objects.filter(auction_id=auction_id).update(is_expire=True)
+        close_bidding(auction_id)
 
         return Response({"response": "Auction Bid accepted"}, status=status.HTTP_200_OK)
 
@@ -411,9 +425,6 @@ class AcceptNegotiationOfferAPIView(APIView):
         offer = get_object_or_404(AuctionOffers, id=offer_id, auction_id=auction_id)
         inspection = get_object_or_404(InspectionRequest, auction_id=auction_id)
 
-        buyer_user = offer.buyer_id.users.first()
-        seller_user = offer.dealer_id.users.first()
-
         auction_won_data = {
             "auction_id": auction_id,
             "request_id": inspection,
@@ -437,12 +448,13 @@ class AcceptNegotiationOfferAPIView(APIView):
         AuctionBids.objects.filter(auction_id=auction_id).update(is_expired=True)
         AuctionProxies.objects.filter(auction_id=auction_id).update(is_expire=True)
         # AuctionNegotiations.objects.filter(auction_id=auction_id).update(is_expire=True)
+        close_bidding(auction_id)
 
-        Notification.objects.create(
+        notify(
             title="Auction Offer Won",
             text=f"Congratulations! You have won the auction with an offer of ${offer.amount} for auction id {auction_id}",
             priority=PriorityChoices.HIGH,
-            user=buyer_user
+            dealerships=[offer.buyer_id_id]
         )
 
         return Response({"response": "Offer Accepted"}, status=status.HTTP_200_OK)
@@ -467,7 +479,6 @@ class BuyerConfirmationAPIView(APIView):
         title_delivery_location = serializer.validated_data.get("title_delivery_location")
         vehicle_delivery_location = serializer.validated_data.get("vehicle_delivery_location")
         buyer_id = request.user.dealer
-        buyer_user = buyer_id.users.first()
 
         request_id.buyer_id = buyer_id
         request_id.buyer_confirmed = True
@@ -485,11 +496,11 @@ class BuyerConfirmationAPIView(APIView):
 
         seller_user = request_id.dealer.users.first()
 
-        Notification.objects.create(
+        notify(
             title="Auction Buyer Confirmed",
-            text=f"Buyer {buyer_user.full_name} has been confirmed for auction id {auction_id}",
+            text=f"Buyer {request.user.full_name} has been confirmed for auction id {auction_id}",
             priority=PriorityChoices.HIGH,
-            user=seller_user
+            dealerships=[request_id.dealer_id]
         )
 
         send_vehicle_sold_buyer_email(request.user, auction_id)
@@ -519,8 +530,6 @@ class BuyNowAPIView(CreateAPIView):
         inspection_request.status = 5
         inspection_request.save()
 
-        seller_user = inspection_request.dealer.users.first()
-
         auction = Auctions.objects.get(auction_id=instance.auction_id)
         auction.won_at = datetime.now()
         auction.won_by_id = buyer
@@ -528,6 +537,8 @@ class BuyNowAPIView(CreateAPIView):
         auction.won_type = 3
         auction.status = 0
         auction.save()
+        mark_auctions_changed([auction.id])
+        close_bidding(auction.auction_id)
 
         instance.buyer_id = buyer
         instance.bid_price = inspection_request.reserve_price
@@ -539,11 +550,11 @@ class BuyNowAPIView(CreateAPIView):
         AuctionProxies.objects.filter(auction_id=instance.auction_id).update(is_expire=True)
         AuctionNegotiations.objects.filter(auction_id=instance.auction_id).update(is_expire=True)
 
-        Notification.objects.create(
+        notify(
             title="Auction Vehicle Sold",
             text=f"Buyer {self.request.user.full_name} has purchased the vehicle for ${inspection_request.reserve_price} that have auction id {auction.auction_id}",
             priority=PriorityChoices.HIGH,
-            user=seller_user
+            dealerships=[inspection_request.dealer_id]
         )
 
 
@@ -553,34 +564,23 @@ class CreateAuctionProxyAPIView(CreateAPIView):
     queryset = AuctionProxies.objects.all()
 
     def perform_create(self, serializer):
-        instance = serializer.save()
-        instance.created_by = self.request.user
-        instance.save()
-        buyer = self.request.user.dealer
-
-        auction = Auctions.objects.get(auction_id=instance.auction_id)
+        # The row commits expired and only goes live once the engine holds the proxy, so the engine
+        # never bids for a row that isn't there and a rejected or failed registration leaves it expired
+        instance = serializer.save(created_by=self.request.user, is_expire=1)
 
-        latest_bid = auction.last_bid_id
+        try:
+            get_bid_engine().register_proxy(instance.auction_id, instance.id, instance.proxy_amount, instance.buyer_id_id, self.request.user.id)
+        except BidRejected as e:
+            raise ValidationError({"error": str(e)})
 
-        if latest_bid:
-            bid_price = latest_bid.bid + 100
-        else:
-            bid_price = 100
+        instance.is_expire = None
+        instance.save(update_fields=["is_expire"])
 
-        new_auction_bid = AuctionBids.objects.create(
-            auction_id=instance.auction_id,
-            request_id=instance.request_id,
-            buyer_id=buyer,
-            buyer_user_id=self.request.user,
-            bid=bid_price,
-            status=0
+        Auctions.objects.filter(auction_id=instance.auction_id).update(
+            last_proxy_id=instance,
+            last_proxy_buyer_id=instance.buyer_id
         )
 
-        auction.last_proxy_id = instance
-        auction.last_bid_id = new_auction_bid
-        auction.last_proxy_buyer_id = instance.buyer_id
-        auction.save()
-
 
 class StopAuctionLiveAPIView(RetrieveUpdateAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
@@ -589,6 +589,13 @@ class StopAuctionLiveAPIView(RetrieveUpdateAPIView):
     lookup_field = "auction_id"
     lookup_url_kwarg = "auction_id"
 
+    def perform_update(self, serializer):
+        instance = serializer.save()
+        mark_auctions_changed([instance.id])
+
+        if instance.status != 1:
+            close_bidding(instance.auction_id)
+
 
 class CheckoutSessionCreateAPIView(APIView):
     permission_classes = [IsAuthenticated]
@@ -629,3 +636,118 @@ class CheckoutSessionCreateAPIView(APIView):
         )
 
         return Response({"session_id": session.id}, status=status.HTTP_200_OK)
+
+
+STREAM_KEEPALIVE_SECONDS = 15
+STREAM_TICKET_MAX_AGE = 60
+STREAM_TICKET_SALT = "auctions.stream-ticket"
+
+
+class AuctionStreamTicketAPIView(APIView):
+    """
+    EventSource cannot send headers, so a browser opens the stream of an
+    auction with a ticket from here instead of its access token. The ticket
+    is only good for that auction's stream and within ``STREAM_TICKET_MAX_AGE``.
+    """
+    permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
+
+    def post(self, request, auction_id):
+        ticket = signing.dumps({"user_id": request.user.id, "auction_id": auction_id}, salt=STREAM_TICKET_SALT)
+
+        return Response({"ticket": ticket, "expires_in": STREAM_TICKET_MAX_AGE}, status=status.HTTP_201_CREATED)
+
+
+def _stream_ticket_user(ticket, auction_id):
+    try:
+        data = signing.loads(ticket, salt=STREAM_TICKET_SALT, max_age=STREAM_TICKET_MAX_AGE)
+    except signing.BadSignature:
+        return None
+
+    if data.get("auction_id") != auction_id:
+        return None
+
+    return User.objects.select_related("role").filter(id=data.get("user_id"), is_active=True).first()
+
+
+def _authenticate_stream(request, auction_id):
+    authenticator = JWTAuthentication()
+    header = authenticator.get_header(request)
+
+    if header:
+        try:
+            request.user = authenticator.get_user(authenticator.get_validated_token(authenticator.get_raw_token(header)))
+        except (InvalidToken, AuthenticationFailed):
+            return False
+    else:
+        request.user = _stream_ticket_user(request.GET.get("ticket", ""), auction_id)
+
+        if request.user is None:
+            return False
+
+    return IsBuyerUserPermission().has_permission(request, None)
+
+
+async def auction_event_stream(request, auction_id):
+    """
+    Server-sent events with the bid, price and close deltas of a live auction.
+    Opened with an ``Authorization`` header or a ``?ticket=`` from
+    ``AuctionStreamTicketAPIView``.
+    """
+    if not await sync_to_async(_authenticate_stream)(request, auction_id):
+        return JsonResponse({"error": "Authentication credentials were not provided or are invalid"}, status=401)
+
+    # Subscribed before the snapshot is read, so no bid falls between the two
+    hub = get_event_hub()
+    queue = hub.subscribe(auction_id)
+
+    try:
+        await asyncio.wait_for(hub.ready.wait(), timeout=STREAM_KEEPALIVE_SECONDS)
+    except asyncio.TimeoutError:
+        hub.unsubscribe(auction_id, queue)
+        return JsonResponse({"error": "Live updates are unavailable, try again shortly"}, status=503)
+
+    try:
+        state = await sync_to_async(get_bid_engine().get_state)(auction_id)
+    except BaseException:
+        hub.unsubscribe(auction_id, queue)
+        raise
+
+    if state is None:
+        hub.unsubscribe(auction_id, queue)
+        return JsonResponse({"error": "No live auction exists"}, status=404)
+
+    snapshot = {
+        "type": "snapshot",
+        "auction_id": auction_id,
+        "bid": state["high_bid"],
+        "bid_count": state["bid_count"],
+        "closes_at": state["closes_at"],
+    }
+
+    async def events():
+        try:
+            yield f"data: {json.dumps(snapshot)}\n\n"
+
+            while True:
+                try:
+                    event_type, data = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                # Bids queued while the snapshot was read are already counted in it
+                if event_type == "bid" and json.loads(data)["bid_count"] <= snapshot["bid_count"]:
+                    continue
+
+                yield f"data: {data}\n\n"
+
+                if event_type == "close":
+                    break
+        finally:
+            hub.unsubscribe(auction_id, queue)
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+
+    return response
@@ -0,0 +1,380 @@
+import json
+import time
+
+from django_redis import get_redis_connection
+
+from auctions.models import Auctions, AuctionProxies
+from auctions.utils import AUCTION_DURATION
+
+KEY_PREFIX = "auctions:bid-engine"
+PENDING_BIDS_KEY = f"{KEY_PREFIX}:pending"
+WRITER_LOCK_KEY = f"{KEY_PREFIX}:writer-lock"
+EVENTS_CHANNEL = f"{KEY_PREFIX}:events"
+PROXY_INCREMENT = 100
+# Bids kept per auction for the stream's snapshot, AuctionBids holds the full record
+HISTORY_LIMIT = 1000
+# Seconds the writer lock lives without being extended, renewed before every batch
+WRITER_LOCK_TIMEOUT = 60
+# Seconds a drain waits for the writer lock
+WRITER_LOCK_WAIT = 30
+
+# Result codes returned by the Lua scripts
+ACCEPTED = 0
+NOT_LOADED = -1
+BID_TOO_LOW = 1
+ALREADY_HIGHEST = 2
+CLOSED = 3
+
+SEED_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(cjson.decode(ARGV[1])))
+local proxies = cjson.decode(ARGV[2])
+for buyer, proxy in pairs(proxies) do
+    redis.call('HSET', KEYS[2], buyer, cjson.encode(proxy))
+end
+return 1
+"""
+
+# Shared by the scripts below. Resolves every standing proxy of the auction in
+# one pass as a second-price ladder: the strongest proxy (earliest wins a tie)
+# leads at one increment over the runner-up, or over the current high bid when
+# no other proxy can compete. At most two rows are emitted, the runner-up at
+# its maximum and the leader at its resulting price.
+RESOLVE_PROXIES = f"local EVENTS_CHANNEL = '{EVENTS_CHANNEL}'\n" + """
+-- Every script passes the history cap as its last argument
+local HISTORY_LIMIT = tonumber(ARGV[#ARGV])
+
+local function is_closed(now)
+    local closes_at = tonumber(redis.call('HGET', KEYS[1], 'closes_at'))
+    return closes_at ~= nil and now >= closes_at
+end
+
+local function accept(entry)
+    local payload = cjson.encode(entry)
+    -- The first accepted bid starts the auction clock
+    local duration = tonumber(redis.call('HGET', KEYS[1], 'duration'))
+    if duration ~= nil and not tonumber(redis.call('HGET', KEYS[1], 'closes_at')) then
+        redis.call('HSET', KEYS[1], 'closes_at', entry['created_at'] + duration)
+    end
+    redis.call('HSET', KEYS[1], 'high_bid', entry['bid'], 'high_user', entry['buyer_user_id'], 'high_buyer', entry['buyer_id'])
+    local bid_count = redis.call('HINCRBY', KEYS[1], 'bid_count', 1)
+    redis.call('RPUSH', KEYS[3], payload)
+    redis.call('LTRIM', KEYS[3], -HISTORY_LIMIT, -1)
+    redis.call('RPUSH', KEYS[4], payload)
+    redis.call('PUBLISH', EVENTS_CHANNEL, cjson.encode({
+        type = 'bid',
+        auction_id = entry['auction_id'],
+        bid = entry['bid'],
+        bid_count = bid_count,
+        proxy = entry['proxy'],
+        closes_at = tonumber(redis.call('HGET', KEYS[1], 'closes_at')),
+        created_at = entry['created_at'],
+    }))
+end
+
+local function beats(a, b)
+    return b == nil or a['amount'] > b['amount'] or (a['amount'] == b['amount'] and a['seq'] < b['seq'])
+end
+
+local function resolve_proxies(template, increment)
+    local high = tonumber(redis.call('HGET', KEYS[1], 'high_bid'))
+    local high_buyer = redis.call('HGET', KEYS[1], 'high_buyer')
+    local first, second = nil, nil
+
+    local proxies = redis.call('HGETALL', KEYS[2])
+    for i = 1, #proxies, 2 do
+        local proxy = cjson.decode(proxies[i + 1])
+        if proxy['amount'] > high or (proxy['amount'] == high and tostring(proxy['buyer_id']) == high_buyer) then
+            if beats(proxy, first) then
+                first, second = proxy, first
+            elseif beats(proxy, second) then
+                second = proxy
+            end
+        end
+    end
+
+    local emitted = {}
+
+    local function emit(proxy, amount)
+        local entry = {}
+        for k, v in pairs(template) do entry[k] = v end
+        entry['bid'] = amount
+        entry['buyer_id'] = proxy['buyer_id']
+        entry['buyer_user_id'] = proxy['buyer_user_id']
+        entry['outbid_user_id'] = tonumber(redis.call('HGET', KEYS[1], 'high_user'))
+        entry['proxy'] = 1
+        accept(entry)
+        table.insert(emitted, amount)
+    end
+
+    if first == nil then
+        return emitted
+    end
+
+    if second ~= nil and second['amount'] > high then
+        emit(second, second['amount'])
+        emit(first, math.min(first['amount'], second['amount'] + increment))
+    elseif tostring(first['buyer_id']) ~= high_buyer and first['amount'] > high then
+        emit(first, math.min(first['amount'], high + increment))
+    end
+
+    return emitted
+end
+"""
+
+# KEYS: state, proxies, history, pending
+# ARGV: payload, increment, history limit
+PLACE_BID_SCRIPT = RESOLVE_PROXIES + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {-1}
+end
+
+local bid = cjson.decode(ARGV[1])
+local high = tonumber(redis.call('HGET', KEYS[1], 'high_bid'))
+local high_user = redis.call('HGET', KEYS[1], 'high_user')
+
+if is_closed(bid['created_at']) then
+    return {3}
+end
+
+if bid['bid'] <= high then
+    return {1}
+end
+
+if high_user == tostring(bid['buyer_user_id']) then
+    return {2}
+end
+
+bid['outbid_user_id'] = tonumber(high_user)
+accept(bid)
+
+local result = {0}
+for _, amount in ipairs(resolve_proxies(bid, tonumber(ARGV[2]))) do
+    table.insert(result, amount)
+end
+
+return result
+"""
+
+# KEYS: state, proxies, history, pending
+# ARGV: proxy, bid template, increment, history limit
+REGISTER_PROXY_SCRIPT = RESOLVE_PROXIES + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {-1}
+end
+
+local proxy = cjson.decode(ARGV[1])
+local template = cjson.decode(ARGV[2])
+local high = tonumber(redis.call('HGET', KEYS[1], 'high_bid'))
+
+if is_closed(template['created_at']) then
+    return {3}
+end
+
+if proxy['amount'] <= high then
+    return {1}
+end
+
+-- A buyer raising their maximum keeps their place in the queue for ties
+local existing = redis.call('HGET', KEYS[2], tostring(proxy['buyer_id']))
+if existing then
+    proxy['seq'] = cjson.decode(existing)['seq']
+end
+
+redis.call('HSET', KEYS[2], tostring(proxy['buyer_id']), cjson.encode(proxy))
+
+local result = {0}
+for _, amount in ipairs(resolve_proxies(template, tonumber(ARGV[3]))) do
+    table.insert(result, amount)
+end
+
+return result
+"""
+
+
+class BidRejected(Exception):
+    pass
+
+
+class BidEngine:
+    """
+    Keeps the high bid, proxy ladder and bid history of live auctions in Redis.
+
+    Bids are accepted or rejected by a single Lua script call and queued for
+    the ``process_bid_queue`` worker, which writes them to ``AuctionBids``.
+    """
+
+    def __init__(self, connection=None, pending_key=PENDING_BIDS_KEY, history_limit=HISTORY_LIMIT):
+        self.redis = connection or get_redis_connection("default")
+        self.pending_key = pending_key
+        self.history_limit = history_limit
+        self._seed = self.redis.register_script(SEED_SCRIPT)
+        self._place_bid = self.redis.register_script(PLACE_BID_SCRIPT)
+        self._register_proxy = self.redis.register_script(REGISTER_PROXY_SCRIPT)
+
+    def _keys(self, auction_id):
+        base = f"{KEY_PREFIX}:{auction_id}"
+        return [f"{base}:state", f"{base}:proxies", f"{base}:history", self.pending_key]
+
+    def load(self, auction_id):
+        auction = Auctions.objects.filter(auction_id=auction_id, status=1).values(
+            "id", "request_id", "dealer_id", "closes_at", "bid_count", "current_price",
+            "last_bid_id__buyer_id", "last_bid_id__buyer_user_id"
+        ).first()
+
+        if not auction:
+            return None
+
+        state = {
+            "auction_pk": auction["id"],
+            "request_id": auction["request_id"] or "",
+            "seller_id": auction["dealer_id"] or "",
+            "high_bid": auction["current_price"] or 0,
+            "high_user": auction["last_bid_id__buyer_user_id"] or "",
+            "high_buyer": auction["last_bid_id__buyer_id"] or "",
+            "bid_count": auction["bid_count"],
+            "closes_at": auction["closes_at"].timestamp() if auction["closes_at"] else "",
+            "duration": AUCTION_DURATION.total_seconds(),
+        }
+
+        proxies = {}
+        active_proxies = AuctionProxies.objects.filter(auction_id=auction_id).exclude(is_expire=1).order_by("id")
+
+        for proxy in active_proxies.values("id", "buyer_id", "created_by_id", "proxy_amount"):
+            proxies[str(proxy["buyer_id"])] = {
+                "seq": proxy["id"],
+                "buyer_id": proxy["buyer_id"],
+                "buyer_user_id": proxy["created_by_id"] or 0,
+                "amount": proxy["proxy_amount"] or 0,
+            }
+
+        self.seed(auction_id, state, proxies)
+
+        return self.get_state(auction_id)
+
+    def seed(self, auction_id, state, proxies=None):
+        flat_state = [item for pair in state.items() for item in pair]
+        self._seed(keys=self._keys(auction_id)[:2], args=[json.dumps(flat_state), json.dumps(proxies or {})])
+
+    def get_state(self, auction_id, load=True):
+        state = self.redis.hgetall(self._keys(auction_id)[0])
+
+        if not state:
+            return self.load(auction_id) if load else None
+
+        state = {key.decode(): value.decode() for key, value in state.items()}
+        state["high_bid"] = int(state["high_bid"])
+        state["bid_count"] = int(state["bid_count"])
+        state["closes_at"] = float(state["closes_at"]) if state.get("closes_at") else None
+
+        return state
+
+    def get_history(self, auction_id, limit=None):
+        end = -1 if limit is None else limit - 1
+        return [json.loads(entry) for entry in self.redis.lrange(self._keys(auction_id)[2], 0, end)]
+
+    def _build_payload(self, auction_id, state, bid, buyer_id, buyer_user_id, proxy=0):
+        return {
+            "auction_id": auction_id,
+            "auction_pk": int(state["auction_pk"]),
+            "request_id": int(state["request_id"]) if state["request_id"] else None,
+            "seller_id": int(state["seller_id"]) if state["seller_id"] else None,
+            "buyer_id": buyer_id,
+            "buyer_user_id": buyer_user_id,
+            "bid": bid,
+            "proxy": proxy,
+            "created_at": time.time(),
+        }
+
+    def place_bid(self, auction_id, bid, buyer_id, buyer_user_id):
+        state = self.get_state(auction_id)
+
+        if state is None:
+            raise BidRejected("No Auction exists")
+
+        payload = self._build_payload(auction_id, state, bid, buyer_id, buyer_user_id)
+        result = self._place_bid(keys=self._keys(auction_id), args=[json.dumps(payload), PROXY_INCREMENT, self.history_limit])
+
+        if result[0] == NOT_LOADED:
+            # State was dropped between the read and the script call
+            self.load(auction_id)
+            return self.place_bid(auction_id, bid, buyer_id, buyer_user_id)
+
+        if result[0] == BID_TOO_LOW:
+            raise BidRejected("Enter bid amount greater than highest auction")
+
+        if result[0] == ALREADY_HIGHEST:
+            raise BidRejected("Buyer already have highest bid")
+
+        if result[0] == CLOSED:
+            raise BidRejected("Auction is closed")
+
+        return payload, list(result[1:])
+
+    def register_proxy(self, auction_id, proxy_id, amount, buyer_id, buyer_user_id):
+        state = self.get_state(auction_id)
+
+        if state is None:
+            raise BidRejected("No Auction exists")
+
+        proxy = {"seq": proxy_id, "buyer_id": buyer_id, "buyer_user_id": buyer_user_id, "amount": amount}
+        payload = self._build_payload(auction_id, state, 0, buyer_id, buyer_user_id, proxy=1)
+        result = self._register_proxy(keys=self._keys(auction_id), args=[json.dumps(proxy), json.dumps(payload), PROXY_INCREMENT, self.history_limit])
+
+        if result[0] == NOT_LOADED:
+            self.load(auction_id)
+            return self.register_proxy(auction_id, proxy_id, amount, buyer_id, buyer_user_id)
+
+        if result[0] == BID_TOO_LOW:
+            raise BidRejected("Proxy amount is less than the highest bid")
+
+        if result[0] == CLOSED:
+            raise BidRejected("Auction is closed")
+
+        return list(result[1:])
+
+    def close(self, auction_id):
+        self.redis.delete(*self._keys(auction_id)[:3])
+        self.redis.publish(EVENTS_CHANNEL, json.dumps({"type": "close", "auction_id": auction_id, "created_at": time.time()}))
+
+    def pending_count(self):
+        return self.redis.llen(self.pending_key)
+
+    def drain(self, handler, batch_size=500):
+        """
+        Hands queued bids to ``handler`` in batches and removes them once it
+        returns. Guarded by a lock so the worker and the auction closer never
+        persist the same bids twice. Raises ``LockError`` when the lock isn't
+        free within ``WRITER_LOCK_WAIT`` seconds.
+        """
+        processed = 0
+
+        with self.redis.lock(WRITER_LOCK_KEY, timeout=WRITER_LOCK_TIMEOUT, blocking_timeout=WRITER_LOCK_WAIT) as lock:
+            while True:
+                entries = self.redis.lrange(self.pending_key, 0, batch_size - 1)
+
+                if not entries:
+                    break
+
+                # A full timeout for every batch, however long the drain runs
+                lock.extend(WRITER_LOCK_TIMEOUT, replace_ttl=True)
+
+                handler([json.loads(entry) for entry in entries])
+                self.redis.ltrim(self.pending_key, len(entries), -1)
+                processed += len(entries)
+
+        return processed
+
+
+_engine = None
+
+
+def get_bid_engine():
+    global _engine
+
+    if _engine is None:
+        _engine = BidEngine()
+
+    return _engine
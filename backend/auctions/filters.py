@@ -0,0 +1,14 @@
+import django_filters
+
+from auctions.models import Auctions
+
+
+class AuctionConditionFilter(django_filters.FilterSet):
+    """Filters auctions on the indexed condition columns of their inspection report."""
+    frame_damage = django_filters.BooleanFilter(field_name="request_id__inspection_reports__frame_damage")
+    max_warning_lights = django_filters.NumberFilter(field_name="request_id__inspection_reports__warning_light_count", lookup_expr="lte")
+    max_tire_issues = django_filters.NumberFilter(field_name="request_id__inspection_reports__tire_issue_count", lookup_expr="lte")
+
+    class Meta:
+        model = Auctions
+        fields = ()
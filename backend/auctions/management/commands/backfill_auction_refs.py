@@ -0,0 +1,32 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef, Subquery
+
+from auctions.models import AuctionReferenceMixin, Auctions
+
+
+class Command(BaseCommand):
+    help = "Links rows that only carry an auction_id string to their auction, for rows written by code older than the auction_ref keys"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        auction = Subquery(Auctions.objects.filter(auction_id=OuterRef("auction_id")).values("id")[:1])
+
+        for model in apps.get_models():
+            if not issubclass(model, AuctionReferenceMixin):
+                continue
+
+            pending = model.objects.filter(auction_ref=None).exclude(auction_id=None).order_by("id")
+            last_id = 0
+            checked = 0
+
+            while batch := list(pending.filter(id__gt=last_id).values_list("id", flat=True)[:batch_size]):
+                last_id = batch[-1]
+                model.objects.filter(id__in=batch).update(auction_ref=auction)
+                checked += len(batch)
+
+            unlinked = pending.count()
+            self.stdout.write(f"{model._meta.verbose_name_plural}: checked {checked}, linked {checked - unlinked}, {unlinked} match no auction")
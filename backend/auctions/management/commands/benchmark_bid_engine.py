@@ -0,0 +1,79 @@
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from auctions.engine import BidEngine, BidRejected, KEY_PREFIX
+
+
+class Command(BaseCommand):
+    help = "Replays concurrent bids against a single synthetic auction in the bid engine"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bids", type=int, default=10000)
+        parser.add_argument("--buyers", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=64)
+        parser.add_argument("--proxies", type=int, default=50, help="Standing proxies resolved on every bid")
+
+    def handle(self, *args, **options):
+        run_id = uuid.uuid4().hex[:8]
+        auction_id = f"benchmark-{run_id}"
+        engine = BidEngine(pending_key=f"{KEY_PREFIX}:benchmark-{run_id}:pending")
+
+        # Proxy maximums spread across the bid range so the ladder keeps firing
+        proxies = {}
+        for index in range(options["proxies"]):
+            buyer = options["buyers"] + index + 1
+            proxies[str(buyer)] = {
+                "seq": index,
+                "buyer_id": buyer,
+                "buyer_user_id": buyer,
+                "amount": (index + 1) * options["bids"] * 50 // max(options["proxies"], 1),
+            }
+
+        # Synthetic state so the run never touches real auctions or the live queue
+        engine.seed(auction_id, {
+            "auction_pk": 0,
+            "request_id": "",
+            "seller_id": "",
+            "high_bid": 0,
+            "high_user": "",
+            "high_buyer": "",
+            "bid_count": 0,
+        }, proxies)
+
+        def place(index):
+            buyer = index % options["buyers"] + 1
+            started = time.perf_counter()
+
+            try:
+                engine.place_bid(auction_id, (index + 1) * 50, buyer, buyer)
+                accepted = True
+            except BidRejected:
+                accepted = False
+
+            return accepted, time.perf_counter() - started
+
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            results = list(executor.map(place, range(options["bids"])))
+
+        elapsed = time.perf_counter() - started
+        latencies = sorted(latency * 1000 for _, latency in results)
+        accepted = sum(1 for ok, _ in results if ok)
+        state = engine.get_state(auction_id, load=False)
+
+        self.stdout.write(f"Bids: {len(results)} ({accepted} accepted, {len(results) - accepted} rejected)")
+        self.stdout.write(f"Throughput: {len(results) / elapsed:.0f} bids/s over {elapsed:.2f}s")
+        self.stdout.write(
+            f"Latency ms: p50={statistics.median(latencies):.2f} "
+            f"p95={latencies[int(len(latencies) * 0.95) - 1]:.2f} "
+            f"p99={latencies[int(len(latencies) * 0.99) - 1]:.2f}"
+        )
+        self.stdout.write(f"Final high bid: {state['high_bid']} after {state['bid_count']} accepted bids, {engine.pending_count()} queued")
+
+        engine.close(auction_id)
+        engine.redis.delete(engine.pending_key)
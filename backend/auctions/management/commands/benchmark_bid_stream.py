@@ -0,0 +1,70 @@
+import asyncio
+import json
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from redis import asyncio as aioredis
+
+from auctions.engine import EVENTS_CHANNEL
+from auctions.streams import AuctionEventHub
+
+
+class Command(BaseCommand):
+    help = "Measures fan-out latency of bid events from Redis to in-process stream subscribers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--subscribers", type=int, default=5000)
+        parser.add_argument("--events", type=int, default=200)
+        parser.add_argument("--rate", type=float, default=50, help="Events published per second")
+
+    def handle(self, *args, **options):
+        asyncio.run(self.run(options["subscribers"], options["events"], options["rate"]))
+
+    async def run(self, subscriber_count, event_count, rate):
+        auction_id = f"benchmark-{uuid.uuid4().hex[:8]}"
+        hub = AuctionEventHub(queue_size=event_count + 1)
+        queues = [hub.subscribe(auction_id) for _ in range(subscriber_count)]
+        latencies = []
+        received = 0
+
+        async def consume(queue):
+            nonlocal received
+
+            while True:
+                event_type, data = await queue.get()
+
+                if event_type == "close":
+                    return
+
+                latencies.append(time.time() - json.loads(data)["created_at"])
+                received += 1
+
+        consumers = [asyncio.ensure_future(consume(queue)) for queue in queues]
+        await hub.ready.wait()
+
+        client = aioredis.from_url(hub.url)
+        started = time.perf_counter()
+
+        for index in range(event_count):
+            event = {"type": "bid", "auction_id": auction_id, "bid": (index + 1) * 50, "created_at": time.time()}
+            await client.publish(EVENTS_CHANNEL, json.dumps(event))
+            await asyncio.sleep(1 / rate)
+
+        await client.publish(EVENTS_CHANNEL, json.dumps({"type": "close", "auction_id": auction_id, "created_at": time.time()}))
+        await asyncio.gather(*consumers)
+        elapsed = time.perf_counter() - started
+        await client.aclose()
+        hub._listener.cancel()
+
+        latencies = sorted(latency * 1000 for latency in latencies)
+
+        self.stdout.write(f"Subscribers: {subscriber_count}, events: {event_count}, deliveries: {received} in {elapsed:.2f}s")
+        self.stdout.write(f"Deliveries/s: {received / elapsed:.0f}")
+        self.stdout.write(
+            f"Fan-out latency ms: p50={statistics.median(latencies):.2f} "
+            f"p95={latencies[int(len(latencies) * 0.95) - 1]:.2f} "
+            f"p99={latencies[int(len(latencies) * 0.99) - 1]:.2f} "
+            f"max={latencies[-1]:.2f}"
+        )
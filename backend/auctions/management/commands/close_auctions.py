@@ -0,0 +1,93 @@
+import heapq
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from redis.exceptions import LockError
+
+from auctions.engine import get_bid_engine
+from auctions.models import Auctions
+from auctions.utils import close_auctions, persist_bids
+
+
+class Command(BaseCommand):
+    help = "Closes live auctions at their closes_at deadline"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--interval", type=float, default=1.0, help="Seconds between deadline checks")
+        parser.add_argument("--refresh", type=float, default=15.0, help="Seconds between reloads of the live auction schedule")
+        parser.add_argument("--once", action="store_true", help="Close everything that is due and exit")
+
+    def handle(self, *args, **options):
+        self.engine = get_bid_engine()
+        self.heap = []
+        self.scheduled = {}
+        last_refresh = None
+
+        while True:
+            if last_refresh is None or time.monotonic() - last_refresh >= options["refresh"]:
+                self.refresh()
+                last_refresh = time.monotonic()
+
+            self.close_due(options["batch_size"])
+
+            if options["once"]:
+                break
+
+            time.sleep(options["interval"])
+
+    def refresh(self):
+        # Bids still waiting in the write-behind queue may start a clock, the next refresh picks up any left over
+        try:
+            self.engine.drain(persist_bids)
+        except LockError as e:
+            self.stderr.write(f"Bid queue drain skipped. Error {e}")
+
+        deadlines = dict(Auctions.objects.filter(status=1, closes_at__isnull=False).values_list("id", "closes_at"))
+
+        for pk, deadline in deadlines.items():
+            if self.scheduled.get(pk) != deadline:
+                self.scheduled[pk] = deadline
+                heapq.heappush(self.heap, (deadline, pk))
+
+        # Auctions closed or stopped elsewhere drop out of the schedule
+        for pk in set(self.scheduled) - set(deadlines):
+            del self.scheduled[pk]
+
+    def close_due(self, batch_size):
+        now = timezone.now()
+        due = []
+
+        while self.heap and self.heap[0][0] <= now:
+            deadline, pk = heapq.heappop(self.heap)
+
+            # Stale entries are left in the heap and skipped here
+            if self.scheduled.get(pk) == deadline:
+                del self.scheduled[pk]
+                due.append(pk)
+
+        if not due:
+            return
+
+        # Bids accepted right before the deadline must be in AuctionBids first, so without the
+        # drain the auctions go back on the schedule for the next check
+        try:
+            self.engine.drain(persist_bids)
+        except LockError as e:
+            self.stderr.write(f"Closing postponed. Error {e}")
+
+            for pk in due:
+                self.scheduled[pk] = now
+                heapq.heappush(self.heap, (now, pk))
+
+            return
+
+        for start in range(0, len(due), batch_size):
+            closed = close_auctions(due[start:start + batch_size])
+
+            for auction_id in closed:
+                self.engine.close(auction_id)
+
+            if closed:
+                self.stdout.write(f"Closed {len(closed)} auctions: {', '.join(closed)}")
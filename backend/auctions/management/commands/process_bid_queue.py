@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+from redis.exceptions import LockError
+
+from auctions.engine import get_bid_engine
+from auctions.utils import persist_bids
+
+
+class Command(BaseCommand):
+    help = "Persists bids accepted by the bid engine to AuctionBids (write-behind worker)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--interval", type=float, default=0.2, help="Seconds to sleep when the queue is empty")
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit")
+
+    def handle(self, *args, **options):
+        engine = get_bid_engine()
+
+        while True:
+            try:
+                processed = engine.drain(persist_bids, batch_size=options["batch_size"])
+            except LockError as e:
+                # The auction closer is draining, or a lost lock stopped this drain mid-way
+                self.stderr.write(f"Bid queue drain skipped. Error {e}")
+                processed = 0
+
+            if processed:
+                self.stdout.write(f"Persisted {processed} bids")
+
+            if options["once"]:
+                break
+
+            if not processed:
+                time.sleep(options["interval"])
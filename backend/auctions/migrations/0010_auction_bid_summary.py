@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:08
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Min
+
+
+def backfill_bid_summary(apps, schema_editor):
+    Auctions = apps.get_model('auctions', 'Auctions')
+    AuctionBids = apps.get_model('auctions', 'AuctionBids')
+
+    summaries = AuctionBids.objects.values('auction_id').annotate(
+        first_bid_at=Min('created_at'), bid_count=Count('id'), current_price=Max('bid')
+    )
+    summaries = {summary['auction_id']: summary for summary in summaries}
+
+    auctions = []
+    for auction in Auctions.objects.filter(auction_id__in=list(summaries)).only('id', 'auction_id').iterator(chunk_size=1000):
+        summary = summaries[auction.auction_id]
+        auction.first_bid_at = summary['first_bid_at']
+        auction.closes_at = summary['first_bid_at'] + timedelta(minutes=10)
+        auction.bid_count = summary['bid_count']
+        auction.current_price = summary['current_price']
+        auctions.append(auction)
+
+    Auctions.objects.bulk_update(auctions, ['first_bid_at', 'closes_at', 'bid_count', 'current_price'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0009_alter_auctionwon_bid_price'),
+        ('inspections', '0013_alter_inspectionrequest_arbitration_ticket_id'),
+        ('users', '0014_remove_transporter_city_name_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auctions',
+            name='bid_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='auctions',
+            name='closes_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='auctions',
+            name='current_price',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='auctions',
+            name='first_bid_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='auctionbids',
+            index=models.Index(fields=['auction_id', 'created_at'], name='auctions_au_auction_9a5e11_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auctions',
+            index=models.Index(fields=['status', 'closes_at'], name='auctions_au_status_8b90af_idx'),
+        ),
+        migrations.RunPython(backfill_bid_summary, migrations.RunPython.noop),
+    ]
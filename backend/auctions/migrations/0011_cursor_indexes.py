@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0010_auction_bid_summary'),
+        ('inspections', '0013_alter_inspectionrequest_arbitration_ticket_id'),
+        ('users', '0014_remove_transporter_city_name_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auctionnegotiations',
+            index=models.Index(fields=['created_at', 'id'], name='auctions_au_created_1b0a62_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auctions',
+            index=models.Index(fields=['created_at', 'id'], name='auctions_au_created_429967_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0011_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auctionbids',
+            name='auction_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bids', to='auctions.auctions'),
+        ),
+        migrations.AddField(
+            model_name='auctionnegotiations',
+            name='auction_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='negotiations', to='auctions.auctions'),
+        ),
+        migrations.AddField(
+            model_name='auctionoffers',
+            name='auction_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='offers', to='auctions.auctions'),
+        ),
+        migrations.AddField(
+            model_name='auctionproxies',
+            name='auction_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='proxies', to='auctions.auctions'),
+        ),
+        migrations.AddField(
+            model_name='auctionwon',
+            name='auction_ref',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='auction_won', to='auctions.auctions'),
+        ),
+    ]
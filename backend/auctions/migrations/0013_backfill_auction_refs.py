@@ -0,0 +1,45 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 1000
+REFERENCING_MODELS = (
+    ("auctions", "AuctionBids"),
+    ("auctions", "AuctionNegotiations"),
+    ("auctions", "AuctionOffers"),
+    ("auctions", "AuctionProxies"),
+    ("auctions", "AuctionWon"),
+    ("inspections", "ManualDelivery"),
+    ("transportation", "TransportationJob"),
+    ("transportation", "TransportationJobTracking"),
+    ("arbitration", "Ticket"),
+)
+
+
+def backfill_auction_refs(apps, schema_editor):
+    # Each batch commits on its own (the operation isn't atomic), so the tables stay writable meanwhile
+    Auctions = apps.get_model("auctions", "Auctions")
+    auction = Subquery(Auctions.objects.filter(auction_id=OuterRef("auction_id")).values("id")[:1])
+
+    for app_label, model_name in REFERENCING_MODELS:
+        Model = apps.get_model(app_label, model_name)
+        pending = Model.objects.filter(auction_ref=None).exclude(auction_id=None).order_by("id")
+        last_id = 0
+
+        while batch := list(pending.filter(id__gt=last_id).values_list("id", flat=True)[:BATCH_SIZE]):
+            last_id = batch[-1]
+            Model.objects.filter(id__in=batch).update(auction_ref=auction)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('auctions', '0012_auction_refs'),
+        ('inspections', '0022_manual_delivery_auction_ref'),
+        ('transportation', '0009_auction_refs'),
+        ('arbitration', '0004_ticket_auction_ref'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_auction_refs, migrations.RunPython.noop, atomic=False),
+    ]
@@ -0,0 +1,65 @@
+import re
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import migrations
+
+BATCH_SIZE = 1000
+# Text price columns turned into DecimalField(max_digits=12, decimal_places=2) by the following migrations
+PRICE_FIELDS = (
+    ("auctions", "Auctions", ("reserve_price", "bid_start_from_price")),
+    ("inspections", "InspectionRequest", ("expected_price", "reserve_price")),
+    ("transportation", "TransportationJob", ("transport_charges",)),
+)
+NOT_NULL_FIELDS = {"bid_start_from_price"}
+AMOUNT = re.compile(r"-?\d+(\.\d+)?")
+CENT = Decimal("0.01")
+LIMIT = Decimal("1e10")
+
+
+def to_amount(value):
+    """``value`` as a decimal string with two places, ``None`` for blanks and text that isn't an amount."""
+    value = re.sub(r"[\s$,]", "", str(value))
+
+    if not AMOUNT.fullmatch(value):
+        return None
+
+    amount = Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP)
+
+    return str(amount) if abs(amount) < LIMIT else None
+
+
+def normalize_prices(apps, schema_editor):
+    # Rewrites the text in place so the column type change is a plain cast, batch by batch outside a transaction
+    for app_label, model_name, fields in PRICE_FIELDS:
+        Model = apps.get_model(app_label, model_name)
+        rows = Model.objects.order_by("id").values_list("id", *fields)
+        last_id = 0
+
+        while batch := list(rows.filter(id__gt=last_id)[:BATCH_SIZE]):
+            last_id = batch[-1][0]
+            changed = []
+
+            for id, *values in batch:
+                amounts = [
+                    None if value is None else to_amount(value) or ("0.00" if field in NOT_NULL_FIELDS else None)
+                    for field, value in zip(fields, values)
+                ]
+
+                if amounts != values:
+                    changed.append(Model(id=id, **dict(zip(fields, amounts))))
+
+            Model.objects.bulk_update(changed, fields)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('auctions', '0013_backfill_auction_refs'),
+        ('inspections', '0022_manual_delivery_auction_ref'),
+        ('transportation', '0009_auction_refs'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_prices, migrations.RunPython.noop, atomic=False),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0014_normalize_prices'),
+        ('inspections', '0022_manual_delivery_auction_ref'),
+        ('users', '0016_coordinates'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auctions',
+            name='bid_start_from_price',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AlterField(
+            model_name='auctions',
+            name='expected_price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AlterField(
+            model_name='auctions',
+            name='reserve_price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AlterField(
+            model_name='auctionwon',
+            name='bid_price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='auctions',
+            index=models.Index(fields=['status', 'current_price'], name='auctions_au_status_20a8e0_idx'),
+        ),
+    ]
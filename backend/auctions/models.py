@@ -1,6 +1,25 @@
 from django.db import models
 
 
+class AuctionReferenceMixin:
+    """
+    For tables that used to join auctions on the ``auction_id`` string: fills
+    the ``auction_ref`` foreign key from it on save. Bulk inserts set
+    ``auction_ref`` themselves. Reads stay on the string until
+    ``backfill_auction_refs`` reports no unlinked rows, since rows written by
+    older processes only carry the string.
+    """
+
+    def save(self, *args, **kwargs):
+        if self.auction_id and self.auction_ref_id is None:
+            self.auction_ref_id = Auctions.objects.filter(auction_id=self.auction_id).values_list("id", flat=True).first()
+
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "auction_ref"}
+
+        super().save(*args, **kwargs)
+
+
 class Auctions(models.Model):
     auction_id = models.CharField(unique=True, max_length=256, blank=True, null=True)
     request_id = models.ForeignKey("inspections.InspectionRequest", related_name="auctions", on_delete=models.SET_NULL, null=True, blank=True)
@@ -8,12 +27,12 @@ class Auctions(models.Model):
     last_bid_id = models.OneToOneField("auctions.AuctionBids", on_delete=models.SET_NULL, null=True, blank=True)
     last_proxy_id = models.OneToOneField("auctions.AuctionProxies", on_delete=models.SET_NULL, null=True, blank=True)
     last_proxy_buyer_id = models.ForeignKey("users.Dealership", related_name="proxy_buyer_auctions", on_delete=models.SET_NULL, null=True, blank=True)
-    expected_price = models.FloatField(blank=True, null=True)
-    reserve_price = models.TextField(blank=True, null=True)
+    expected_price = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    reserve_price = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
     ready_to_sell = models.TextField(blank=True, null=True)
     live_appraisal = models.TextField(blank=True, null=True)
     auction_type = models.TextField(blank=True, null=True, db_comment='1 = start bidding $0 , 2 = start the bid at 50% of reserve price , 3 = $3,000 less than reserve price.')
-    bid_start_from_price = models.CharField(max_length=255)
+    bid_start_from_price = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     won_type = models.IntegerField(blank=True, null=True, db_comment='1= Bid, 2= Proxy Bid, 3 = Buy Now')
     won_by_id = models.ForeignKey("users.Dealership", related_name="buyer_auctions", on_delete=models.SET_NULL, null=True, blank=True)
     won_bid_id = models.OneToOneField("auctions.AuctionBids", related_name="won_auction", on_delete=models.SET_NULL, null=True, blank=True)
@@ -22,18 +41,30 @@ class Auctions(models.Model):
     credit_use_for_selling_fee = models.IntegerField(blank=True, null=True)
     credit_use_for_buying = models.IntegerField(blank=True, null=True)
     status = models.IntegerField(default=0)
+    first_bid_at = models.DateTimeField(blank=True, null=True)
+    closes_at = models.DateTimeField(blank=True, null=True)
+    bid_count = models.IntegerField(default=0)
+    current_price = models.IntegerField(blank=True, null=True)
     created_by = models.ForeignKey("users.User", related_name="created_auctions", on_delete=models.SET_NULL, null=True, blank=True)
     updated_by = models.ForeignKey("users.User", related_name="updated_auctions", on_delete=models.SET_NULL, null=True, blank=True)
     deleted_at = models.DateTimeField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "closes_at"]),
+            models.Index(fields=["created_at", "id"]),
+            models.Index(fields=["status", "current_price"]),
+        ]
+
     def __str__(self):
         return f"Auction {self.id}"
 
 
-class AuctionBids(models.Model):
+class AuctionBids(AuctionReferenceMixin, models.Model):
     auction_id = models.CharField(max_length=256, blank=True, null=True)
+    auction_ref = models.ForeignKey("auctions.Auctions", related_name="bids", on_delete=models.SET_NULL, null=True, blank=True)
     request_id = models.ForeignKey("inspections.InspectionRequest", related_name="auction_bids", on_delete=models.SET_NULL, null=True, blank=True)
     buyer_id = models.ForeignKey("users.Dealership", related_name="auction_bids", on_delete=models.SET_NULL, null=True, blank=True)
     buyer_user_id = models.ForeignKey("users.User", related_name="buyer_user_auction_bids", on_delete=models.SET_NULL, null=True, blank=True)
@@ -50,10 +81,14 @@ class AuctionBids(models.Model):
     class Meta:
         verbose_name = "Auction Bid"
         verbose_name_plural = "Auction Bids"
+        indexes = [
+            models.Index(fields=["auction_id", "created_at"]),
+        ]
 
 
-class AuctionNegotiations(models.Model):
+class AuctionNegotiations(AuctionReferenceMixin, models.Model):
     auction_id = models.CharField(max_length=255, blank=True, null=True)
+    auction_ref = models.ForeignKey("auctions.Auctions", related_name="negotiations", on_delete=models.SET_NULL, null=True, blank=True)
     request_id = models.ForeignKey("inspections.InspectionRequest", related_name="auction_negotiations", on_delete=models.SET_NULL, null=True, blank=True)
     buyer_id = models.ForeignKey("users.Dealership", related_name="buyer_auction_negotiations", on_delete=models.SET_NULL, null=True, blank=True)
     dealer_id = models.ForeignKey("users.Dealership", related_name="seller_auction_negotiations", on_delete=models.SET_NULL, null=True, blank=True)
@@ -75,10 +110,14 @@ class AuctionNegotiations(models.Model):
     class Meta:
         verbose_name = "Auction Negotiation"
         verbose_name_plural = "Auction Negotiations"
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+        ]
 
 
-class AuctionOffers(models.Model):
+class AuctionOffers(AuctionReferenceMixin, models.Model):
     auction_id = models.CharField(max_length=255, blank=True, null=True)
+    auction_ref = models.ForeignKey("auctions.Auctions", related_name="offers", on_delete=models.SET_NULL, null=True, blank=True)
     request_id = models.ForeignKey("inspections.InspectionRequest", related_name="auction_offers", on_delete=models.SET_NULL, null=True, blank=True)
     buyer_id = models.ForeignKey("users.Dealership", related_name="buyer_auction_offers", on_delete=models.SET_NULL, null=True, blank=True)
     dealer_id = models.ForeignKey("users.Dealership", related_name="seller_auction_offers", on_delete=models.SET_NULL, null=True, blank=True)
@@ -100,8 +139,9 @@ class AuctionOffers(models.Model):
         verbose_name_plural = "Auction Offers"
 
 
-class AuctionProxies(models.Model):
+class AuctionProxies(AuctionReferenceMixin, models.Model):
     auction_id = models.CharField(max_length=255, blank=True, null=True)
+    auction_ref = models.ForeignKey("auctions.Auctions", related_name="proxies", on_delete=models.SET_NULL, null=True, blank=True)
     request_id = models.ForeignKey("inspections.InspectionRequest", related_name="auction_proxies", on_delete=models.SET_NULL, null=True, blank=True)
     buyer_id = models.ForeignKey("users.Dealership", related_name="buyer_auction_proxies", on_delete=models.SET_NULL, null=True, blank=True)
     proxy_amount = models.IntegerField(blank=True, null=True)
@@ -118,12 +158,13 @@ class AuctionProxies(models.Model):
         verbose_name_plural = "Auction Proxies"
 
 
-class AuctionWon(models.Model):
+class AuctionWon(AuctionReferenceMixin, models.Model):
     auction_id = models.CharField(unique=True, max_length=256, blank=True, null=True)
+    auction_ref = models.OneToOneField("auctions.Auctions", related_name="auction_won", on_delete=models.SET_NULL, null=True, blank=True)
     request_id = models.ForeignKey("inspections.InspectionRequest", related_name="auctions_won", on_delete=models.SET_NULL, null=True, blank=True)
     buyer_id = models.ForeignKey("users.Dealership", related_name="buyer_auctions_won", on_delete=models.SET_NULL, null=True, blank=True)
     bid_id = models.CharField(max_length=255, blank=True, null=True)
-    bid_price = models.FloatField(blank=True, null=True)
+    bid_price = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
     buyer_confirmation = models.IntegerField(blank=True, null=True)
     won_type = models.IntegerField(blank=True, null=True, db_comment='1= Bid, 2= Proxy Bid, 3 = Buy Now')
     is_expired = models.IntegerField(blank=True, null=True)
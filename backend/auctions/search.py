@@ -0,0 +1,333 @@
+import re
+import threading
+import time
+from decimal import Decimal
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Q
+from django_redis import get_redis_connection
+
+from auctions.models import Auctions
+
+KEY_PREFIX = "auctions:marketplace-index"
+SEQUENCE_KEY = f"{KEY_PREFIX}:sequence"
+CHANGES_KEY = f"{KEY_PREFIX}:changes"
+TRIMMED_KEY = f"{KEY_PREFIX}:trimmed"
+# Changes kept for processes catching up, one that falls further behind rebuilds its index
+CHANGES_LIMIT = 10000
+# Bounds how long edits made outside the tracked paths (admin, shell, vehicle edits) take to show up
+INDEX_TIMEOUT = 60 * 60
+
+LIVE = 1
+UPCOMING = 2
+STAGES = {"live": LIVE, "upcoming": UPCOMING}
+# InspectionRequest status of the auctions waiting on the run list
+RUN_LIST_STATUS = 20
+FACET_FIELDS = ("make", "model", "year", "state")
+RANGE_FIELDS = ("odometer", "price")
+LIGHTS = {"red": 1, "yellow": 2, "green": 4, "blue": 8}
+
+# dtype and empty value of every column, facet fields hold codes into their labels
+COLUMNS = {
+    "id": (np.int64, 0),
+    "stage": (np.int8, 0),
+    "dealer": (np.int64, 0),
+    "closes_at": (np.float64, np.nan),
+    "lights": (np.uint8, 0),
+    **{field: (np.int32, 0) for field in FACET_FIELDS},
+    **{field: (np.float64, np.nan) for field in RANGE_FIELDS},
+}
+AUCTION_VALUES = (
+    "id", "status", "dealer_id", "closes_at", "current_price", "bid_start_from_price", "request_id__status",
+    "request_id__make", "request_id__model", "request_id__year", "request_id__odometer",
+    "request_id__has_red", "request_id__has_yellow", "request_id__has_green", "request_id__has_blue",
+    "request_id__inspection_location__state__name",
+)
+
+MARK_CHANGED_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+for i = 2, #ARGV do
+    redis.call('ZADD', KEYS[2], seq, ARGV[i])
+end
+local excess = redis.call('ZCARD', KEYS[2]) - tonumber(ARGV[1])
+if excess > 0 then
+    local last = redis.call('ZRANGE', KEYS[2], excess - 1, excess - 1, 'WITHSCORES')
+    redis.call('SET', KEYS[3], last[2])
+    redis.call('ZREMRANGEBYRANK', KEYS[2], 0, excess - 1)
+end
+return seq
+"""
+
+
+def fold(value):
+    return str(value).strip().casefold() if value not in (None, "") else None
+
+
+def parse_number(value):
+    """A float from a number or text such as ``"45,210 mi"``, NaN when there's none."""
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+
+    digits = re.sub(r"[^\d.]", "", value or "")
+
+    try:
+        return float(digits)
+    except ValueError:
+        return np.nan
+
+
+class MarketplaceIndex:
+    """
+    Live and upcoming auctions with their vehicle, in one numpy column per
+    attribute. Make, model, year and state are stored as codes into a
+    vocabulary, so the bitmap of a value is ``codes == code`` and the counts
+    of every value come out of a single ``bincount``; warning lights are bit
+    flags. A search is a handful of vectorised comparisons, no queries.
+
+    Writers add changed auction ids to a change log in Redis numbered by one
+    sequence, and each process reloads just those rows on its next search.
+    Full rebuilds load into a fresh index and swap its columns in.
+    """
+
+    def __init__(self, connection=None):
+        self.redis = connection or get_redis_connection("default")
+        self._mark_changed = self.redis.register_script(MARK_CHANGED_SCRIPT)
+        self.lock = threading.Lock()
+        self.rebuild_lock = threading.Lock()
+        self.cursor = 0
+        self.built_at = None
+        self.clear()
+
+    def clear(self, capacity=1024):
+        self.columns = {name: np.full(capacity, empty, dtype=dtype) for name, (dtype, empty) in COLUMNS.items()}
+        self.slots = {}
+        self.free = []
+        self.size = 0
+        self.labels = {field: [None] for field in FACET_FIELDS}
+        self.codes = {field: {} for field in FACET_FIELDS}
+
+    def mark_changed(self, ids):
+        return self._mark_changed(keys=[SEQUENCE_KEY, CHANGES_KEY, TRIMMED_KEY], args=[CHANGES_LIMIT, *ids])
+
+    def sync(self):
+        """
+        Catches up with the change log, or rebuilds when this process can no
+        longer follow it. The rebuild loads fresh columns outside ``lock`` and
+        swaps them in, so searches keep answering from the current ones meanwhile.
+        """
+        with self.lock:
+            sequence = self.catch_up()
+
+        if sequence is not None:
+            self.rebuild(sequence)
+
+    def catch_up(self):
+        # Reloads the changed rows, or returns the sequence to rebuild at
+        with self.redis.pipeline() as pipe:
+            pipe.get(SEQUENCE_KEY)
+            pipe.get(TRIMMED_KEY)
+            pipe.zrangebyscore(CHANGES_KEY, f"({self.cursor}", "+inf", withscores=True)
+            sequence, trimmed, changes = pipe.execute()
+
+        sequence = int(sequence or 0)
+        stale = self.built_at is None or time.monotonic() - self.built_at > INDEX_TIMEOUT
+
+        # A trimmed log or a reset sequence means changes this process can no longer see
+        if stale or int(float(trimmed or 0)) > self.cursor or sequence < self.cursor:
+            return sequence
+
+        if changes:
+            self.reload([int(id) for id, score in changes])
+            self.cursor = int(max(score for id, score in changes))
+
+        return None
+
+    def rebuild(self, sequence):
+        built_at = self.built_at
+
+        # One rebuild at a time, the other searches keep the current columns unless there are none yet
+        if not self.rebuild_lock.acquire(blocking=built_at is None):
+            return
+
+        try:
+            if self.built_at != built_at:
+                return
+
+            fresh = MarketplaceIndex(connection=self.redis)
+            fresh.load()
+
+            with self.lock:
+                self.columns, self.slots, self.free, self.size = fresh.columns, fresh.slots, fresh.free, fresh.size
+                self.labels, self.codes = fresh.labels, fresh.codes
+                # Changes logged while loading are reloaded on the next sync
+                self.cursor = sequence
+                self.built_at = time.monotonic()
+        finally:
+            self.rebuild_lock.release()
+
+    def load(self):
+        queryset = Auctions.objects.filter(Q(status=1) | Q(request_id__status=RUN_LIST_STATUS)).values(*AUCTION_VALUES)
+
+        for auction in queryset.iterator(chunk_size=2000):
+            self.put(auction)
+
+    def reload(self, ids):
+        found = set()
+
+        for auction in Auctions.objects.filter(id__in=ids).values(*AUCTION_VALUES):
+            self.put(auction)
+            found.add(auction["id"])
+
+        for id in set(ids) - found:
+            self.remove(id)
+
+    def put(self, auction):
+        if auction["status"] == 1:
+            stage = LIVE
+        elif auction["request_id__status"] == RUN_LIST_STATUS:
+            stage = UPCOMING
+        else:
+            self.remove(auction["id"])
+            return
+
+        slot = self.slots.get(auction["id"])
+
+        if slot is None:
+            slot = self.free.pop() if self.free else self.allocate()
+            self.slots[auction["id"]] = slot
+
+        price = auction["current_price"] if auction["current_price"] is not None else auction["bid_start_from_price"]
+        row = {
+            "id": auction["id"],
+            "stage": stage,
+            "dealer": auction["dealer_id"] or 0,
+            "closes_at": auction["closes_at"].timestamp() if auction["closes_at"] else np.nan,
+            "lights": sum(bit for name, bit in LIGHTS.items() if auction[f"request_id__has_{name}"]),
+            "make": self.code("make", auction["request_id__make"]),
+            "model": self.code("model", auction["request_id__model"]),
+            "year": self.code("year", auction["request_id__year"]),
+            "state": self.code("state", auction["request_id__inspection_location__state__name"]),
+            "odometer": parse_number(auction["request_id__odometer"]),
+            "price": parse_number(price),
+        }
+
+        for name, value in row.items():
+            self.columns[name][slot] = value
+
+    def remove(self, id):
+        slot = self.slots.pop(id, None)
+
+        if slot is not None:
+            for name, (dtype, empty) in COLUMNS.items():
+                self.columns[name][slot] = empty
+            self.free.append(slot)
+
+    def allocate(self):
+        if self.size == len(self.columns["id"]):
+            self.columns = {
+                name: np.concatenate([values, np.full(len(values), COLUMNS[name][1], dtype=values.dtype)])
+                for name, values in self.columns.items()
+            }
+
+        self.size += 1
+
+        return self.size - 1
+
+    def code(self, field, value):
+        folded = fold(value)
+
+        if folded is None:
+            return 0
+
+        if folded not in self.codes[field]:
+            self.codes[field][folded] = len(self.labels[field])
+            self.labels[field].append(str(value).strip())
+
+        return self.codes[field][folded]
+
+    def search(self, filters=None, stages=(LIVE,), exclude_dealer=None, now=None):
+        """
+        The ids of the auctions matching ``filters`` and the facets of the
+        matches: value counts per field, warning light counts and the range
+        of the numeric fields. A field's facet is taken under every filter but
+        its own, so a selected make still lists the other makes.
+        """
+        filters = filters or {}
+        now = time.time() if now is None else now
+
+        self.sync()
+
+        with self.lock:
+            columns = {name: values[:self.size] for name, values in self.columns.items()}
+            base = np.isin(columns["stage"], stages)
+            # Expired auctions are closed by the close_auctions worker; hide them until it does
+            base &= ~((columns["stage"] == LIVE) & (columns["closes_at"] <= now))
+
+            if exclude_dealer is not None:
+                base &= columns["dealer"] != exclude_dealer
+
+            masks = {}
+
+            for field in FACET_FIELDS:
+                if filters.get(field):
+                    codes = [self.codes[field][folded] for folded in map(fold, filters[field]) if folded in self.codes[field]]
+                    masks[field] = np.isin(columns[field], codes)
+
+            if filters.get("lights"):
+                masks["lights"] = (columns["lights"] & sum(LIGHTS[name] for name in set(filters["lights"]))) != 0
+
+            for field in RANGE_FIELDS:
+                low, high = filters.get(f"min_{field}"), filters.get(f"max_{field}")
+
+                if low is not None or high is not None:
+                    values = columns[field]
+                    masks[field] = (values >= (-np.inf if low is None else low)) & (values <= (np.inf if high is None else high))
+
+            def scope(excluded=None):
+                mask = base.copy()
+                for field, field_mask in masks.items():
+                    if field != excluded:
+                        mask &= field_mask
+                return mask
+
+            matches = scope()
+            facets = {}
+
+            for field in FACET_FIELDS:
+                counts = np.bincount(columns[field][scope(field)], minlength=len(self.labels[field]))
+                facets[field] = sorted(
+                    ({"value": self.labels[field][code], "count": int(counts[code])} for code in np.flatnonzero(counts) if code),
+                    key=lambda facet: (-facet["count"], facet["value"].casefold()),
+                )
+
+            lights = columns["lights"][scope("lights")]
+            facets["lights"] = {name: int(np.count_nonzero(lights & bit)) for name, bit in LIGHTS.items()}
+
+            for field in RANGE_FIELDS:
+                values = columns[field][scope(field)]
+                values = values[~np.isnan(values)]
+                facets[field] = {"min": float(values.min()), "max": float(values.max())} if len(values) else {"min": None, "max": None}
+
+            return columns["id"][matches].tolist(), facets
+
+
+_index = None
+
+
+def get_marketplace_index():
+    global _index
+
+    if _index is None:
+        _index = MarketplaceIndex()
+
+    return _index
+
+
+def mark_auctions_changed(ids):
+    """Reloads the auctions in every process's ``MarketplaceIndex`` once the transaction commits."""
+    ids = [id for id in ids if id]
+
+    if ids:
+        # A Redis hiccup only delays the listing until the next rebuild, it mustn't fail the committed request
+        transaction.on_commit(lambda: get_marketplace_index().mark_changed(ids), robust=True)
@@ -0,0 +1,100 @@
+import asyncio
+import json
+from collections import defaultdict
+from logging import getLogger
+
+from django.conf import settings
+from redis import asyncio as aioredis
+
+from auctions.engine import EVENTS_CHANNEL
+
+logger = getLogger("awd")
+
+# Seconds between attempts to restore a lost subscription, doubling up to the maximum
+RECONNECT_DELAY = 0.5
+MAX_RECONNECT_DELAY = 30
+
+
+class AuctionEventHub:
+    """
+    Holds a single Redis subscription to the bid engine events per process and
+    fans each event out to the local subscribers of its auction. Events are
+    decoded once and handed to subscribers as the raw JSON string.
+
+    A dropped subscription is restored with backoff; ``ready`` is cleared
+    while it's down, since events published meanwhile are lost.
+    """
+
+    def __init__(self, url=None, queue_size=100):
+        self.url = url or settings.REDIS_URL
+        self.queue_size = queue_size
+        self.subscribers = defaultdict(set)
+        self.ready = asyncio.Event()
+        self._listener = None
+
+    def subscribe(self, auction_id):
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers[auction_id].add(queue)
+
+        if self._listener is None or self._listener.done():
+            self.ready.clear()
+            self._listener = asyncio.ensure_future(self._listen())
+
+        return queue
+
+    def unsubscribe(self, auction_id, queue):
+        queues = self.subscribers.get(auction_id)
+
+        if queues is not None:
+            queues.discard(queue)
+
+            if not queues:
+                del self.subscribers[auction_id]
+
+    def dispatch(self, data):
+        event = json.loads(data)
+
+        for queue in list(self.subscribers.get(event["auction_id"], ())):
+            if queue.full():
+                # A slow subscriber loses its oldest delta instead of stalling the fan-out
+                queue.get_nowait()
+
+            queue.put_nowait((event["type"], data))
+
+    async def _listen(self):
+        delay = RECONNECT_DELAY
+
+        while True:
+            client = aioredis.from_url(self.url, decode_responses=True)
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+
+            try:
+                await pubsub.subscribe(EVENTS_CHANNEL)
+                self.ready.set()
+                delay = RECONNECT_DELAY
+
+                async for message in pubsub.listen():
+                    self.dispatch(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Auction event subscription lost, reconnecting in {delay}s. Error {e}")
+            finally:
+                self.ready.clear()
+                await pubsub.aclose()
+                await client.aclose()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+
+_hub = None
+
+
+def get_event_hub():
+    global _hub
+
+    if _hub is None:
+        _hub = AuctionEventHub()
+
+    return _hub
@@ -1,3 +1,461 @@
-from django.test import TestCase
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+import fakeredis
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from auctions import engine
+from auctions.api.v1.views import STREAM_TICKET_MAX_AGE, _authenticate_stream
+from auctions.engine import WRITER_LOCK_KEY, BidEngine, BidRejected
+from auctions.models import Auctions, AuctionBids, AuctionNegotiations, AuctionOffers, AuctionProxies
+from auctions.search import LIVE, UPCOMING, MarketplaceIndex
+from inspections.models import InspectionRequest, Inspector, VehicleInspectionReport
+from users.models import DealerLocation, Dealership, Role, User
+from utils.prefetch import attach_by_auction_id
+
+
+def create_user(email, role_name, dealership_name):
+    role, _ = Role.objects.get_or_create(name=role_name, defaults={"status": 1})
+    dealer = Dealership.objects.create(dealership_name=dealership_name)
+
+    return User.objects.create(first_name=dealership_name, last_name="User", email=email, role=role, dealer=dealer)
+
+
+def seed_auction(bid_engine, auction_id="A1", high_bid=0, proxies=None):
+    state = {"auction_pk": 1, "request_id": 1, "seller_id": 1, "high_bid": high_bid, "high_user": "", "high_buyer": "", "bid_count": 0, "duration": 600}
+    bid_engine.seed(auction_id, state, proxies)
+
+
+class BidEngineTestCase(TestCase):
+    def setUp(self):
+        self.engine = BidEngine(connection=fakeredis.FakeRedis())
+        seed_auction(self.engine)
+
+    def test_accepted_bid_updates_state_and_queues_it(self):
+        payload, proxy_bids = self.engine.place_bid("A1", 500, 2, 22)
+        state = self.engine.get_state("A1", load=False)
+
+        self.assertEqual(payload["bid"], 500)
+        self.assertEqual(proxy_bids, [])
+        self.assertEqual((state["high_bid"], state["high_user"], state["bid_count"]), (500, "22", 1))
+        self.assertIsNotNone(state["closes_at"])
+        self.assertEqual(self.engine.pending_count(), 1)
+
+    def test_bid_not_above_high_bid_is_rejected(self):
+        self.engine.place_bid("A1", 500, 2, 22)
+
+        with self.assertRaisesMessage(BidRejected, "Enter bid amount greater than highest auction"):
+            self.engine.place_bid("A1", 500, 3, 33)
+
+    def test_highest_bidder_cannot_bid_again(self):
+        self.engine.place_bid("A1", 500, 2, 22)
+
+        with self.assertRaisesMessage(BidRejected, "Buyer already have highest bid"):
+            self.engine.place_bid("A1", 600, 2, 22)
+
+    def test_bid_after_close_is_rejected(self):
+        self.engine.redis.hset(self.engine._keys("A1")[0], "closes_at", 1)
+
+        with self.assertRaisesMessage(BidRejected, "Auction is closed"):
+            self.engine.place_bid("A1", 500, 2, 22)
+
+    def test_proxy_not_above_high_bid_is_rejected(self):
+        self.engine.place_bid("A1", 500, 2, 22)
+
+        with self.assertRaisesMessage(BidRejected, "Proxy amount is less than the highest bid"):
+            self.engine.register_proxy("A1", 1, 500, 3, 33)
+
+    def test_drain_hands_queued_bids_in_batches(self):
+        self.engine.place_bid("A1", 100, 2, 22)
+        self.engine.place_bid("A1", 200, 3, 33)
+        self.engine.place_bid("A1", 300, 2, 22)
+        batches = []
+
+        self.assertEqual(self.engine.drain(batches.append, batch_size=2), 3)
+        self.assertEqual([[entry["bid"] for entry in batch] for batch in batches], [[100, 200], [300]])
+        self.assertEqual(self.engine.pending_count(), 0)
+
+    def test_drain_renews_the_lock_for_every_batch(self):
+        self.engine.place_bid("A1", 100, 2, 22)
+        self.engine.place_bid("A1", 200, 3, 33)
+        ttls = []
+
+        def handler(batch):
+            ttls.append(self.engine.redis.pttl(WRITER_LOCK_KEY))
+            # Nearly expired by the time the batch is written
+            self.engine.redis.pexpire(WRITER_LOCK_KEY, 100)
+
+        self.engine.drain(handler, batch_size=1)
+
+        self.assertEqual(len(ttls), 2)
+        self.assertGreater(ttls[1], 100)
+
+    def test_busy_writer_lock_skips_the_drain(self):
+        engine._engine = self.engine
+        self.addCleanup(setattr, engine, "_engine", None)
+        self.engine.place_bid("A1", 100, 2, 22)
+        self.engine.redis.lock(WRITER_LOCK_KEY, timeout=60).acquire()
+        stderr = StringIO()
+
+        with mock.patch.object(engine, "WRITER_LOCK_WAIT", 0.1):
+            call_command("process_bid_queue", "--once", stdout=StringIO(), stderr=stderr)
+
+        self.assertIn("Bid queue drain skipped", stderr.getvalue())
+        self.assertEqual(self.engine.pending_count(), 1)
+
+    def test_history_keeps_the_latest_bids(self):
+        bid_engine = BidEngine(connection=self.engine.redis, history_limit=2)
+
+        for bid, buyer in [(100, 2), (200, 3), (300, 2)]:
+            bid_engine.place_bid("A1", bid, buyer, buyer * 11)
+
+        self.assertEqual([entry["bid"] for entry in bid_engine.get_history("A1")], [200, 300])
+
+
+class ProxyLadderTestCase(TestCase):
+    def setUp(self):
+        self.engine = BidEngine(connection=fakeredis.FakeRedis())
+        seed_auction(self.engine, proxies={"3": {"seq": 1, "buyer_id": 3, "buyer_user_id": 33, "amount": 1000}})
+
+    def leader(self):
+        state = self.engine.get_state("A1", load=False)
+        return state["high_buyer"], state["high_bid"]
+
+    def test_lone_proxy_answers_a_bid_by_one_increment(self):
+        payload, proxy_bids = self.engine.place_bid("A1", 100, 1, 11)
+
+        self.assertEqual(proxy_bids, [200])
+        self.assertEqual(self.leader(), ("3", 200))
+
+    def test_stronger_proxy_leads_one_increment_over_the_runner_up(self):
+        self.engine.place_bid("A1", 100, 1, 11)
+
+        self.assertEqual(self.engine.register_proxy("A1", 2, 1500, 4, 44), [1000, 1100])
+        self.assertEqual(self.leader(), ("4", 1100))
+
+    def test_earlier_proxy_wins_a_tie(self):
+        self.engine.place_bid("A1", 100, 1, 11)
+        self.engine.register_proxy("A1", 2, 1500, 4, 44)
+
+        self.assertEqual(self.engine.register_proxy("A1", 3, 1500, 5, 55), [1500, 1500])
+        self.assertEqual(self.leader(), ("4", 1500))
+
+    def test_leader_is_capped_at_its_maximum(self):
+        self.engine.register_proxy("A1", 2, 1050, 4, 44)
+
+        self.assertEqual(self.leader(), ("4", 1050))
+
+    def test_bid_over_every_proxy_leaves_them_silent(self):
+        payload, proxy_bids = self.engine.place_bid("A1", 1200, 1, 11)
+
+        self.assertEqual(proxy_bids, [])
+        self.assertEqual(self.leader(), ("1", 1200))
+        self.assertEqual([entry["bid"] for entry in self.engine.get_history("A1")], [1200])
+
+
+class CreateAuctionProxyTestCase(TestCase):
+    def setUp(self):
+        self.engine = engine._engine = BidEngine(connection=fakeredis.FakeRedis())
+        self.addCleanup(setattr, engine, "_engine", None)
+        self.seller = create_user("seller@example.com", "SELLER", "Seller")
+        self.buyer = create_user("buyer@example.com", "BUYER", "Buyer")
+        request = InspectionRequest.objects.create(dealer=self.seller.dealer, auction_id="A1", status=4, manual_delivered=0, via_api=0)
+        self.auction = Auctions.objects.create(auction_id="A1", request_id=request, dealer_id=self.seller.dealer, status=1, current_price=1000)
+        self.client = APIClient()
+        self.client.force_authenticate(self.buyer)
+
+    def create_proxy(self, amount):
+        return self.client.post(reverse("create_proxy"), {"auction_id": "A1", "proxy_amount": amount, "bid_amount": 0}, format="json")
+
+    def test_registered_proxy_goes_live(self):
+        response = self.create_proxy(2000)
+        proxy = AuctionProxies.objects.get()
+        self.auction.refresh_from_db()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertIsNone(proxy.is_expire)
+        self.assertEqual(self.auction.last_proxy_id_id, proxy.id)
+        self.assertEqual(self.engine.get_state("A1", load=False)["high_bid"], 1100)
+
+    def test_proxy_rejected_by_the_engine_stays_expired(self):
+        self.engine.get_state("A1")
+        # The auction closes between the serializer's check and the engine call
+        self.engine.redis.hset(self.engine._keys("A1")[0], "closes_at", 1)
+        response = self.create_proxy(2000)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(AuctionProxies.objects.get().is_expire, 1)
+        self.assertEqual(self.engine.redis.hlen(self.engine._keys("A1")[1]), 0)
+
+
+class BuyNowTestCase(TestCase):
+    def setUp(self):
+        self.engine = engine._engine = BidEngine(connection=fakeredis.FakeRedis())
+        self.addCleanup(setattr, engine, "_engine", None)
+        self.seller = create_user("seller@example.com", "SELLER", "Seller")
+        self.buyer = create_user("buyer@example.com", "BUYER", "Buyer")
+        self.bidder = create_user("bidder@example.com", "BUYER", "Bidder")
+        request = InspectionRequest.objects.create(dealer=self.seller.dealer, auction_id="A1", status=4, manual_delivered=0, via_api=0)
+        Auctions.objects.create(auction_id="A1", request_id=request, dealer_id=self.seller.dealer, status=1, current_price=1000)
+        self.client = APIClient()
+
+    def test_bids_after_buy_now_are_rejected(self):
+        self.engine.place_bid("A1", 1100, self.bidder.dealer_id, self.bidder.id)
+        self.client.force_authenticate(self.buyer)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("buy_now"), {"auction_id": "A1"}, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertIsNone(self.engine.get_state("A1", load=False))
+
+        self.client.force_authenticate(self.bidder)
+        response = self.client.post(reverse("auction_create_bid"), {"auction_id": "A1", "bid": 1500}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": ["No Auction exists"]})
+
+
+class AuctionStreamTicketTestCase(TestCase):
+    def setUp(self):
+        self.buyer = create_user("buyer@example.com", "BUYER", "Buyer")
+        self.client = APIClient()
+        self.client.force_authenticate(self.buyer)
+
+    def get_ticket(self, auction_id="A1"):
+        response = self.client.post(reverse("marketplace_auction_stream_ticket", args=[auction_id]))
+        self.assertEqual(response.status_code, 201)
+
+        return response.data["ticket"]
+
+    def stream_request(self, auction_id, **params):
+        return APIRequestFactory().get(reverse("marketplace_auction_stream", args=[auction_id]), params)
+
+    def test_ticket_opens_the_stream_of_its_auction(self):
+        request = self.stream_request("A1", ticket=self.get_ticket())
+
+        self.assertTrue(_authenticate_stream(request, "A1"))
+        self.assertEqual(request.user, self.buyer)
+
+    def test_ticket_for_another_auction_is_refused(self):
+        response = APIClient().get(reverse("marketplace_auction_stream", args=["A2"]), {"ticket": self.get_ticket("A1")})
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_expired_ticket_is_refused(self):
+        ticket = self.get_ticket()
+
+        with mock.patch("django.core.signing.time.time", return_value=timezone.now().timestamp() + STREAM_TICKET_MAX_AGE + 1):
+            self.assertFalse(_authenticate_stream(self.stream_request("A1", ticket=ticket), "A1"))
+
+    def test_access_token_in_the_query_string_is_refused(self):
+        self.assertFalse(_authenticate_stream(self.stream_request("A1", token=str(AccessToken.for_user(self.buyer))), "A1"))
+
+
+class ListQueryCountTestCase(TestCase):
+    """The auction list views run a fixed number of queries, however many rows they return."""
+
+    # url name: (user, queries)
+    LIST_VIEWS = {
+        "upcoming_auctions": ("buyer", 13),
+        "run_list_auctions": ("admin", 11),
+        "auctions_live_list": ("admin", 13),
+        "auctions_won_list": ("admin", 10),
+        "marketplace_auctions_list": ("buyer", 11),
+        "auction_buying_current_list": ("buyer", 12),
+        "auction_buying_in_negotiation_list": ("buyer", 25),
+        "auction_buying_won_list": ("buyer", 12),
+        "auction_selling_current_list": ("seller", 23),
+        "auction_selling_in_negotiation": ("seller", 25),
+        "auction_selling_sold_list": ("seller", 23),
+        "auction_offer_now": ("buyer", 23),
+        "auctions_sold_list": ("buyer", 24),
+    }
+
+    def setUp(self):
+        self.users = {
+            "seller": create_user("seller@example.com", "BOTH", "Seller"),
+            "buyer": create_user("buyer@example.com", "BOTH", "Buyer"),
+            "admin": create_user("admin@example.com", "ADMIN", "Admin"),
+        }
+        self.inspector = Inspector.objects.create(user=self.users["seller"])
+        self.location = DealerLocation.objects.create(dealership=self.users["seller"].dealer, user=self.users["seller"])
+        self.vehicles = 0
+
+    def add_vehicles(self, count):
+        seller, buyer = self.users["seller"], self.users["buyer"]
+
+        for _ in range(count):
+            # One vehicle in negotiation, one sold and one on the run list, so every list has a row of each
+            for status, auction_status in ((21, 0), (5, 0), (20, 1)):
+                self.vehicles += 1
+                auction_id = f"Q{self.vehicles}"
+                request = InspectionRequest.objects.create(
+                    dealer=seller.dealer, auction_id=auction_id, status=status, auction_status=1, manual_delivered=0, via_api=0,
+                    inspector_assigned=self.inspector, buyer_id=buyer.dealer, inspection_location=self.location,
+                )
+                VehicleInspectionReport.objects.create(request_id=request, dealer_id=seller.dealer, inspector_id=self.inspector)
+                auction = Auctions.objects.create(auction_id=auction_id, request_id=request, dealer_id=seller.dealer, status=auction_status)
+
+                for amount in (100, 200):
+                    bid = AuctionBids.objects.create(auction_id=auction_id, request_id=request, buyer_id=buyer.dealer, buyer_user_id=buyer, bid=amount)
+                    AuctionOffers.objects.create(auction_id=auction_id, request_id=request, buyer_id=buyer.dealer, amount=amount + 200)
+
+                auction.last_bid_id = bid
+                auction.save()
+                AuctionNegotiations.objects.create(auction_id=auction_id, request_id=request, dealer_id=seller.dealer, buyer_id=buyer.dealer, bid_id=bid, amount=200)
+
+    def get_list(self, url_name, user):
+        client = APIClient()
+        client.force_authenticate(User.objects.select_related("role", "dealer").get(id=self.users[user].id))
+        response = client.get(reverse(url_name))
+
+        self.assertEqual(response.status_code, 200)
+
+        return response.data
+
+    def test_query_count_does_not_grow_with_rows(self):
+        for rows in (1, 5):
+            self.add_vehicles(rows - self.vehicles // 3)
+
+            for url_name, (user, queries) in self.LIST_VIEWS.items():
+                with self.subTest(url_name, rows=rows), self.assertNumQueries(queries):
+                    self.assertGreaterEqual(len(self.get_list(url_name, user)), rows)
+
+
+class MarketplaceSearchTestCase(TestCase):
+    def setUp(self):
+        self.index = MarketplaceIndex(connection=fakeredis.FakeRedis())
+        self.seller = create_user("seller@example.com", "SELLER", "Seller")
+        self.other = create_user("other@example.com", "SELLER", "Other")
+        closes_at = timezone.now() + timedelta(hours=1)
+        self.civic = self.add_auction("Honda", "Civic", "2020", 5000, odometer="45,210 mi", has_red=1, closes_at=closes_at)
+        self.accord = self.add_auction("honda", "Accord", "2021", 8000, odometer="12000", has_yellow=1, closes_at=closes_at)
+        self.focus = self.add_auction("Ford", "Focus", "2020", 3000, closes_at=closes_at)
+        self.camry = self.add_auction("Toyota", "Camry", "2019", None, status=0, request_status=20)
+        self.add_auction("Honda", "Fit", "2018", 2000, status=0, request_status=5)
+        self.add_auction("Honda", "Pilot", "2018", 2000, closes_at=timezone.now() - timedelta(minutes=1))
+        self.own = self.add_auction("Kia", "Soul", "2022", 4000, dealer=self.other, closes_at=closes_at)
+
+    def add_auction(self, make, model, year, price, status=1, request_status=4, dealer=None, closes_at=None, **vehicle):
+        dealer = (dealer or self.seller).dealer
+        request = InspectionRequest.objects.create(
+            dealer=dealer, status=request_status, make=make, model=model, year=year, manual_delivered=0, via_api=0, **vehicle,
+        )
+
+        return Auctions.objects.create(request_id=request, dealer_id=dealer, status=status, current_price=price, bid_start_from_price=1000, closes_at=closes_at)
+
+    def test_live_matches_with_facets(self):
+        ids, facets = self.index.search(exclude_dealer=self.other.dealer_id)
+
+        self.assertCountEqual(ids, [self.civic.id, self.accord.id, self.focus.id])
+        self.assertEqual(facets["make"], [{"value": "Honda", "count": 2}, {"value": "Ford", "count": 1}])
+        self.assertEqual(facets["lights"], {"red": 1, "yellow": 1, "green": 0, "blue": 0})
+        self.assertEqual(facets["price"], {"min": 3000.0, "max": 8000.0})
+        self.assertEqual(facets["odometer"], {"min": 12000.0, "max": 45210.0})
+
+    def test_field_facet_ignores_its_own_filter(self):
+        ids, facets = self.index.search({"make": ["HONDA"]}, exclude_dealer=self.other.dealer_id)
+
+        self.assertCountEqual(ids, [self.civic.id, self.accord.id])
+        self.assertEqual(facets["make"], [{"value": "Honda", "count": 2}, {"value": "Ford", "count": 1}])
+        self.assertEqual(facets["model"], [{"value": "Accord", "count": 1}, {"value": "Civic", "count": 1}])
+        self.assertEqual(facets["year"], [{"value": "2020", "count": 1}, {"value": "2021", "count": 1}])
+
+    def test_range_and_light_filters(self):
+        ids, facets = self.index.search({"min_price": 4000, "lights": ["red", "yellow"]}, exclude_dealer=self.other.dealer_id)
+
+        self.assertCountEqual(ids, [self.civic.id, self.accord.id])
+        self.assertEqual(facets["price"], {"min": 5000.0, "max": 8000.0})
+
+    def test_stages_and_dealer(self):
+        ids, _ = self.index.search(stages=(LIVE, UPCOMING))
+        self.assertCountEqual(ids, [self.civic.id, self.accord.id, self.focus.id, self.camry.id, self.own.id])
+
+        ids, facets = self.index.search(stages=(UPCOMING,))
+        self.assertEqual(ids, [self.camry.id])
+        self.assertEqual(facets["price"], {"min": 1000.0, "max": 1000.0})
+
+    def test_changed_auctions_reload_without_a_rebuild(self):
+        self.index.search()
+        Auctions.objects.filter(id=self.focus.id).update(status=0)
+        self.index.mark_changed([self.focus.id])
+
+        with mock.patch.object(MarketplaceIndex, "load") as load:
+            ids, _ = self.index.search(exclude_dealer=self.other.dealer_id)
+
+        load.assert_not_called()
+        self.assertCountEqual(ids, [self.civic.id, self.accord.id])
+
+    def test_rebuild_loads_outside_the_search_lock(self):
+        locked = []
+        load = MarketplaceIndex.load
+
+        def checked_load(fresh):
+            locked.append(self.index.lock.locked())
+            load(fresh)
+
+        with mock.patch.object(MarketplaceIndex, "load", checked_load):
+            ids, _ = self.index.search(exclude_dealer=self.other.dealer_id)
+
+        self.assertEqual(locked, [False])
+        self.assertEqual(len(ids), 3)
+
+
+class AuctionReferenceTestCase(TestCase):
+    def setUp(self):
+        self.seller = create_user("seller@example.com", "SELLER", "Seller")
+        self.request = InspectionRequest.objects.create(dealer=self.seller.dealer, auction_id="A1", status=4, manual_delivered=0, via_api=0)
+        self.auction = Auctions.objects.create(auction_id="A1", request_id=self.request, dealer_id=self.seller.dealer, status=1)
+
+    def add_offer(self, auction_id="A1"):
+        return AuctionOffers.objects.create(auction_id=auction_id, request_id=self.request, buyer_id=self.seller.dealer, amount=100)
+
+    def test_save_links_the_auction(self):
+        self.assertEqual(self.add_offer().auction_ref_id, self.auction.id)
+        self.assertIsNone(self.add_offer("missing").auction_ref_id)
+
+    def test_save_with_update_fields_links_the_auction(self):
+        offer = self.add_offer()
+        AuctionOffers.objects.filter(id=offer.id).update(auction_ref=None)
+        offer.auction_ref = None
+        offer.amount = 200
+        offer.save(update_fields=["amount"])
+        offer.refresh_from_db()
+
+        self.assertEqual((offer.amount, offer.auction_ref_id), (200, self.auction.id))
+
+    def test_rows_written_without_the_key_are_still_read_and_backfilled(self):
+        offer = self.add_offer()
+        # As written by a process older than the auction_ref keys
+        AuctionOffers.objects.filter(id=offer.id).update(auction_ref=None)
+        attach_by_auction_id([self.auction], {"offers": AuctionOffers.objects.all()})
+
+        self.assertEqual(self.auction.prefetched_offers, [offer])
+
+        call_command("backfill_auction_refs", stdout=StringIO())
+        offer.refresh_from_db()
+
+        self.assertEqual(offer.auction_ref_id, self.auction.id)
+
+
+class NormalizePricesTestCase(SimpleTestCase):
+    def setUp(self):
+        self.to_amount = import_module("auctions.migrations.0014_normalize_prices").to_amount
+
+    def test_amounts_are_cleaned_up_to_two_places(self):
+        for value, amount in (("1000", "1000.00"), (" $12,500.5 ", "12500.50"), ("99.999", "100.00"), ("0.005", "0.01"), ("-250", "-250.00"), (1500, "1500.00")):
+            with self.subTest(value):
+                self.assertEqual(self.to_amount(value), amount)
+
+    def test_blanks_and_text_are_not_amounts(self):
+        for value in ("", "  ", "$", "N/A", "12.5.0", "1e5", ".50", "10000000000"):
+            with self.subTest(value):
+                self.assertIsNone(self.to_amount(value))
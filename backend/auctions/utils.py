@@ -1,8 +1,18 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
-from auctions.models import Auctions, AuctionWon, AuctionOffers, AuctionBids
+from django.db import transaction
+from django.db.models import F, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from auctions.models import Auctions, AuctionWon, AuctionOffers, AuctionBids, AuctionProxies, AuctionNegotiations
+from auctions.search import mark_auctions_changed
+from auctions.tasks import send_auction_bid_won_email
 from communications.choices import PriorityChoices
-from communications.models import Notification
+from communications.utils import notification_event, notify, send_notifications
+from inspections.models import InspectionRequest
+
+# Auctions close this long after their first bid
+AUCTION_DURATION = timedelta(minutes=10)
 
 
 def handle_negotiation_bid(instance):
@@ -44,21 +54,11 @@ def handle_negotiation_bid(instance):
         instance.price_change_requested_by_seller = False
         instance.save()
 
-        buyer_user = buyer.users.first()
-        seller_user = inspection.dealer.users.first()
-
-        Notification.objects.create(
-            title="Auction Won",
-            text=f"Buyer and Seller agreed on a price ${instance.changed_amount} for auction {auction.auction_id}",
-            priority=PriorityChoices.HIGH,
-            user=buyer_user
-        )
-
-        Notification.objects.create(
+        notify(
             title="Auction Won",
             text=f"Buyer and Seller agreed on a price ${instance.changed_amount} for auction {auction.auction_id}",
             priority=PriorityChoices.HIGH,
-            user=seller_user
+            dealerships=[buyer, inspection.dealer_id]
         )
 
         # AuctionBids.objects.filter(id=bid_id.id, auction_id=auction_id).update(is_accepted=True)
@@ -75,3 +75,152 @@ def handle_negotiation_bid(instance):
 
     else:
         instance.save()
+
+
+def persist_bids(payloads):
+    """
+    Writes bids accepted by the bid engine and the notifications that go with
+    them. Called by the ``process_bid_queue`` worker in batches.
+    """
+    bids = []
+    notifications = []
+    summaries = {}
+    proxy_amounts = {}
+
+    for payload in payloads:
+        auction_id = payload["auction_id"]
+
+        bids.append(AuctionBids(
+            auction_id=auction_id,
+            auction_ref_id=payload["auction_pk"],
+            request_id_id=payload["request_id"],
+            buyer_id_id=payload["buyer_id"],
+            buyer_user_id_id=payload["buyer_user_id"] or None,
+            bid=payload["bid"],
+            status=0,
+        ))
+
+        bid_at = datetime.fromtimestamp(payload["created_at"], tz=timezone.utc)
+        summary = summaries.setdefault(payload["auction_pk"], {"first_bid_at": bid_at, "count": 0, "price": 0})
+        summary["first_bid_at"] = min(summary["first_bid_at"], bid_at)
+        summary["count"] += 1
+        summary["price"] = max(summary["price"], payload["bid"])
+        summary["latest"] = payload
+
+        if payload["proxy"]:
+            key = (auction_id, payload["buyer_id"])
+            proxy_amounts[key] = max(proxy_amounts.get(key, 0), payload["bid"])
+
+        if payload["proxy"] and payload.get("outbid_user_id"):
+            notifications.append(notification_event(
+                title="You bid has been crossed",
+                text=f"A buyer has posted a bid of ${payload['bid']} higher than your bid for auction {auction_id}",
+                priority=PriorityChoices.MEDIUM,
+                users=[payload["outbid_user_id"]]
+            ))
+        elif not payload["proxy"]:
+            notifications.append(notification_event(
+                title="You are the Highest Bidder",
+                text=f"You are the highest bidder for auction {auction_id}",
+                priority=PriorityChoices.MEDIUM,
+                dealerships=[payload["buyer_id"]]
+            ))
+
+        notifications.append(notification_event(
+            title="New Bid from buyer",
+            text=f"A buyer has posted a bid of ${payload['bid']} for auction {auction_id}",
+            priority=PriorityChoices.MEDIUM,
+            dealerships=[payload["seller_id"]]
+        ))
+
+    with transaction.atomic():
+        AuctionBids.objects.bulk_create(bids)
+
+        for auction_pk, summary in summaries.items():
+            highest_bid = AuctionBids.objects.filter(auction_id=summary["latest"]["auction_id"]).order_by("-bid", "-id").values("id")[:1]
+            Auctions.objects.filter(id=auction_pk).update(
+                last_bid_id=Subquery(highest_bid),
+                bid_count=F("bid_count") + summary["count"],
+                current_price=Greatest(Coalesce("current_price", 0), Value(summary["price"])),
+                first_bid_at=Coalesce("first_bid_at", Value(summary["first_bid_at"])),
+                closes_at=Coalesce("closes_at", Value(summary["first_bid_at"] + AUCTION_DURATION)),
+            )
+
+            payload = summary["latest"]
+            if payload["request_id"]:
+                InspectionRequest.objects.filter(id=payload["request_id"]).update(status=21, buyer_id=payload["buyer_id"])
+
+        for (auction_id, buyer_id), amount in proxy_amounts.items():
+            AuctionProxies.objects.filter(auction_id=auction_id, buyer_id=buyer_id).exclude(is_expire=1).update(bid_amount=amount)
+
+        mark_auctions_changed(summaries)
+        send_notifications(notifications)
+
+
+def close_auctions(auction_ids):
+    """
+    Closes the given live auctions and opens a negotiation with the highest
+    bidder. Used by the ``close_auctions`` scheduler.
+    """
+    with transaction.atomic():
+        auctions = list(
+            Auctions.objects.select_for_update(of=("self",))
+            .select_related("request_id", "dealer_id", "last_bid_id__buyer_id", "last_bid_id__buyer_user_id")
+            .filter(id__in=auction_ids, status=1)
+        )
+
+        if not auctions:
+            return []
+
+        Auctions.objects.filter(id__in=[auction.id for auction in auctions]).update(status=0)
+        mark_auctions_changed([auction.id for auction in auctions])
+
+        negotiations = []
+        notifications = []
+        winners = []
+
+        for auction in auctions:
+            bid = auction.last_bid_id
+
+            if not bid:
+                continue
+
+            # Bids placed before buyer users were recorded fall back to the dealership's first user
+            buyer_user = bid.buyer_user_id or bid.buyer_id.users.first()
+
+            negotiations.append(AuctionNegotiations(
+                auction_id=auction.auction_id,
+                auction_ref=auction,
+                request_id=auction.request_id,
+                dealer_id=auction.dealer_id,
+                buyer_id=bid.buyer_id,
+                bid_id=bid,
+                amount=bid.bid,
+                changed_amount=bid.bid,
+                price_change_requested_by_buyer=True
+            ))
+
+            notifications.append(notification_event(
+                title="Auction Bid Won",
+                text=f"Congratulations! You have won the bid with the highest bid of {bid.bid} for auction {auction.auction_id}",
+                priority=PriorityChoices.MEDIUM,
+                dealerships=[bid.buyer_id_id]
+            ))
+
+            notifications.append(notification_event(
+                title="Auction Bid Won",
+                text=f"A buyer named as {buyer_user.full_name} won the auction that have auction {auction.auction_id}",
+                priority=PriorityChoices.MEDIUM,
+                dealerships=[auction.dealer_id_id]
+            ))
+
+            if bid.buyer_user_id:
+                winners.append((bid.buyer_user_id, auction.auction_id))
+
+        AuctionNegotiations.objects.bulk_create(negotiations)
+        send_notifications(notifications)
+
+    for buyer_user, auction_id in winners:
+        send_auction_bid_won_email(buyer_user, auction_id)
+
+    return [auction.auction_id for auction in auctions]
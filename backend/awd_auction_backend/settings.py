@@ -90,6 +90,7 @@ AUTH_USER_MODEL = "users.User"
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_HEADERS = ["*"]
+CORS_EXPOSE_HEADERS = ["Link", "X-Total-Count", "X-Sync-Cursor"]
 ALLOWED_HOSTS = ["*"]
 
 STRIPE_TEST_PUBLIC_KEY = config("STRIPE_TEST_PUBLIC_KEY")
@@ -115,7 +116,7 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
-    # "DEFAULT_PAGINATION_CLASS": "v4u.core.paginations.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "utils.paginations.CursorPagination",
 }
 
 SIMPLE_JWT = {
@@ -184,6 +185,19 @@ DATABASES = {
 }
 
 
+REDIS_URL = config("REDIS_URL", default="redis://redis:6379/0")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": REDIS_URL,
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        },
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -1,7 +1,12 @@
 from django.urls import path
 
-from communications.api.v1.views import NotificationListAPIView
+from communications.api.v1.views import NotificationListAPIView, NotificationUnreadCountAPIView, NotificationMarkReadAPIView, \
+    NotificationMarkAllReadAPIView
 
 urlpatterns = [
     path("notifications/", NotificationListAPIView.as_view(), name="notifications_list"),
+    path("notifications/unread-count/", NotificationUnreadCountAPIView.as_view(), name="notifications_unread_count"),
+    path("notifications/mark-read/", NotificationMarkReadAPIView.as_view(), name="notifications_mark_read"),
+    path("notifications/<int:pk>/mark-read/", NotificationMarkReadAPIView.as_view(), name="notification_mark_read"),
+    path("notifications/mark-all-read/", NotificationMarkAllReadAPIView.as_view(), name="notifications_mark_all_read"),
 ]
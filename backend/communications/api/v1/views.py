@@ -1,13 +1,46 @@
 from rest_framework.generics import ListAPIView
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
 from communications.models import Notification
-from communications.api.v1.serializers import NotificationSerializer
+from communications.api.v1.serializers import NotificationSerializer, NotificationMarkReadSerializer
+from communications.utils import get_unread_count, mark_notifications_read
+from utils.paginations import SyncCursorPagination
 
 class NotificationListAPIView(ListAPIView):
     serializer_class = NotificationSerializer
+    pagination_class = SyncCursorPagination
+    filterset_fields = ["is_read", "priority"]
 
     def get_queryset(self):
-        notifications = Notification.objects.filter(user=self.request.user).order_by('-created_at')
+        return Notification.objects.filter(user=self.request.user)
+
+
+class NotificationUnreadCountAPIView(APIView):
+    def get(self, request):
+        return Response({"unread_count": get_unread_count(request.user.id)})
+
+
+class NotificationMarkReadAPIView(APIView):
+    def post(self, request, pk=None):
+        if pk is None:
+            serializer = NotificationMarkReadSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            ids = serializer.validated_data["ids"]
+        else:
+            ids = [pk]
+
+        updated = mark_notifications_read(request.user.id, ids)
+
+        return Response({"updated": updated, "unread_count": get_unread_count(request.user.id)})
+
+    patch = post
+
+
+class NotificationMarkAllReadAPIView(APIView):
+    def post(self, request):
+        updated = mark_notifications_read(request.user.id)
 
-        Notification.objects.filter(user=self.request.user).update(is_read=True)
+        return Response({"updated": updated, "unread_count": 0})
 
-        return notifications
+    patch = post
@@ -15,5 +15,10 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     user = models.ForeignKey("users.User", related_name="notifications", on_delete=models.CASCADE, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "created_at"]),
+        ]
+
     def __str__(self):
         return self.title
@@ -0,0 +1,114 @@
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+
+from communications.choices import PriorityChoices
+from communications.models import Notification
+from users.models import User
+
+UNREAD_COUNT_KEY = "notifications:unread:{}"
+UNREAD_COUNT_TIMEOUT = 60 * 60
+MARK_READ_BATCH_SIZE = 1000
+
+
+def notification_event(title, text, priority=PriorityChoices.LOW, users=(), dealerships=()):
+    """
+    One notification sent to ``users`` and to every user of ``dealerships``.
+    Both accept instances or ids; ``None`` entries are skipped.
+    """
+    return {"title": title, "text": text, "priority": priority, "users": users, "dealerships": dealerships}
+
+
+def _pk(value):
+    return getattr(value, "pk", value)
+
+
+def send_notifications(events):
+    """
+    Resolves the recipients of all ``events`` with a single users query and
+    writes the notifications with one ``bulk_create``. Each user gets an event
+    once, even when reached both directly and through a dealership.
+    """
+    dealership_ids = {_pk(dealership) for event in events for dealership in event["dealerships"]} - {None}
+    dealership_users = defaultdict(list)
+
+    if dealership_ids:
+        for dealer_id, user_id in User.objects.filter(dealer_id__in=dealership_ids).values_list("dealer_id", "id"):
+            dealership_users[dealer_id].append(user_id)
+
+    notifications = []
+
+    for event in events:
+        recipients = {_pk(user) for user in event["users"]} - {None}
+
+        for dealership in event["dealerships"]:
+            recipients.update(dealership_users.get(_pk(dealership), ()))
+
+        notifications.extend(
+            Notification(title=event["title"], text=event["text"], priority=event["priority"], user_id=user_id)
+            for user_id in sorted(recipients)
+        )
+
+    Notification.objects.bulk_create(notifications, batch_size=500)
+
+    unread = defaultdict(int)
+    for notification in notifications:
+        unread[notification.user_id] += 1
+
+    transaction.on_commit(lambda: adjust_unread_counts(unread))
+
+    return notifications
+
+
+def notify(title, text, priority=PriorityChoices.LOW, users=(), dealerships=()):
+    return send_notifications([notification_event(title, text, priority, users, dealerships)])
+
+
+def get_unread_count(user_id):
+    key = UNREAD_COUNT_KEY.format(user_id)
+    count = cache.get(key)
+
+    if count is None:
+        count = Notification.objects.filter(user_id=user_id, is_read=False).count()
+        cache.add(key, count, UNREAD_COUNT_TIMEOUT)
+
+    return max(count, 0)
+
+
+def adjust_unread_counts(deltas):
+    # Counters that aren't cached yet are left alone, the next read counts them
+    for user_id, delta in deltas.items():
+        if delta:
+            try:
+                cache.incr(UNREAD_COUNT_KEY.format(user_id), delta)
+            except ValueError:
+                pass
+
+
+def reset_unread_count(user_id):
+    cache.set(UNREAD_COUNT_KEY.format(user_id), 0, UNREAD_COUNT_TIMEOUT)
+
+
+def mark_notifications_read(user_id, ids=None):
+    """
+    Marks the given notifications, or all of them when ``ids`` is None, as read.
+    Only unread rows are touched, and "all" runs in id batches to keep each
+    UPDATE short.
+    """
+    unread = Notification.objects.filter(user_id=user_id, is_read=False)
+
+    if ids is not None:
+        updated = unread.filter(id__in=ids).update(is_read=True)
+        transaction.on_commit(lambda: adjust_unread_counts({user_id: -updated}))
+
+        return updated
+
+    updated = 0
+
+    while batch := list(unread.values_list("id", flat=True)[:MARK_READ_BATCH_SIZE]):
+        updated += Notification.objects.filter(id__in=batch).update(is_read=True)
+
+    transaction.on_commit(lambda: reset_unread_count(user_id))
+
+    return updated
@@ -1,6 +1,7 @@
 from django.contrib import admin
 
-from inspections.models import InspectionRequest, Inspector, InspectorWorkingDay, VehicleInspectionReport, CarAttributes
+from inspections.models import InspectionRequest, Inspector, InspectorWorkingDay, VehicleInspectionReport, CarAttributes, \
+    CarCatalog
 
 
 @admin.register(InspectionRequest)
@@ -10,6 +11,7 @@ class InspectionRequestAdmin(admin.ModelAdmin):
         "vin",
         "odometer",
     )
+    search_fields = ("=auction_id", "=stock_no", "^vin",)
     raw_id_fields = ("dealer", "inspection_location", "created_by", "updated_by",)
 
 
@@ -42,3 +44,14 @@ class CarAttributesAdmin(admin.ModelAdmin):
     list_display = (
         "id",
     )
+
+@admin.register(CarCatalog)
+class CarCatalogAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "year",
+        "make",
+        "model",
+        "trim",
+        "series",
+    )
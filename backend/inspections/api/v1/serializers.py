@@ -1,12 +1,24 @@
 from rest_framework import serializers
-from django.utils.crypto import get_random_string
 
-from arbitration.api.v1.serializers import ArbitrationTicketSerializer
+from arbitration.api.v1.serializers import ArbitrationTicketSerializer, TICKET_ARBITRATION_RELATED
 from inspections.models import InspectionRequest, Inspector, InspectorWorkingDay, VehicleInspectionReport, \
     ManualDelivery, ManualAttachment
 from users.models import Dealership, DealerLocation, User, Role
-from users.api.v1.serializers import DealershipSerializer, DealerLocationSerializer, UserDetailSerializer
+from users.api.v1.serializers import DealershipSerializer, DealerLocationSerializer, UserDetailSerializer, \
+    DEALERSHIP_RELATED, DEALER_LOCATION_RELATED, USER_DETAIL_RELATED
+from inspections.utils import CAR_ATTRIBUTE_FIELDS, CATALOG_FIELDS, media_folder, new_auction_id
+from utils.api.v1.serializers import RegisterSignedUploadsSerializer
 from utils.models import State
+from utils.prefetch import nested
+
+# Relations rendered by InspectionRequestSerializer, for list view prefetch plans
+INSPECTION_REQUEST_RELATED = (
+    *nested("dealer", DEALERSHIP_RELATED),
+    *nested("buyer_id", DEALERSHIP_RELATED),
+    *nested("inspector_assigned__user", USER_DETAIL_RELATED),
+    *nested("inspection_location", DEALER_LOCATION_RELATED),
+    *nested("arbitration_ticket_id", TICKET_ARBITRATION_RELATED),
+)
 
 
 class InspectorSerializer(serializers.ModelSerializer):
@@ -199,7 +211,7 @@ class InspectionRequestSerializer(serializers.ModelSerializer):
     clean = serializers.CharField(max_length=255, read_only=True)
     transmission = serializers.CharField(max_length=255, read_only=True)
     drivetrain = serializers.CharField(max_length=255, read_only=True)
-    reserve_price = serializers.CharField(max_length=255, read_only=True)
+    reserve_price = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
     lights = serializers.SerializerMethodField(read_only=True)
     has_blue = serializers.BooleanField(read_only=True)
     has_yellow = serializers.BooleanField(read_only=True)
@@ -305,7 +317,7 @@ class InspectionRequestSerializer(serializers.ModelSerializer):
         validated_data["dealer"] = self.context["request"].user.dealer
         inspection_location_id = validated_data.pop("inspection_location_id")
         validated_data["inspection_location"] = inspection_location_id
-        validated_data["auction_id"] = get_random_string(10, allowed_chars="0123456789")
+        validated_data["auction_id"] = new_auction_id()
 
         if validated_data.get("is_special") == 1:
             validated_data["status"] = 1
@@ -384,7 +396,7 @@ class MarkInspectionRequestCompleteSerializer(serializers.ModelSerializer):
 
 
 class SpecialityVehicleApproveSerializer(serializers.ModelSerializer):
-    expected_price = serializers.CharField(required=True)
+    expected_price = serializers.DecimalField(max_digits=12, decimal_places=2, required=True)
 
     class Meta:
         model = InspectionRequest
@@ -396,7 +408,7 @@ class SpecialityVehicleApproveSerializer(serializers.ModelSerializer):
         )
 
 class InspectionRequestUpdateSerializer(serializers.ModelSerializer):
-    reserve_price = serializers.IntegerField(required=True)
+    reserve_price = serializers.DecimalField(max_digits=12, decimal_places=2, required=True)
 
     class Meta:
         model = InspectionRequest
@@ -464,3 +476,71 @@ class ManualDeliveredSerializer(serializers.ModelSerializer):
         )
 
         return super().update(instance, validated_data)
+
+
+class InspectionMediaSignatureSerializer(serializers.Serializer):
+    field = serializers.CharField(max_length=255)
+
+    def validate_field(self, value):
+        if media_folder(self.context["inspection_request"], value) is None:
+            raise serializers.ValidationError("Unknown inspection media field")
+
+        return value
+
+
+class InspectionMediaRegisterSerializer(RegisterSignedUploadsSerializer):
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+
+        for upload in attrs["files"]:
+            if media_folder(self.context["inspection_request"], upload.get("field", "")) != attrs["folder"]:
+                raise serializers.ValidationError({"error": f"{upload['public_id']} needs a field that uploads to {attrs['folder']}"})
+
+        return attrs
+
+
+
+class CarAttributeAutocompleteSerializer(serializers.Serializer):
+    field = serializers.ChoiceField(choices=CAR_ATTRIBUTE_FIELDS)
+    q = serializers.CharField(max_length=255, required=False, allow_blank=True, default="")
+    limit = serializers.IntegerField(min_value=1, max_value=50, required=False, default=10)
+    year = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    make = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    model = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    trim = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    series = serializers.CharField(max_length=255, required=False, allow_blank=True)
+
+    def validate(self, attrs):
+        constraints = {field: attrs.pop(field) for field in CATALOG_FIELDS if field in attrs}
+        attrs["constraints"] = {field: value for field, value in constraints.items() if value and field != attrs["field"]}
+
+        if attrs["constraints"] and attrs["field"] not in CATALOG_FIELDS:
+            raise serializers.ValidationError({"error": f"Only {', '.join(CATALOG_FIELDS)} can be narrowed down by the other vehicle fields"})
+
+        return attrs
+
+
+class InspectionRequestSearchSerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=2, max_length=255)
+    limit = serializers.IntegerField(min_value=1, max_value=50, required=False, default=20)
+
+
+class InspectionRequestLookupSerializer(serializers.ModelSerializer):
+    dealership_name = serializers.CharField(source="dealer.dealership_name", read_only=True)
+
+    class Meta:
+        model = InspectionRequest
+        fields = (
+            "id",
+            "auction_id",
+            "vin",
+            "stock_no",
+            "year",
+            "make",
+            "model",
+            "trim",
+            "status",
+            "dealer_id",
+            "dealership_name",
+            "created_at",
+        )
@@ -5,7 +5,8 @@ from inspections.api.v1.views import InspectionRequestListCreateAPIView, Inspect
     AssignInspectorAPIView, InspectorRetrieveUpdateAPIView, InspectorAssignedTasksListAPIView, InspectionReportAPIView, \
     InspectorTaskRetrieveAPIView, MarkCompleteInspectionReportAPIView, SpecialityVehicleRequestListAPIView, \
     SpecialityVehicleApproveAPIView, SendToAuctionAPIView, UnAssignInspectorAPIView, InspectionReportDetailAPIView, \
-    CarAttributesListAPIView, UpdateManualDeliveredAPIView
+    CarAttributesListAPIView, CarAttributeAutocompleteAPIView, UpdateManualDeliveredAPIView, \
+    InspectionReportUploadSignatureAPIView, InspectionReportMediaAPIView, InspectionRequestSearchAPIView
 
 urlpatterns = [
     path("requests/", InspectionRequestListCreateAPIView.as_view(), name="inspection_request_list_create"),
@@ -19,11 +20,15 @@ urlpatterns = [
     path("inspector-tasks/", InspectorAssignedTasksListAPIView.as_view(), name="inspector_assigned_tasks_list"),
     path("inspector-task/<int:pk>/", InspectorTaskRetrieveAPIView.as_view(), name="inspector_task_retrieve"),
     path("inspection-report/<int:pk>/", InspectionReportAPIView.as_view(), name="inspection_report"),
+    path("inspection-report/<int:pk>/upload-signature/", InspectionReportUploadSignatureAPIView.as_view(), name="inspection_report_upload_signature"),
+    path("inspection-report/<int:pk>/media/", InspectionReportMediaAPIView.as_view(), name="inspection_report_media"),
     path("admin/inspection-report/<int:pk>/", InspectionReportDetailAPIView.as_view(), name="admin_inspection_report"),
     path("inspection-report/<int:pk>/mark-complete/", MarkCompleteInspectionReportAPIView.as_view(), name="mark_complete_inspection_report"),
     path("speciality-vehicle/requests/", SpecialityVehicleRequestListAPIView.as_view(), name="speciality_vehicle_requests"),
     path("speciality-vehicle/<int:pk>/approve/", SpecialityVehicleApproveAPIView.as_view(), name="speciality_vehicle_approve"),
     path("send-to-auctions/", SendToAuctionAPIView.as_view(), name="send_to_auctions"),
     path("car-attributes/", CarAttributesListAPIView.as_view(), name="car_attributes_list"),
+    path("car-attributes/autocomplete/", CarAttributeAutocompleteAPIView.as_view(), name="car_attributes_autocomplete"),
+    path("search/", InspectionRequestSearchAPIView.as_view(), name="inspection_request_search"),
     path("<int:pk>/manual-delivered/", UpdateManualDeliveredAPIView.as_view(), name="update_manual_delivered"),
 ]
\ No newline at end of file
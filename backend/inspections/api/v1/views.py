@@ -2,8 +2,11 @@ import datetime
 import json
 from collections import defaultdict
 
+from django.db import transaction
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework.views import APIView
 from rest_framework import status
 from rest_framework.generics import ListAPIView, CreateAPIView, RetrieveUpdateDestroyAPIView, ListCreateAPIView, RetrieveAPIView, UpdateAPIView, RetrieveUpdateAPIView
@@ -12,18 +15,23 @@ from rest_framework.response import Response
 
 from auctions.permissions import IsBuyerUserPermission
 from communications.choices import PriorityChoices
-from communications.models import Notification
+from communications.utils import notify
 from users.models import User
 from users.permissions import IsAdminUserPermission, IsInspectorPermission
 from inspections.permissions import IsSellerUserPermission
-from inspections.models import InspectionRequest, Inspector, VehicleInspectionReport, CarAttributes
+from inspections.models import InspectionRequest, Inspector, VehicleInspectionReport
 from inspections.api.v1.serializers import InspectionRequestSerializer, InspectionAssignCarAttributesSerializer, \
     InspectorSerializer, AssignInspectorSerializer, InspectionUpdateSerializer, VehicleInspectionSerializer, \
     VehicleInspectionDetailSerializer, MarkInspectionRequestCompleteSerializer, SpecialityVehicleApproveSerializer, \
-    InspectionRequestUpdateSerializer, ManualDeliveredSerializer
+    InspectionRequestUpdateSerializer, ManualDeliveredSerializer, InspectionMediaSignatureSerializer, \
+    InspectionMediaRegisterSerializer, CarAttributeAutocompleteSerializer, InspectionRequestSearchSerializer, \
+    InspectionRequestLookupSerializer
+from inspections.utils import add_car_attributes, add_report_images, car_attributes_version, get_attribute_index, \
+    get_car_attributes, lookup_inspection_requests, media_folder, report_images
 from auctions.models import Auctions
 from auctions.api.v1.serializers import SendToAuctionSerializer
-from utils.cloudinary import upload_file
+from utils.cloudinary import sign_upload, upload_files
+from utils.paginations import AdminCursorPagination
 
 
 class InspectionRequestListCreateAPIView(ListCreateAPIView):
@@ -48,11 +56,11 @@ class InspectionRequestListCreateAPIView(ListCreateAPIView):
         if instance.title_absent:
             instance.has_blue = True
 
-        Notification.objects.create(
+        notify(
             title="Inspection Request Created",
             text=f"A new inspection request with request id {instance.id} has been created by user {user.email}",
             priority=PriorityChoices.HIGH,
-            user=admin_user
+            users=[admin_user]
         )
 
         instance.save()
@@ -60,6 +68,7 @@ class InspectionRequestListCreateAPIView(ListCreateAPIView):
 
 class InspectionRequestAdminListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = InspectionRequestSerializer
 
     def get_queryset(self):
@@ -94,38 +103,12 @@ class InspectionAssignCarAttributesAPIView(UpdateAPIView):
     queryset = InspectionRequest.objects.filter(dealer__is_active=True)
 
     def perform_update(self, serializer):
-        instance = serializer.save()
-
-        car_attributes = []
-
-        car_fields = [
-            ('year', instance.year),
-            ('make', instance.make),
-            ('model', instance.model),
-            ('trim', instance.trim),
-            ('series', instance.series),
-            ('cylinders', instance.cylinders),
-            ('transmission', instance.transmission),
-            ('drivetrain', instance.drivetrain),
-            ('rough', instance.rough),
-            ('average', instance.average),
-            ('clean', instance.clean),
-        ]
-
-        for field, value in car_fields:
-            if value:
-                if not CarAttributes.objects.filter(key=field, value=value).exists():
-                    car_attributes.append(CarAttributes(
-                        key=field,
-                        value=value
-                    ))
-
-        if car_attributes:
-            CarAttributes.objects.bulk_create(car_attributes)
+        add_car_attributes(serializer.save())
 
 
 class InspectorListCreateAPIView(ListCreateAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = InspectorSerializer
     queryset = Inspector.objects.all()
 
@@ -144,11 +127,11 @@ class AssignInspectorAPIView(UpdateAPIView):
     def perform_update(self, serializer):
         instance = serializer.save(status=2)
 
-        Notification.objects.create(
+        notify(
             title="Inspector Assigned",
             text=f"You have been assigned as an inspector for inspection request with id {instance.id}",
             priority=PriorityChoices.MEDIUM,
-            user=instance.inspector_assigned.user
+            users=[instance.inspector_assigned.user_id]
         )
 
         super().perform_update(serializer)
@@ -248,29 +231,36 @@ class InspectionReportAPIView(APIView):
                 "demage_and_rust": {}
             }
 
-            # Upload each FILE field by its prefix
+            uploads = []
+            # Where each uploaded URL goes: a (section images, file field) slot or a list to append to
+            targets = []
+
+            # Section FILE fields by their prefix
             for name, file in request.FILES.items():
                 for section in images_dict:
                     if name.startswith(section):
-                        url = upload_file(file, f"auctions/{inspection_request}/{section}")
-                        images_dict[section][name] = url
+                        uploads.append((name, file, f"auctions/{inspection_request}/{section}"))
+                        targets.append((images_dict[section], name))
 
-            # Upload demage and rust files
+            # Demage, rust and obdii files
             demage_images = []
-            for file in request.FILES.getlist('demage_files'):
-                url = upload_file(file, f"auctions/{inspection_request}/demages")
-                demage_images.append(url)
-
             rust_images = []
-            for file in request.FILES.getlist('rust_files'):
-                url = upload_file(file, f"auctions/{inspection_request}/demages")
-                rust_images.append(url)
-
-            # Upload obdii files
             obdii_images = []
-            for file in request.FILES.getlist('obdii_files'):
-                url = upload_file(file, f"auctions/{inspection_request}/obdii")
-                obdii_images.append(url)
+            for field, images, folder in (("demage_files", demage_images, "demages"), ("rust_files", rust_images, "demages"), ("obdii_files", obdii_images, "obdii")):
+                for file in request.FILES.getlist(field):
+                    uploads.append((field, file, f"auctions/{inspection_request}/{folder}"))
+                    targets.append((images, None))
+
+            # All files go up concurrently, the slowest one sets the wait
+            variants = {}
+            for (images, name), asset in zip(targets, upload_files(uploads, variants=True)):
+                if name is None:
+                    images.append(asset.url)
+                else:
+                    images[name] = asset.url
+
+                if asset.variants:
+                    variants[asset.url] = asset.variants
 
             # Prepare structured JSON fields
             exterior = data.get("exterior") or {}
@@ -281,31 +271,39 @@ class InspectionReportAPIView(APIView):
             frame = data.get("frame") or {}
             drivability = data.get("drivability") or {}
 
-            exterior["images"] = images_dict.get("exterior") if images_dict.get("exterior") else None
-            interior["images"] = images_dict.get("interior") if images_dict.get("interior") else None
-            mechanical["images"] = images_dict.get("mechanical") if images_dict.get("mechanical") else None
-            wheels["images"] = images_dict.get("wheels") if images_dict.get("wheels") else None
-            warning_lights["images"] = {"obdii_files": obdii_images, **images_dict.get("warning_lights")}
+            # Photos already on the report (registered direct uploads or the last submission) stay unless replaced
+            previous = {section: report_images(report, section) for section in images_dict} if is_update else defaultdict(dict)
+
+            exterior["images"] = {**previous["exterior"], **images_dict["exterior"]} or None
+            interior["images"] = {**previous["interior"], **images_dict["interior"]} or None
+            mechanical["images"] = {**previous["mechanical"], **images_dict["mechanical"]} or None
+            wheels["images"] = {**previous["wheels"], **images_dict["wheels"]} or None
+            warning_lights["images"] = {
+                **previous["warning_lights"],
+                **images_dict.get("warning_lights"),
+                "obdii_files": obdii_images or previous["warning_lights"].get("obdii_files", []),
+            }
             demage_and_rust = {
                 "demage_notes": data.get("demage_notes", ""),
                 "rust_notes": data.get("rust_notes", ""),
                 "images": {
-                    "demage_files": demage_images,
-                    "rust_files": rust_images
+                    "demage_files": demage_images or previous["demage_and_rust"].get("demage_files", []),
+                    "rust_files": rust_images or previous["demage_and_rust"].get("rust_files", []),
                 }
             }
 
             report.request_id = inspection_request
             report.dealer_id = dealer_id
             report.inspector_id = inspector
-            report.exterior = json.dumps(exterior)
-            report.interior = json.dumps(interior)
-            report.mechanical = json.dumps(mechanical)
-            report.demage_and_rust = json.dumps(demage_and_rust)
-            report.wheels = json.dumps(wheels)
-            report.warning_lights = json.dumps(warning_lights)
-            report.frame = json.dumps(frame)
-            report.drivability = json.dumps(drivability)
+            report.exterior = exterior
+            report.interior = interior
+            report.mechanical = mechanical
+            report.demage_and_rust = demage_and_rust
+            report.wheels = wheels
+            report.warning_lights = warning_lights
+            report.frame = frame
+            report.drivability = drivability
+            report.image_variants = {**(report.image_variants or {}), **variants}
             report.yellow = int(data.get("yellow", False))
             report.red = int(data.get("red", False))
             report.green = int(data.get("green", False))
@@ -330,6 +328,51 @@ class InspectionReportAPIView(APIView):
             return Response(serializer.errors, status=400)
 
 
+class InspectionReportUploadSignatureAPIView(APIView):
+    permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsInspectorPermission]
+
+    def post(self, request, pk):
+        inspection_request = get_object_or_404(InspectionRequest, Q(id=pk, inspector_assigned=request.user.inspector.first()))
+
+        serializer = InspectionMediaSignatureSerializer(data=request.data, context={"inspection_request": inspection_request})
+        serializer.is_valid(raise_exception=True)
+
+        folder = media_folder(inspection_request, serializer.validated_data["field"])
+
+        return Response(sign_upload(folder, f"inspection-report:{pk}:{request.user.id}"))
+
+
+class InspectionReportMediaAPIView(APIView):
+    permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsInspectorPermission]
+
+    def post(self, request, pk):
+        inspection_request = get_object_or_404(InspectionRequest, Q(id=pk, inspector_assigned=request.user.inspector.first()))
+
+        serializer = InspectionMediaRegisterSerializer(
+            data=request.data,
+            context={"inspection_request": inspection_request, "target": f"inspection-report:{pk}:{request.user.id}"},
+        )
+
+        with transaction.atomic():
+            # Media is added to a report the inspector has already started
+            report = VehicleInspectionReport.objects.select_for_update().filter(request_id=inspection_request).first()
+
+            if report is None:
+                return Response({"error": "Inspection Report not found"}, status=status.HTTP_404_NOT_FOUND)
+
+            serializer.is_valid(raise_exception=True)
+            images = [(upload["field"], upload["url"]) for upload in serializer.validated_data["files"]]
+
+            add_report_images(report, images)
+            report.image_variants = {
+                **(report.image_variants or {}),
+                **{upload["url"]: upload["variants"] for upload in serializer.validated_data["files"] if upload.get("variants")},
+            }
+            report.save()
+
+        return Response({"images": [{"field": field, "url": url} for field, url in images]}, status=status.HTTP_201_CREATED)
+
+
 class MarkCompleteInspectionReportAPIView(RetrieveUpdateAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsInspectorPermission]
     serializer_class = MarkInspectionRequestCompleteSerializer
@@ -340,13 +383,12 @@ class MarkCompleteInspectionReportAPIView(RetrieveUpdateAPIView):
 
     def perform_update(self, serializer):
         instance = serializer.save(status=4)
-        dealer_user = instance.dealer.users.first()
 
-        Notification.objects.create(
+        notify(
             title="Inspection Report Generated",
             text=f"Inspection report has been generated by inspector for inspection request with id {instance.id}. Now you can send your vehicle to Auction",
             priority=PriorityChoices.MEDIUM,
-            user=dealer_user
+            dealerships=[instance.dealer_id]
         )
 
         super().perform_update(serializer)
@@ -354,6 +396,7 @@ class MarkCompleteInspectionReportAPIView(RetrieveUpdateAPIView):
 
 class SpecialityVehicleRequestListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = InspectionRequestSerializer
 
     def get_queryset(self):
@@ -386,26 +429,45 @@ class SendToAuctionAPIView(CreateAPIView):
         instance = serializer.save()
         admin_user = User.objects.filter(role__name="SUPER_ADMIN").first()
 
-        Notification.objects.create(
+        notify(
             title="Vehicle Sent To Auction",
             text=f"Vehicle with Auction id {instance.auction_id} has been sent to auction and added in the Run List.",
             priority=PriorityChoices.LOW,
-            user=admin_user
+            users=[admin_user]
         )
 
+
+def car_attributes_etag(request, *args, **kwargs):
+    return str(car_attributes_version())
+
+
 class CarAttributesListAPIView(APIView):
+    @method_decorator(condition(etag_func=car_attributes_etag))
+    def get(self, request, *args, **kwargs):
+        return Response(get_car_attributes(), status=status.HTTP_200_OK)
+
+
+class CarAttributeAutocompleteAPIView(APIView):
     def get(self, request, *args, **kwargs):
-        car_attributes_dict = defaultdict(list)
+        serializer = CarAttributeAutocompleteSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
 
-        car_attributes = CarAttributes.objects.all()
+        results = get_attribute_index().complete(data["field"], data["q"], data["constraints"], data["limit"])
 
-        for attribute in car_attributes:
-            if attribute.value not in car_attributes_dict[attribute.key]:
-                car_attributes_dict[attribute.key].append(attribute.value)
+        return Response({"field": data["field"], "results": results}, status=status.HTTP_200_OK)
+
+
+class InspectionRequestSearchAPIView(APIView):
+    permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+
+    def get(self, request, *args, **kwargs):
+        serializer = InspectionRequestSearchSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
 
-        car_attributes_dict = dict(car_attributes_dict)
+        results = lookup_inspection_requests(serializer.validated_data["q"], serializer.validated_data["limit"])
 
-        return Response(car_attributes_dict, status=status.HTTP_200_OK)
+        return Response({"results": InspectionRequestLookupSerializer(results, many=True).data}, status=status.HTTP_200_OK)
 
 
 class UpdateManualDeliveredAPIView(UpdateAPIView):
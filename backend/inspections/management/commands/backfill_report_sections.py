@@ -0,0 +1,50 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from inspections.models import VehicleInspectionReport
+from inspections.utils import REPORT_SECTIONS
+
+
+def decode_section(value):
+    # Older clients posted sections already encoded, which left JSON text inside the JSON column
+    decoded = value
+
+    while isinstance(decoded, str):
+        try:
+            decoded = json.loads(decoded)
+        except ValueError:
+            break
+
+    return decoded if isinstance(decoded, (dict, list)) else value
+
+
+class Command(BaseCommand):
+    help = "Decodes inspection report sections that were stored as JSON text and rebuilds the report summaries"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = VehicleInspectionReport.objects.only("id", "red", "yellow", "green", "purple", "image_variants", "summary", *REPORT_SECTIONS)
+        last_id = 0
+        checked = 0
+        decoded = 0
+
+        while batch := list(queryset.filter(id__gt=last_id).order_by("id")[:batch_size]):
+            last_id = batch[-1].id
+
+            for report in batch:
+                values = [getattr(report, section) for section in REPORT_SECTIONS]
+
+                for section, value in zip(REPORT_SECTIONS, values):
+                    setattr(report, section, decode_section(value))
+
+                decoded += values != [getattr(report, section) for section in REPORT_SECTIONS]
+                report.summary = report.build_summary()
+
+            VehicleInspectionReport.objects.bulk_update(batch, [*REPORT_SECTIONS, "summary"])
+            checked += len(batch)
+
+        self.stdout.write(f"Rebuilt summaries of {checked} inspection reports, decoded sections of {decoded}")
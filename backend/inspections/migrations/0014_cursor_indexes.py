@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arbitration', '0003_cursor_indexes'),
+        ('auctions', '0011_cursor_indexes'),
+        ('inspections', '0013_alter_inspectionrequest_arbitration_ticket_id'),
+        ('transportation', '0007_alter_transportationchargesslab_km_range_end_and_more'),
+        ('users', '0014_remove_transporter_city_name_and_more'),
+        ('utils', '0004_alter_city_status_alter_country_status_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='inspectionrequest',
+            index=models.Index(fields=['created_at', 'id'], name='inspections_created_3dacd5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inspector',
+            index=models.Index(fields=['created_at', 'id'], name='inspections_created_8c9443_idx'),
+        ),
+    ]
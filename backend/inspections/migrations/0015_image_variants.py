@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inspections', '0014_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vehicleinspectionreport',
+            name='image_variants',
+            field=models.JSONField(blank=True, db_comment='original image url -> resized variant urls', default=dict),
+        ),
+    ]
@@ -0,0 +1,87 @@
+import json
+
+from django.db import migrations, models
+
+SECTIONS = ("exterior", "interior", "mechanical", "demage_and_rust", "wheels", "warning_lights", "frame", "drivability")
+BATCH_SIZE = 1000
+
+
+def json_text(value):
+    # Blank sections become NULL and text that isn't JSON a JSON string, so the column conversion can't fail
+    if value is None or not value.strip():
+        return None
+
+    try:
+        json.loads(value)
+    except ValueError:
+        return json.dumps(value)
+
+    return value
+
+
+def prepare_sections(apps, schema_editor):
+    VehicleInspectionReport = apps.get_model("inspections", "VehicleInspectionReport")
+    last_id = 0
+
+    while rows := list(VehicleInspectionReport.objects.filter(id__gt=last_id).order_by("id").values_list("id", *SECTIONS)[:BATCH_SIZE]):
+        last_id = rows[-1][0]
+        changed = []
+
+        for id, *values in rows:
+            prepared = [json_text(value) for value in values]
+
+            if prepared != values:
+                changed.append(VehicleInspectionReport(id=id, **dict(zip(SECTIONS, prepared))))
+
+        VehicleInspectionReport.objects.bulk_update(changed, SECTIONS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inspections', '0015_image_variants'),
+    ]
+
+    operations = [
+        migrations.RunPython(prepare_sections, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='vehicleinspectionreport',
+            name='demage_and_rust',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='vehicleinspectionreport',
+            name='drivability',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='vehicleinspectionreport',
+            name='exterior',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='vehicleinspectionreport',
+            name='frame',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='vehicleinspectionreport',
+            name='interior',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='vehicleinspectionreport',
+            name='mechanical',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='vehicleinspectionreport',
+            name='warning_lights',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='vehicleinspectionreport',
+            name='wheels',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
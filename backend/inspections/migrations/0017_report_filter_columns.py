@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:47
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inspections', '0016_report_sections_json'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vehicleinspectionreport',
+            name='frame_damage',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(models.Q(('frame__radio__structural_announcements', 1), ('frame__radio__structural_announcements', '1'), ('frame__radio__penetrating_rust', 1), ('frame__radio__penetrating_rust', '1'), _connector='OR'), then=True), default=False), output_field=models.BooleanField()),
+        ),
+        migrations.AddField(
+            model_name='vehicleinspectionreport',
+            name='tire_issue_count',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.Case(models.When(models.Q(('wheels__radio__damaged_wheels', 1), ('wheels__radio__damaged_wheels', '1'), _connector='OR'), then=1), default=0), '+', models.Case(models.When(models.Q(('wheels__radio__damaged_tires', 1), ('wheels__radio__damaged_tires', '1'), _connector='OR'), then=1), default=0)), '+', models.Case(models.When(models.Q(('wheels__radio__uneven_tread_wear', 1), ('wheels__radio__uneven_tread_wear', '1'), _connector='OR'), then=1), default=0)), '+', models.Case(models.When(models.Q(('wheels__radio__mismatched_tires', 1), ('wheels__radio__mismatched_tires', '1'), _connector='OR'), then=1), default=0)), '+', models.Case(models.When(models.Q(('wheels__radio__incorrectly_sized_tires', 1), ('wheels__radio__incorrectly_sized_tires', '1'), _connector='OR'), then=1), default=0)), output_field=models.IntegerField()),
+        ),
+        migrations.AddField(
+            model_name='vehicleinspectionreport',
+            name='warning_light_count',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.Case(models.When(models.Q(('warning_lights__radio__check_engine_light', 1), ('warning_lights__radio__check_engine_light', '1'), _connector='OR'), then=1), default=0), '+', models.Case(models.When(models.Q(('warning_lights__radio__airbag_light', 1), ('warning_lights__radio__airbag_light', '1'), _connector='OR'), then=1), default=0)), '+', models.Case(models.When(models.Q(('warning_lights__radio__brake_or_abs_light', 1), ('warning_lights__radio__brake_or_abs_light', '1'), _connector='OR'), then=1), default=0)), '+', models.Case(models.When(models.Q(('warning_lights__radio__traction_control_light', 1), ('warning_lights__radio__traction_control_light', '1'), _connector='OR'), then=1), default=0)), '+', models.Case(models.When(models.Q(('warning_lights__radio__tpms_light', 1), ('warning_lights__radio__tpms_light', '1'), _connector='OR'), then=1), default=0)), '+', models.Case(models.When(models.Q(('warning_lights__radio__battery_or_charging_light', 1), ('warning_lights__radio__battery_or_charging_light', '1'), _connector='OR'), then=1), default=0)), '+', models.Case(models.When(models.Q(('warning_lights__radio__other_warning_light', 1), ('warning_lights__radio__other_warning_light', '1'), _connector='OR'), then=1), default=0)), output_field=models.IntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='vehicleinspectionreport',
+            index=models.Index(fields=['frame_damage'], name='inspections_frame_d_c0331f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vehicleinspectionreport',
+            index=models.Index(fields=['warning_light_count'], name='inspections_warning_006310_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vehicleinspectionreport',
+            index=models.Index(fields=['tire_issue_count'], name='inspections_tire_is_bcc930_idx'),
+        ),
+    ]
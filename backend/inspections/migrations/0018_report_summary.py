@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inspections', '0017_report_filter_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vehicleinspectionreport',
+            name='summary',
+            field=models.JSONField(blank=True, db_comment='lights, condition flags and thumbnail for list payloads, rebuilt on save', default=dict),
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def dedupe_car_attributes(apps, schema_editor):
+    # Keeps the first row of each (key, value), compared the way MySQL's case insensitive unique index will
+    CarAttributes = apps.get_model("inspections", "CarAttributes")
+    seen = set()
+    last_id = 0
+
+    while batch := list(CarAttributes.objects.filter(id__gt=last_id).order_by("id")[:BATCH_SIZE]):
+        last_id = batch[-1].id
+        duplicates = []
+        truncated = []
+
+        for attribute in batch:
+            key, value = (attribute.key or "").strip()[:64], (attribute.value or "").strip()[:255]
+
+            if not key or not value or (key.casefold(), value.casefold()) in seen:
+                duplicates.append(attribute.id)
+                continue
+
+            seen.add((key.casefold(), value.casefold()))
+
+            if (key, value) != (attribute.key, attribute.value):
+                attribute.key, attribute.value = key, value
+                truncated.append(attribute)
+
+        CarAttributes.objects.filter(id__in=duplicates).delete()
+        CarAttributes.objects.bulk_update(truncated, ["key", "value"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inspections', '0018_report_summary'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_car_attributes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='carattributes',
+            name='key',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AlterField(
+            model_name='carattributes',
+            name='value',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='carattributes',
+            constraint=models.UniqueConstraint(fields=('key', 'value'), name='unique_car_attribute'),
+        ),
+    ]
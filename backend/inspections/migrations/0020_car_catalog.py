@@ -0,0 +1,56 @@
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+CATALOG_FIELDS = {"year": 64, "make": 64, "model": 128, "trim": 128, "series": 64}
+
+
+def fill_car_catalog(apps, schema_editor):
+    InspectionRequest = apps.get_model("inspections", "InspectionRequest")
+    CarCatalog = apps.get_model("inspections", "CarCatalog")
+    seen = set()
+    last_id = 0
+
+    while rows := list(
+        InspectionRequest.objects.filter(id__gt=last_id, make__isnull=False).exclude(make="")
+        .order_by("id").values_list("id", *CATALOG_FIELDS)[:BATCH_SIZE]
+    ):
+        last_id = rows[-1][0]
+        entries = []
+
+        for id, *values in rows:
+            vehicle = {field: (value or "").strip()[:length] for (field, length), value in zip(CATALOG_FIELDS.items(), values)}
+            key = tuple(value.casefold() for value in vehicle.values())
+
+            if key not in seen:
+                seen.add(key)
+                entries.append(CarCatalog(**vehicle))
+
+        CarCatalog.objects.bulk_create(entries, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inspections', '0019_unique_car_attributes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CarCatalog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.CharField(blank=True, default='', max_length=64)),
+                ('make', models.CharField(blank=True, default='', max_length=64)),
+                ('model', models.CharField(blank=True, default='', max_length=128)),
+                ('trim', models.CharField(blank=True, default='', max_length=128)),
+                ('series', models.CharField(blank=True, default='', max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Car Catalog Entry',
+                'verbose_name_plural': 'Car Catalog',
+                'constraints': [models.UniqueConstraint(fields=('year', 'make', 'model', 'trim', 'series'), name='unique_car_catalog_entry')],
+            },
+        ),
+        migrations.RunPython(fill_car_catalog, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:04
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def prepare_auction_ids(apps, schema_editor):
+    InspectionRequest = apps.get_model("inspections", "InspectionRequest")
+    InspectionRequest.objects.filter(auction_id="").update(auction_id=None)
+    duplicates = list(
+        InspectionRequest.objects.exclude(auction_id=None).values("auction_id")
+        .annotate(requests=Count("id")).filter(requests__gt=1).values_list("auction_id", flat=True)[:20]
+    )
+
+    # Bids, tickets and jobs refer to requests by auction id alone, so which request they belong to has to be settled by hand
+    if duplicates:
+        raise RuntimeError(f"Inspection requests share the auction ids {', '.join(duplicates)}, give each a distinct one before migrating")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arbitration', '0003_cursor_indexes'),
+        ('auctions', '0011_cursor_indexes'),
+        ('inspections', '0020_car_catalog'),
+        ('transportation', '0008_cursor_indexes'),
+        ('users', '0016_coordinates'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(prepare_auction_ids, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='inspectionrequest',
+            name='vin_reversed',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Reverse('vin'), output_field=models.CharField(blank=True, max_length=255, null=True)),
+        ),
+        migrations.AlterField(
+            model_name='inspectionrequest',
+            name='auction_id',
+            field=models.CharField(blank=True, max_length=256, null=True, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='inspectionrequest',
+            index=models.Index(fields=['vin'], name='inspections_vin_157790_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inspectionrequest',
+            index=models.Index(fields=['vin_reversed'], name='inspections_vin_rev_4ca704_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inspectionrequest',
+            index=models.Index(fields=['stock_no'], name='inspections_stock_n_2c4664_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0012_auction_refs'),
+        ('inspections', '0021_request_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='manualdelivery',
+            name='auction_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='manual_deliveries', to='auctions.auctions'),
+        ),
+    ]
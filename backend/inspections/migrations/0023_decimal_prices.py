@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arbitration', '0004_ticket_auction_ref'),
+        ('auctions', '0014_normalize_prices'),
+        ('inspections', '0022_manual_delivery_auction_ref'),
+        ('transportation', '0009_auction_refs'),
+        ('users', '0016_coordinates'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='inspectionrequest',
+            name='expected_price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AlterField(
+            model_name='inspectionrequest',
+            name='reserve_price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='inspectionrequest',
+            index=models.Index(fields=['status', 'expected_price'], name='inspections_status_0c0631_idx'),
+        ),
+    ]
@@ -1,4 +1,48 @@
+from functools import reduce
+from operator import add, or_
+
 from django.db import models
+from django.db.models.functions import Reverse
+
+from auctions.models import AuctionReferenceMixin
+
+# Report radio answers buyers filter on, as paths into the section JSON
+FRAME_DAMAGE_ANSWERS = ("frame__radio__structural_announcements", "frame__radio__penetrating_rust")
+WARNING_LIGHT_ANSWERS = tuple(
+    f"warning_lights__radio__{light}" for light in (
+        "check_engine_light", "airbag_light", "brake_or_abs_light", "traction_control_light", "tpms_light",
+        "battery_or_charging_light", "other_warning_light",
+    )
+)
+TIRE_ISSUE_ANSWERS = tuple(
+    f"wheels__radio__{issue}" for issue in (
+        "damaged_wheels", "damaged_tires", "uneven_tread_wear", "mismatched_tires", "incorrectly_sized_tires",
+    )
+)
+
+
+def answered_yes(path):
+    # Clients send radio answers as 1 or "1"
+    return models.Q(**{path: 1}) | models.Q(**{path: "1"})
+
+
+def any_answered_yes(paths):
+    return models.Case(models.When(reduce(or_, map(answered_yes, paths)), then=True), default=False)
+
+
+def count_answered_yes(paths):
+    return reduce(add, (models.Case(models.When(answered_yes(path), then=1), default=0) for path in paths))
+
+
+def report_answered_yes(report, path):
+    # The same check as answered_yes, on a loaded report
+    section, *keys = path.split("__")
+    value = getattr(report, section)
+
+    for key in keys:
+        value = value.get(key) if isinstance(value, dict) else None
+
+    return value in (1, "1")
 
 
 class Inspector(models.Model):
@@ -20,16 +64,23 @@ class Inspector(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+        ]
+
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
 
 class InspectionRequest(models.Model):
     dealer = models.ForeignKey("users.Dealership", related_name="inspection_requests", on_delete=models.CASCADE)
-    auction_id = models.CharField(max_length=256, blank=True, null=True)
+    auction_id = models.CharField(unique=True, max_length=256, blank=True, null=True)
     auction_date = models.DateTimeField(blank=True, null=True)
     auction_status = models.IntegerField(default=0)
     vin = models.CharField(max_length=255, blank=True, null=True)
+    # Indexed so a search on the last characters of a VIN is a prefix range too
+    vin_reversed = models.GeneratedField(expression=Reverse("vin"), output_field=models.CharField(max_length=255, blank=True, null=True), db_persist=True)
     older_model = models.IntegerField(blank=True, null=True)
     stock_no = models.CharField(max_length=255, blank=True, null=True)
     days_on_lot = models.CharField(max_length=255, blank=True, null=True)
@@ -58,8 +109,8 @@ class InspectionRequest(models.Model):
     description = models.TextField(blank=True, null=True)
     is_special = models.IntegerField(blank=True, null=True)
     speciality_notes = models.TextField(blank=True, null=True)
-    expected_price = models.CharField(max_length=255, blank=True, null=True)
-    reserve_price = models.TextField(blank=True, null=True)
+    expected_price = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    reserve_price = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
     ready_to_sell = models.TextField(blank=True, null=True)
     live_appraisal = models.TextField(blank=True, null=True)
     auction_type = models.TextField(blank=True, null=True, db_comment='1 = start bidding $0 , 2 = start the bid at 50% of reserve price , 3 = $3,000 less than reserve price.')
@@ -102,6 +153,13 @@ class InspectionRequest(models.Model):
 
     class Meta:
         verbose_name_plural = "Inspection Requests"
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+            models.Index(fields=["vin"]),
+            models.Index(fields=["vin_reversed"]),
+            models.Index(fields=["stock_no"]),
+            models.Index(fields=["status", "expected_price"]),
+        ]
 
 
 class InspectorAssignedRequest(models.Model):
@@ -174,18 +232,23 @@ class VehicleInspectionReport(models.Model):
     request_id = models.ForeignKey("inspections.InspectionRequest", related_name="inspection_reports", on_delete=models.CASCADE)
     dealer_id = models.ForeignKey("users.Dealership", related_name="inspection_reports", on_delete=models.CASCADE)
     inspector_id = models.ForeignKey("inspections.Inspector", related_name="inspection_reports", on_delete=models.CASCADE)
-    exterior = models.TextField(blank=True, null=True)
-    interior = models.TextField(blank=True, null=True)
-    mechanical = models.TextField(blank=True, null=True)
-    demage_and_rust = models.TextField(blank=True, null=True)
-    wheels = models.TextField(blank=True, null=True)
-    warning_lights = models.TextField(blank=True, null=True)
-    frame = models.TextField(blank=True, null=True)
-    drivability = models.TextField(blank=True, null=True)
+    exterior = models.JSONField(blank=True, null=True)
+    interior = models.JSONField(blank=True, null=True)
+    mechanical = models.JSONField(blank=True, null=True)
+    demage_and_rust = models.JSONField(blank=True, null=True)
+    wheels = models.JSONField(blank=True, null=True)
+    warning_lights = models.JSONField(blank=True, null=True)
+    frame = models.JSONField(blank=True, null=True)
+    drivability = models.JSONField(blank=True, null=True)
+    frame_damage = models.GeneratedField(expression=any_answered_yes(FRAME_DAMAGE_ANSWERS), output_field=models.BooleanField(), db_persist=True)
+    warning_light_count = models.GeneratedField(expression=count_answered_yes(WARNING_LIGHT_ANSWERS), output_field=models.IntegerField(), db_persist=True)
+    tire_issue_count = models.GeneratedField(expression=count_answered_yes(TIRE_ISSUE_ANSWERS), output_field=models.IntegerField(), db_persist=True)
     yellow = models.IntegerField(blank=True, null=True)
     red = models.IntegerField(blank=True, null=True)
     green = models.IntegerField(blank=True, null=True)
     purple = models.IntegerField(blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True, db_comment='original image url -> resized variant urls')
+    summary = models.JSONField(default=dict, blank=True, db_comment='lights, condition flags and thumbnail for list payloads, rebuilt on save')
     created_by = models.ForeignKey("users.User", on_delete=models.SET_NULL, null=True, blank=True, related_name="created_inspection_reports")
     updated_by = models.ForeignKey("users.User", on_delete=models.SET_NULL, null=True, blank=True, related_name="updated_inspection_reports")
     deleted_at = models.DateTimeField(blank=True, null=True)
@@ -195,6 +258,34 @@ class VehicleInspectionReport(models.Model):
     class Meta:
         verbose_name = "Vehicle Inspection Report"
         verbose_name_plural = "Vehicle Inspection Reports"
+        indexes = [
+            models.Index(fields=["frame_damage"]),
+            models.Index(fields=["warning_light_count"]),
+            models.Index(fields=["tire_issue_count"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.summary = self.build_summary()
+
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "summary"}
+
+        super().save(*args, **kwargs)
+
+    def build_summary(self):
+        images = self.exterior.get("images") if isinstance(self.exterior, dict) else None
+        hero = next((url for url in (images or {}).values() if url and isinstance(url, str)), None)
+
+        return {
+            "red": self.red,
+            "yellow": self.yellow,
+            "green": self.green,
+            "purple": self.purple,
+            "frame_damage": any(report_answered_yes(self, path) for path in FRAME_DAMAGE_ANSWERS),
+            "warning_light_count": sum(report_answered_yes(self, path) for path in WARNING_LIGHT_ANSWERS),
+            "tire_issue_count": sum(report_answered_yes(self, path) for path in TIRE_ISSUE_ANSWERS),
+            "thumbnail": (self.image_variants or {}).get(hero, {}).get("thumb", hero) if hero else None,
+        }
 
 
 class InspectionSampleImages(models.Model):
@@ -210,14 +301,36 @@ class InspectionSampleImages(models.Model):
 
 
 class CarAttributes(models.Model):
-    key = models.CharField(max_length=765, blank=True, null=True)
-    value = models.CharField(max_length=765, blank=True, null=True)
+    key = models.CharField(max_length=64, blank=True, null=True)
+    value = models.CharField(max_length=255, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["key", "value"], name="unique_car_attribute"),
+        ]
+
+
+class CarCatalog(models.Model):
+    year = models.CharField(max_length=64, blank=True, default="")
+    make = models.CharField(max_length=64, blank=True, default="")
+    model = models.CharField(max_length=128, blank=True, default="")
+    trim = models.CharField(max_length=128, blank=True, default="")
+    series = models.CharField(max_length=64, blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Car Catalog Entry"
+        verbose_name_plural = "Car Catalog"
+        constraints = [
+            models.UniqueConstraint(fields=["year", "make", "model", "trim", "series"], name="unique_car_catalog_entry"),
+        ]
+
 
-class ManualDelivery(models.Model):
+class ManualDelivery(AuctionReferenceMixin, models.Model):
     auction_id = models.CharField(max_length=255, blank=True, null=True)
+    auction_ref = models.ForeignKey("auctions.Auctions", related_name="manual_deliveries", on_delete=models.SET_NULL, null=True, blank=True)
     request_id = models.ForeignKey("inspections.InspectionRequest", related_name="manual_deliveries", blank=True, null=True, on_delete=models.SET_NULL)
     delivered_date = models.DateField(blank=True, null=True)
     recipient_first_name = models.CharField(max_length=765, blank=True, null=True)
@@ -1,3 +1,201 @@
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from inspections import utils
+from inspections.models import CarAttributes, CarCatalog, InspectionRequest, Inspector, VehicleInspectionReport
+from inspections.utils import AttributeIndex, add_car_attributes, lookup_inspection_requests
+from users.models import Dealership, Role, User
+
+
+def create_user(email, role_name, dealership_name):
+    role, _ = Role.objects.get_or_create(name=role_name, defaults={"status": 1})
+    dealer = Dealership.objects.create(dealership_name=dealership_name)
+
+    return User.objects.create(first_name=dealership_name, last_name="User", email=email, role=role, dealer=dealer)
+
+
+def reset_car_attributes(test_case):
+    # The facets and the prefix index are cached per process and in the shared cache
+    cache.clear()
+    utils._car_attributes = (None, None)
+    utils._car_attribute_pairs = (None, set())
+    utils._attribute_index = (None, AttributeIndex())
+    test_case.addCleanup(cache.clear)
+
+
+class CarAttributesListTestCase(TestCase):
+    def setUp(self):
+        reset_car_attributes(self)
+        CarAttributes.objects.create(key="make", value="Honda")
+        CarAttributes.objects.create(key="make", value="Ford")
+        CarAttributes.objects.create(key="year", value="2020")
+        self.client = APIClient()
+        self.client.force_authenticate(create_user("seller@example.com", "SELLER", "Seller"))
+
+    def get(self, etag=None):
+        headers = {"If-None-Match": etag} if etag else {}
+
+        return self.client.get(reverse("car_attributes_list"), headers=headers)
+
+    def test_lists_values_by_key_with_an_etag(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"make": ["Honda", "Ford"], "year": ["2020"]})
+        self.assertTrue(response.headers["ETag"])
+
+    def test_unchanged_attributes_answer_not_modified(self):
+        etag = self.get().headers["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.get(etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_new_values_change_the_etag(self):
+        etag = self.get().headers["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            add_car_attributes(InspectionRequest(year="2020", make="Toyota", model="Camry"))
+
+        response = self.get(etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.data["make"], ["Honda", "Ford", "Toyota"])
+        self.assertEqual(response.data["model"], ["Camry"])
+
+    def test_known_values_keep_the_etag(self):
+        CarCatalog.objects.create(year="2020", make="Honda")
+        etag = self.get().headers["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            add_car_attributes(InspectionRequest(year="2020", make="Honda"))
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.get(etag).status_code, 304)
+        self.assertEqual(CarAttributes.objects.count(), 3)
+
+
+class AttributeIndexTestCase(TestCase):
+    def setUp(self):
+        reset_car_attributes(self)
+
+        for value in ("Honda", "hyundai", "Ford", "Hummer"):
+            CarAttributes.objects.create(key="make", value=value)
+
+        for year, make, model in (("2020", "Honda", "Civic"), ("2020", "Honda", "CR-V"), ("2021", "Honda", "Accord"), ("2020", "Ford", "Focus")):
+            CarCatalog.objects.create(year=year, make=make, model=model)
+
+        self.index = AttributeIndex()
+        self.index.refresh()
+
+    def test_prefix_matches_ignore_case_in_sorted_order(self):
+        self.assertEqual(self.index.complete("make", "h"), ["Honda", "Hummer", "hyundai"])
+        self.assertEqual(self.index.complete("make", "HU"), ["Hummer"])
+        self.assertEqual(self.index.complete("make", "h", limit=2), ["Honda", "Hummer"])
+        self.assertEqual(self.index.complete("make", "x"), [])
+        self.assertEqual(self.index.complete("trim", "a"), [])
+
+    def test_constraints_narrow_to_catalog_entries(self):
+        self.assertEqual(self.index.complete("model", "", {"make": "honda"}), ["Accord", "Civic", "CR-V"])
+        self.assertEqual(self.index.complete("model", "c", {"make": "Honda", "year": "2020"}), ["Civic", "CR-V"])
+        self.assertEqual(self.index.complete("model", "", {"make": "Toyota"}), [])
+
+    def test_refresh_loads_only_new_rows(self):
+        CarAttributes.objects.create(key="make", value="Hino")
+        CarCatalog.objects.create(year="2022", make="Honda", model="Civic")
+
+        with self.assertNumQueries(2):
+            self.index.refresh()
+
+        self.assertEqual(self.index.complete("make", "hi"), ["Hino"])
+        self.assertEqual(self.index.complete("year", "", {"model": "civic"}), ["2020", "2022"])
+
+    def test_autocomplete_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(create_user("seller@example.com", "SELLER", "Seller"))
+        url = reverse("car_attributes_autocomplete")
+
+        response = client.get(url, {"field": "model", "q": "c", "make": "Honda", "year": "2020"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"field": "model", "results": ["Civic", "CR-V"]})
+        self.assertEqual(client.get(url, {"field": "cylinders", "make": "Honda"}).status_code, 400)
+
+
+class InspectionRequestLookupTestCase(TestCase):
+    def setUp(self):
+        self.dealer = Dealership.objects.create(dealership_name="Seller")
+        self.civic = self.add_request("1000000001", "STK1", "1HGCM82633A004352")
+        self.accord = self.add_request("1000000002", "STK2", "1HGCM82633A009999")
+        self.focus = self.add_request("1000000003", "4352", "1FAFP34N55W004352")
+
+    def add_request(self, auction_id, stock_no, vin):
+        return InspectionRequest.objects.create(dealer=self.dealer, auction_id=auction_id, stock_no=stock_no, vin=vin, manual_delivered=0, via_api=0)
+
+    def lookup(self, query, limit=20):
+        return [inspection_request.id for inspection_request in lookup_inspection_requests(query, limit)]
+
+    def test_exact_auction_id_stock_number_and_vin(self):
+        self.assertEqual(self.lookup(" 1000000002 "), [self.accord.id])
+        self.assertEqual(self.lookup("STK1"), [self.civic.id])
+        self.assertEqual(self.lookup("1FAFP34N55W004352"), [self.focus.id])
+
+    def test_vin_prefix_and_suffix(self):
+        self.assertEqual(self.lookup("1hgcm"), [self.accord.id, self.civic.id])
+        self.assertEqual(self.lookup("9999"), [self.accord.id])
+
+    def test_exact_matches_come_before_fragments(self):
+        self.assertEqual(self.lookup("4352"), [self.focus.id, self.civic.id])
+        self.assertEqual(self.lookup("4352", limit=1), [self.focus.id])
+
+    def test_short_queries_only_match_whole_values(self):
+        self.assertEqual(self.lookup("1HG"), [])
+        self.assertEqual(self.lookup("STK"), [])
+
+    def test_search_endpoint_is_for_admins(self):
+        client = APIClient()
+        client.force_authenticate(create_user("seller@example.com", "SELLER", "Seller"))
+        self.assertEqual(client.get(reverse("inspection_request_search"), {"q": "STK1"}).status_code, 403)
+
+        client.force_authenticate(create_user("admin@example.com", "ADMIN", "Admin"))
+        response = client.get(reverse("inspection_request_search"), {"q": "STK1"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result["id"] for result in response.data["results"]], [self.civic.id])
+        self.assertEqual(response.data["results"][0]["dealership_name"], "Seller")
+
+
+class InspectionReportMediaTestCase(TestCase):
+    def setUp(self):
+        self.inspector = create_user("inspector@example.com", "INSPECTOR", "Inspections")
+        Inspector.objects.create(user=self.inspector)
+        self.other = create_user("other@example.com", "INSPECTOR", "Other Inspections")
+        Inspector.objects.create(user=self.other)
+        seller = Dealership.objects.create(dealership_name="Seller")
+        self.request = InspectionRequest.objects.create(
+            dealer=seller, auction_id="A1", inspector_assigned=self.inspector.inspector.first(), manual_delivered=0, via_api=0
+        )
+        self.client = APIClient()
+
+    @mock.patch("inspections.api.v1.views.sign_upload", lambda folder, target: {"folder": folder})
+    def test_only_the_assigned_inspector_signs_uploads(self):
+        url = reverse("inspection_report_upload_signature", args=[self.request.id])
+
+        self.client.force_authenticate(self.other)
+        self.assertEqual(self.client.post(url, {"field": "demage_files"}, format="json").status_code, 404)
+
+        self.client.force_authenticate(self.inspector)
+        self.assertEqual(self.client.post(url, {"field": "demage_files"}, format="json").status_code, 200)
+
+    def test_media_needs_a_started_report(self):
+        self.client.force_authenticate(self.inspector)
+        response = self.client.post(reverse("inspection_report_media", args=[self.request.id]), {"token": "x", "files": []}, format="json")
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(VehicleInspectionReport.objects.exists())
@@ -0,0 +1,306 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils.crypto import get_random_string
+
+from inspections.models import CarAttributes, CarCatalog, InspectionRequest
+
+REPORT_SECTIONS = ("exterior", "interior", "mechanical", "demage_and_rust", "wheels", "warning_lights", "frame", "drivability")
+REPORT_SUMMARY_FIELDS = ("id", "request_id", "summary", "created_at")
+CAR_ATTRIBUTE_FIELDS = ("year", "make", "model", "trim", "series", "cylinders", "transmission", "drivetrain", "rough", "average", "clean")
+# The vehicle fields recorded together in CarCatalog, from the widest to the narrowest
+CATALOG_FIELDS = ("year", "make", "model", "trim", "series")
+CAR_ATTRIBUTES_VERSION_KEY = "inspections:car-attributes:version"
+CAR_ATTRIBUTES_KEY = "inspections:car-attributes:{}"
+# Bounds how long attribute edits made outside the API (admin, shell) take to show up
+CAR_ATTRIBUTES_TIMEOUT = 60 * 60
+# Shortest VIN fragment looked up by its first or last characters, shorter queries only match whole values
+MIN_VIN_FRAGMENT = 4
+IMAGE_SECTIONS = ("exterior", "interior", "mechanical", "wheels", "warning_lights", "demage_and_rust")
+# Fields that carry several files, with the section they're listed under and the folder they go to
+IMAGE_LISTS = {
+    "demage_files": ("demage_and_rust", "demages"),
+    "rust_files": ("demage_and_rust", "demages"),
+    "obdii_files": ("warning_lights", "obdii"),
+}
+
+
+def image_section(field):
+    if field in IMAGE_LISTS:
+        return IMAGE_LISTS[field][0]
+
+    return next((section for section in IMAGE_SECTIONS if field.startswith(section)), None)
+
+
+def media_folder(inspection_request, field):
+    """The Cloudinary folder a report file field uploads to, ``None`` for unknown fields."""
+    if field in IMAGE_LISTS:
+        return f"auctions/{inspection_request}/{IMAGE_LISTS[field][1]}"
+
+    section = image_section(field)
+
+    return f"auctions/{inspection_request}/{section}" if section else None
+
+
+def new_auction_id():
+    """A random 10 digit auction id that no inspection request has yet."""
+    while True:
+        auction_id = get_random_string(10, allowed_chars="0123456789")
+
+        if not InspectionRequest.objects.filter(auction_id=auction_id).exists():
+            return auction_id
+
+
+def lookup_inspection_requests(query, limit=20):
+    """
+    Up to ``limit`` inspection requests whose auction id, stock number or VIN
+    is ``query``, then those whose VIN starts or ends with it, newest first
+    within each. Every lookup is one range on its own index.
+    """
+    query = query.strip()
+    lookups = [Q(auction_id=query), Q(stock_no=query), Q(vin=query)]
+
+    if len(query) >= MIN_VIN_FRAGMENT:
+        lookups += [Q(vin__istartswith=query), Q(vin_reversed__istartswith=query[::-1])]
+
+    found = {}
+
+    for lookup in lookups:
+        if len(found) >= limit:
+            break
+
+        queryset = InspectionRequest.objects.select_related("dealer").filter(lookup).exclude(id__in=list(found))
+
+        for inspection_request in queryset.order_by("-id")[:limit - len(found)]:
+            found[inspection_request.id] = inspection_request
+
+    return list(found.values())
+
+
+def report_summaries(reports):
+    """
+    List payload entries for inspection reports loaded with
+    ``REPORT_SUMMARY_FIELDS``, the full report is served by
+    ``InspectionReportDetailAPIView``.
+    """
+    return [{"id": report.id, "created_at": report.created_at, **report.summary} for report in reports] or None
+
+
+def report_section(report, section):
+    value = getattr(report, section)
+
+    return value if isinstance(value, dict) else {}
+
+
+def report_images(report, section):
+    return report_section(report, section).get("images") or {}
+
+
+def add_report_images(report, images):
+    """
+    Adds ``(field, url)`` images to the report sections: single photo fields
+    take the slot of their field, multi-file fields are appended to.
+    """
+    sections = {}
+
+    for field, url in images:
+        section = image_section(field)
+
+        if section not in sections:
+            sections[section] = dict(report_section(report, section))
+
+        slots = sections[section].get("images") or {}
+
+        if field in IMAGE_LISTS:
+            slots[field] = [*slots.get(field, []), url]
+        else:
+            slots[field] = url
+
+        sections[section]["images"] = slots
+
+    for section, data in sections.items():
+        setattr(report, section, data)
+
+
+_car_attributes = (None, None)
+_car_attribute_pairs = (None, set())
+
+
+def car_attributes_version():
+    version = cache.get(CAR_ATTRIBUTES_VERSION_KEY)
+
+    if version is None:
+        cache.add(CAR_ATTRIBUTES_VERSION_KEY, time.time_ns(), CAR_ATTRIBUTES_TIMEOUT)
+        version = cache.get(CAR_ATTRIBUTES_VERSION_KEY)
+
+    return version
+
+
+def get_car_attributes():
+    """
+    ``{key: [values]}`` of every ``CarAttributes`` row, in insertion order.
+    Kept per process and in the shared cache under the current version, so
+    it's built once per change whatever the size of the table.
+    """
+    global _car_attributes
+
+    version = car_attributes_version()
+
+    if _car_attributes[0] is None or _car_attributes[0] != version:
+        facets = cache.get(CAR_ATTRIBUTES_KEY.format(version))
+
+        if facets is None:
+            facets = {}
+            for key, value in CarAttributes.objects.order_by("id").values_list("key", "value"):
+                facets.setdefault(key, []).append(value)
+            cache.set(CAR_ATTRIBUTES_KEY.format(version), facets, CAR_ATTRIBUTES_TIMEOUT)
+
+        _car_attributes = (version, facets)
+
+    return _car_attributes[1]
+
+
+def car_attribute_pairs():
+    """``(key, value)`` set of ``get_car_attributes``, rebuilt along with it."""
+    global _car_attribute_pairs
+
+    facets = get_car_attributes()
+
+    if _car_attribute_pairs[0] is not facets:
+        _car_attribute_pairs = (facets, {(key, value) for key, values in facets.items() for value in values})
+
+    return _car_attribute_pairs[1]
+
+
+def invalidate_car_attributes():
+    transaction.on_commit(lambda: cache.set(CAR_ATTRIBUTES_VERSION_KEY, time.time_ns(), CAR_ATTRIBUTES_TIMEOUT))
+
+
+def catalog_entry(instance):
+    """The ``CarCatalog`` values of an inspection request, cut to the column sizes, or ``None`` without a make."""
+    if not instance.make:
+        return None
+
+    return {
+        field: (getattr(instance, field) or "").strip()[:CarCatalog._meta.get_field(field).max_length]
+        for field in CATALOG_FIELDS
+    }
+
+
+def add_car_attributes(instance):
+    """
+    Records the ``CAR_ATTRIBUTE_FIELDS`` values and the catalog entry of an
+    inspection request, in one insert each. The unique constraints skip
+    values that already exist; the caches are only invalidated for new ones.
+    """
+    pairs = [(field, getattr(instance, field)) for field in CAR_ATTRIBUTE_FIELDS if getattr(instance, field)]
+    new = not car_attribute_pairs().issuperset(pairs)
+    entry = catalog_entry(instance)
+
+    if entry and tuple(value.casefold() for value in entry.values()) in get_attribute_index().vehicles:
+        entry = None
+
+    if pairs:
+        CarAttributes.objects.bulk_create([CarAttributes(key=key, value=value) for key, value in pairs], ignore_conflicts=True)
+
+    if entry:
+        CarCatalog.objects.bulk_create([CarCatalog(**entry)], ignore_conflicts=True)
+
+    if new or entry:
+        invalidate_car_attributes()
+
+
+class AttributeIndex:
+    """
+    Prefix index for car attribute autocomplete.
+
+    The values of every ``CarAttributes`` key sit in an array of
+    ``(casefolded, value)`` pairs kept sorted, so a prefix is the range
+    between two binary searches. ``CarCatalog`` entries get a set of ids per
+    (field, value) to answer prefixes under constraints, such as the models
+    of a make and year. ``refresh`` only loads rows added since its last run.
+    """
+
+    def __init__(self):
+        self.values = defaultdict(list)
+        self.entries = {}
+        self.vehicles = set()
+        self.postings = defaultdict(set)
+        self.last_attribute_id = 0
+        self.last_entry_id = 0
+        self.lock = threading.Lock()
+
+    def refresh(self):
+        with self.lock:
+            attributes = CarAttributes.objects.filter(id__gt=self.last_attribute_id).order_by("id").values_list("id", "key", "value")
+            for id, key, value in attributes:
+                self.add_value(key, value)
+                self.last_attribute_id = id
+
+            for id, *vehicle in CarCatalog.objects.filter(id__gt=self.last_entry_id).order_by("id").values_list("id", *CATALOG_FIELDS):
+                self.add_entry(id, vehicle)
+                self.last_entry_id = id
+
+    def add_value(self, key, value):
+        if not key or not value:
+            return
+
+        values = self.values[key]
+        folded = value.casefold()
+        index = bisect_left(values, folded, key=lambda pair: pair[0])
+
+        if index == len(values) or values[index][0] != folded:
+            values.insert(index, (folded, value))
+
+    def add_entry(self, id, vehicle):
+        self.entries[id] = vehicle
+        self.vehicles.add(tuple(value.casefold() for value in vehicle))
+
+        for field, value in zip(CATALOG_FIELDS, vehicle):
+            if value:
+                self.postings[field, value.casefold()].add(id)
+
+    def complete(self, field, prefix="", constraints=None, limit=10):
+        """Up to ``limit`` values of ``field`` starting with ``prefix``, within the ``{field: value}`` constraints."""
+        prefix = prefix.casefold()
+        constraints = {name: value.casefold() for name, value in (constraints or {}).items() if value}
+
+        if not constraints:
+            values = self.values.get(field, [])
+            start = bisect_left(values, prefix, key=lambda pair: pair[0])
+            end = bisect_left(values, prefix + "\U0010ffff", lo=start, key=lambda pair: pair[0])
+
+            return [value for folded, value in values[start:min(end, start + limit)]]
+
+        ids = set.intersection(*sorted((self.postings.get(item, set()) for item in constraints.items()), key=len))
+        position = CATALOG_FIELDS.index(field)
+        matches = {}
+
+        for id in ids:
+            value = self.entries[id][position]
+
+            if value and value.casefold().startswith(prefix):
+                matches.setdefault(value.casefold(), value)
+
+        return [matches[folded] for folded in sorted(matches)[:limit]]
+
+
+_attribute_index = (None, AttributeIndex())
+
+
+def get_attribute_index():
+    """The process-local ``AttributeIndex``, topped up with new rows whenever the car attributes version moves on."""
+    global _attribute_index
+
+    version = car_attributes_version()
+
+    if _attribute_index[0] != version:
+        _attribute_index[1].refresh()
+        _attribute_index = (version, _attribute_index[1])
+
+    return _attribute_index[1]
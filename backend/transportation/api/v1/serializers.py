@@ -8,6 +8,7 @@ from rest_framework import serializers
 from auctions.models import AuctionWon
 from inspections.api.v1.serializers import InspectionRequestSerializer
 from inspections.models import InspectionRequest, VehicleInspectionReport
+from inspections.utils import REPORT_SUMMARY_FIELDS, report_summaries
 from transportation.models import TransportationJob, TransporterDocument, TransportationJobTracking, \
     TransportationJobTrackingStatusMsg, TransportationChargesSlab
 from users.api.v1.serializers import DealershipSerializer, DealerLocationSerializer, TransporterSerializer, \
@@ -17,6 +18,8 @@ from utils.api.v1.serializers import CitySerializer, StateSerializer
 from utils.google_maps import calculate_distance
 from utils.models import State, City
 
+MAX_QUOTE_PAIRS = 500
+
 
 class TransportationJobTrackingStatusMsgSerializer(serializers.ModelSerializer):
     class Meta:
@@ -72,12 +75,7 @@ class TransportationJobSerializer(serializers.ModelSerializer):
         ]
 
     def get_inspection_reports(self, obj):
-        reports = VehicleInspectionReport.objects.filter(request_id=obj.request_id)
-
-        if reports.exists():
-            return list(reports.values())
-
-        return None
+        return report_summaries(VehicleInspectionReport.objects.filter(request_id=obj.request_id).only(*REPORT_SUMMARY_FIELDS))
 
 class TransportationJobTrackingSerializer(serializers.ModelSerializer):
     request_id = InspectionRequestSerializer(read_only=True)
@@ -348,6 +346,39 @@ class TransporterJobCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class TransportationQuotePairSerializer(serializers.Serializer):
+    pickup_location = serializers.IntegerField()
+    drop_location = serializers.IntegerField()
+
+
+class TransportationQuoteSerializer(serializers.Serializer):
+    pairs = TransportationQuotePairSerializer(many=True, required=False)
+    pickup_locations = serializers.ListField(child=serializers.IntegerField(), required=False)
+    drop_locations = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+    def validate(self, attrs):
+        # Explicit pairs plus every pickup location against every drop location
+        pairs = [(pair["pickup_location"], pair["drop_location"]) for pair in attrs.get("pairs", [])]
+        pairs += [(pickup, drop) for pickup in attrs.get("pickup_locations", []) for drop in attrs.get("drop_locations", [])]
+
+        if not pairs:
+            raise serializers.ValidationError({"error": "Provide pairs or pickup_locations and drop_locations"})
+
+        if len(pairs) > MAX_QUOTE_PAIRS:
+            raise serializers.ValidationError({"error": f"At most {MAX_QUOTE_PAIRS} pairs can be quoted at once"})
+
+        ids = {location_id for pair in pairs for location_id in pair}
+        locations = DealerLocation.objects.select_related("city", "state__country").in_bulk(ids)
+        missing = ids - locations.keys()
+
+        if missing:
+            raise serializers.ValidationError({"error": f"Dealer locations not found: {sorted(missing)}"})
+
+        attrs["pairs"] = [(locations[pickup], locations[drop]) for pickup, drop in pairs]
+
+        return attrs
+
+
 class UpdateTrackingStatusSerializer(serializers.ModelSerializer):
     tracking_status = serializers.IntegerField(required=True)
 
@@ -16,6 +16,7 @@ from transportation.api.v1.views import (
     TransporterAcceptedJobsListAPIView,
     TransporterCompletedJobsListAPIView,
     TransporterAcceptJobAPIView, TransportationAcceptedJobRetrieveUpdateDestroyAPIView,
+    TransportationQuoteAPIView,
 )
 
 
@@ -35,5 +36,6 @@ urlpatterns = [
     path("completed-jobs/", TransporterCompletedJobsListAPIView.as_view(), name="transportation_completed_jobs"),
     path("accept-job/", TransporterAcceptJobAPIView.as_view(), name="transportation_accept_job"),
     path("create-jobs/", TransportationJobCreateAPIView.as_view(), name="transportation_create_jobs"),
+    path("quotes/", TransportationQuoteAPIView.as_view(), name="transportation_quotes"),
     path("job/<int:pk>/", TransportationUpdateJobTrackingStatusAPIView.as_view(), name="transportation_job_update_tracking"),
 ]
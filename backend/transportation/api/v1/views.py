@@ -9,24 +9,31 @@ from rest_framework.settings import api_settings
 from rest_framework.response import Response
 
 from auctions.api.v1.serializers import AuctionWonSerializer
+from auctions.api.v1.views import AUCTION_REQUEST_PREFETCH
 from auctions.models import AuctionWon
 from auctions.permissions import IsBuyerUserPermission
 from inspections.models import InspectionRequest
 from transportation.api.v1.serializers import TransporterCreateSerializer, TransporterUpdateSerializer, \
     TransportationJobSerializer, TransportationChargesSlabSerializer, \
     RestoreInactiveTransportationChargesSlabSerializer, TransporterAcceptJobSerializer, TransporterJobCreateSerializer, \
-    UpdateTrackingStatusSerializer
+    UpdateTrackingStatusSerializer, TransportationQuoteSerializer
 from transportation.models import TransportationJob, TransportationChargesSlab, TransportationJobTracking
 from transportation.permissions import IsTransporterPermission
+from transportation.utils import quote_routes, get_slab_index, invalidate_slab_index, parse_distance_km
 from transportation.tasks import send_transportation_job_accepted, send_transportation_job_completed, \
     send_transportation_job_buyer_gate_key_email, send_transportation_job_seller_gate_key_email
 from users.api.v1.serializers import TransporterSerializer
 from users.models import Dealership, Transporter
 from users.permissions import IsDealerPermission, IsAdminUserPermission
+from utils.paginations import AdminCursorPagination
+from utils.prefetch import PrefetchPlanMixin
 
 
-class TransportationsListAPIView(ListAPIView):
+class TransportationsListAPIView(PrefetchPlanMixin, ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsDealerPermission]
+    serializer_class = AuctionWonSerializer
+    select_related_fields = ("request_id",)
+    prefetch_related_fields = AUCTION_REQUEST_PREFETCH
 
     def get(self, request):
         active = request.query_params.get('active', '')
@@ -49,15 +56,17 @@ class TransportationsListAPIView(ListAPIView):
         elif active == "active":
             queryset = queryset.exclude(request_id__status=8)
 
-        serializer = AuctionWonSerializer(queryset, many=True)
+        page = self.paginate_queryset(self.filter_queryset(queryset))
+        serializer = self.get_serializer(page, many=True)
 
         return Response({
             "results": serializer.data
-        })
+        }, headers=self.paginator.get_headers())
 
 
 class TransporterListCreateAPIView(ListCreateAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     queryset = Transporter.objects.all()
 
     def get_serializer_class(self):
@@ -80,6 +89,7 @@ class TransporterRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
 
 class TransportationJobsListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = TransportationJobSerializer
 
     def get_queryset(self):
@@ -97,11 +107,17 @@ class TransportationJobsListAPIView(ListAPIView):
 
 class TransportationChargesSlabListCreateAPIView(ListCreateAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = None
     serializer_class = TransportationChargesSlabSerializer
     queryset = TransportationChargesSlab.objects.filter(is_active=True)
 
+    def perform_create(self, serializer):
+        serializer.save()
+        invalidate_slab_index()
+
 
 class TransportationChargesSlabListAPIView(ListAPIView):
+    pagination_class = None
     serializer_class = TransportationChargesSlabSerializer
     queryset = TransportationChargesSlab.objects.filter(is_active=True)
 
@@ -111,15 +127,21 @@ class TransporterChargesSlabRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAP
     serializer_class = TransportationChargesSlabSerializer
     queryset = TransportationChargesSlab.objects.filter(is_active=True)
 
+    def perform_update(self, serializer):
+        serializer.save()
+        invalidate_slab_index()
+
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         instance.is_active = False
         instance.save()
+        invalidate_slab_index()
         return Response({"detail": "Transportation Slab deactivated successfully."}, status=status.HTTP_204_NO_CONTENT)
 
 
 class InactiveTransportationChargesSlabListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = None
     serializer_class = TransportationChargesSlabSerializer
     queryset = TransportationChargesSlab.objects.filter(is_active=False)
 
@@ -129,6 +151,10 @@ class UpdateInactiveTransportationChargesSlabAPIView(RetrieveUpdateDestroyAPIVie
     serializer_class = RestoreInactiveTransportationChargesSlabSerializer
     queryset = TransportationChargesSlab.objects.filter(is_active=False)
 
+    def perform_update(self, serializer):
+        serializer.save()
+        invalidate_slab_index()
+
 
 class TransporterNewJobsListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsTransporterPermission]
@@ -209,32 +235,27 @@ class TransportationJobCreateAPIView(CreateAPIView):
         )
 
         if instance.distance:
-            distance = instance.distance.split(" ")
-            distance_value = float(distance[0])
-            distance_unit = distance[1]
+            distance_value = parse_distance_km(instance.distance)
+            transportation_slab = get_slab_index().lookup(distance_value)
 
-            if distance_unit == "m":
-                distance_value = distance_value / 1000
-                distance_unit = "km"
+            if transportation_slab:
+                slab_id, charges_per_km, rate = transportation_slab
 
-            transportation_slab = TransportationChargesSlab.objects.filter(
-                km_range_start__lte=distance_value,
-                km_range_end__gte=distance_value,
-                is_active=True,
+                instance.transportation_slab_id_id = slab_id
+                instance.charges_per_mile = charges_per_km
+                instance.transport_charges = round(distance_value * rate, 2)
 
-            ).order_by('km_range_start').first()
+                instance.save()
 
-            if transportation_slab:
-                print("distance value", distance_value)
-                print("charges per km", transportation_slab.transporter_charges_per_km)
 
-                total_transport_charges = distance_value * float(transportation_slab.transporter_charges_per_km)
+class TransportationQuoteAPIView(APIView):
+    permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsBuyerUserPermission]
 
-                instance.transportation_slab_id = transportation_slab
-                instance.charges_per_mile = transportation_slab.transporter_charges_per_km
-                instance.transport_charges = round(total_transport_charges, 2)
+    def post(self, request):
+        serializer = TransportationQuoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-                instance.save()
+        return Response(quote_routes(serializer.validated_data["pairs"]))
 
 
 class TransportationUpdateJobTrackingStatusAPIView(UpdateAPIView):
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inspections', '0014_cursor_indexes'),
+        ('transportation', '0007_alter_transportationchargesslab_km_range_end_and_more'),
+        ('users', '0014_remove_transporter_city_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transportationjob',
+            index=models.Index(fields=['created_at', 'id'], name='transportat_created_19020b_idx'),
+        ),
+    ]
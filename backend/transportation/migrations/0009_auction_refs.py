@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0012_auction_refs'),
+        ('transportation', '0008_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transportationjob',
+            name='auction_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transportation_jobs', to='auctions.auctions'),
+        ),
+        migrations.AddField(
+            model_name='transportationjobtracking',
+            name='auction_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transportation_job_tracking', to='auctions.auctions'),
+        ),
+    ]
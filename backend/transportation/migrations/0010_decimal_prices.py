@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0014_normalize_prices'),
+        ('inspections', '0023_decimal_prices'),
+        ('transportation', '0009_auction_refs'),
+        ('users', '0016_coordinates'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='transportationjob',
+            name='transport_charges',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='transportationjob',
+            index=models.Index(fields=['status', 'transport_charges'], name='transportat_status_dfb36f_idx'),
+        ),
+    ]
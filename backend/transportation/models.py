@@ -1,5 +1,7 @@
 from django.db import models
 
+from auctions.models import AuctionReferenceMixin
+
 
 class TransportationChargesSlab(models.Model):
     name = models.CharField(max_length=255, blank=True, null=True)
@@ -20,9 +22,10 @@ class TransportationChargesSlab(models.Model):
         verbose_name_plural = "Transportation Charges Slab"
 
 
-class TransportationJobTracking(models.Model):
+class TransportationJobTracking(AuctionReferenceMixin, models.Model):
     request_id = models.ForeignKey("inspections.InspectionRequest", related_name="transportation_job_tracking", on_delete=models.SET_NULL, null=True, blank=True)
     auction_id = models.CharField(max_length=255, blank=True, null=True)
+    auction_ref = models.ForeignKey("auctions.Auctions", related_name="transportation_job_tracking", on_delete=models.SET_NULL, null=True, blank=True)
     job_id = models.ForeignKey("transportation.TransportationJob", related_name="transportation_job_tracking", on_delete=models.SET_NULL, null=True, blank=True)
     status = models.IntegerField(blank=True, null=True)
     created_by = models.IntegerField(blank=True, null=True)
@@ -48,10 +51,11 @@ class TransportationJobTrackingStatusMsg(models.Model):
         verbose_name_plural = "Transportation Job Tracking Status Msgs"
 
 
-class TransportationJob(models.Model):
+class TransportationJob(AuctionReferenceMixin, models.Model):
     request_id = models.ForeignKey("inspections.InspectionRequest", related_name="transportation_jobs", on_delete=models.SET_NULL, null=True, blank=True)
     dealer_id = models.ForeignKey("users.Dealership", related_name="seller_transportation_jobs", on_delete=models.SET_NULL, null=True, blank=True)
     auction_id = models.CharField(max_length=255, blank=True, null=True)
+    auction_ref = models.ForeignKey("auctions.Auctions", related_name="transportation_jobs", on_delete=models.SET_NULL, null=True, blank=True)
     buyer_id = models.ForeignKey("users.Dealership", related_name="buyer_transportation_jobs", on_delete=models.SET_NULL, null=True, blank=True)
     transporter_id = models.ForeignKey("users.Transporter", related_name="jobs", on_delete=models.SET_NULL, null=True, blank=True)
     pickup_location = models.ForeignKey("users.DealerLocation", related_name="pickup_transportation_jobs", on_delete=models.SET_NULL, null=True, blank=True)
@@ -59,7 +63,7 @@ class TransportationJob(models.Model):
     distance = models.CharField(max_length=255, blank=True, null=True)
     duration = models.CharField(max_length=255, blank=True, null=True)
     charges_per_mile = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
-    transport_charges = models.CharField(max_length=255, blank=True, null=True)
+    transport_charges = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
     transportation_slab_id = models.ForeignKey("transportation.TransportationChargesSlab", related_name="transportation_jobs", on_delete=models.SET_NULL, null=True, blank=True)
     buyer_dual_gate_key = models.CharField(max_length=255, blank=True, null=True)
     seller_dual_gate_key = models.CharField(max_length=255, blank=True, null=True)
@@ -77,6 +81,10 @@ class TransportationJob(models.Model):
     class Meta:
         verbose_name = "Transportation Job"
         verbose_name_plural = "Transportation Jobs"
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+            models.Index(fields=["status", "transport_charges"]),
+        ]
 
 
 class TransporterDocument(models.Model):
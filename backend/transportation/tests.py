@@ -1,3 +1,46 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from auctions.models import AuctionWon
+from inspections.models import InspectionRequest, Inspector, VehicleInspectionReport
+from users.models import DealerLocation, Dealership, Role, User
+
+
+def create_user(email, role_name, dealership_name):
+    role, _ = Role.objects.get_or_create(name=role_name, defaults={"status": 1})
+    dealer = Dealership.objects.create(dealership_name=dealership_name)
+
+    return User.objects.create(first_name=dealership_name, last_name="User", email=email, role=role, dealer=dealer)
+
+
+class TransportationsListTestCase(TestCase):
+    def setUp(self):
+        self.seller = create_user("seller@example.com", "SELLER", "Seller")
+        self.buyer = create_user("buyer@example.com", "BUYER", "Buyer")
+        inspector = Inspector.objects.create(user=self.seller)
+        location = DealerLocation.objects.create(dealership=self.seller.dealer, user=self.seller)
+
+        for number in range(3):
+            request = InspectionRequest.objects.create(
+                dealer=self.seller.dealer, auction_id=f"T{number}", status=7, is_sold=True, transportation_taken=True,
+                manual_delivered=0, via_api=0, inspector_assigned=inspector, inspection_location=location,
+            )
+            VehicleInspectionReport.objects.create(request_id=request, dealer_id=self.seller.dealer, inspector_id=inspector)
+            AuctionWon.objects.create(auction_id=f"T{number}", request_id=request, buyer_id=self.buyer.dealer)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.select_related("role", "dealer").get(id=self.buyer.id))
+
+    def test_reports_are_loaded_once_for_the_page(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("transportation_list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertTrue(all(row["inspection_reports"] for row in response.data["results"]))
+
+        report_table = VehicleInspectionReport._meta.db_table
+        self.assertEqual(sum(f'FROM "{report_table}"' in query["sql"] for query in queries.captured_queries), 1)
@@ -0,0 +1,152 @@
+import time
+from bisect import bisect_left
+
+import numpy as np
+from django.core.cache import cache
+from django.db import transaction
+
+from transportation.models import TransportationChargesSlab
+from utils.geo import format_distance, format_duration
+from utils.google_maps import calculate_distances
+
+SLAB_INDEX_VERSION_KEY = "transportation:slab-index:version"
+# Bounds how long slab edits made outside the API (admin, shell) take to show up
+SLAB_INDEX_TIMEOUT = 60 * 60
+
+
+def parse_rate(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def parse_distance_km(distance):
+    """Kilometres from a Distance Matrix text such as ``"1,234 km"`` or ``"850 m"``."""
+    value, _, unit = distance.replace(",", "").partition(" ")
+
+    return float(value) / 1000 if unit == "m" else float(value)
+
+
+class SlabIndex:
+    """
+    The active ``TransportationChargesSlab`` ranges flattened into sorted,
+    non-overlapping pieces: every range boundary, and the open gap after it.
+    Each piece holds the slab job creation would pick there (the lowest
+    ``km_range_start`` containing it), so a lookup is one binary search.
+    """
+
+    def __init__(self, slabs):
+        slabs = sorted(
+            (
+                slab for slab in slabs
+                if slab.km_range_start is not None and slab.km_range_end is not None
+                and not np.isnan(parse_rate(slab.transporter_charges_per_km))
+            ),
+            key=lambda slab: (slab.km_range_start, slab.id),
+        )
+        self.ids = np.array([slab.id for slab in slabs], dtype=np.int64)
+        self.rates = np.array([parse_rate(slab.transporter_charges_per_km) for slab in slabs])
+        self.charges_per_km = [slab.transporter_charges_per_km for slab in slabs]
+        self.bounds = np.array(sorted({bound for slab in slabs for bound in (slab.km_range_start, slab.km_range_end)}), dtype=float)
+
+        # Piece 2i is the bound itself, piece 2i + 1 the gap up to the next bound
+        samples = np.repeat(self.bounds, 2)
+        if len(samples):
+            samples[1::2] = np.append((self.bounds[:-1] + self.bounds[1:]) / 2, np.inf)
+        self.pieces = np.full(len(samples), -1, dtype=np.int64)
+
+        for index, slab in reversed(list(enumerate(slabs))):
+            self.pieces[(slab.km_range_start <= samples) & (samples <= slab.km_range_end)] = index
+
+    @classmethod
+    def build(cls):
+        return cls(TransportationChargesSlab.objects.filter(is_active=True))
+
+    def lookup(self, distance):
+        """The ``(slab_id, charges_per_km, rate)`` for a distance in km, or ``None``."""
+        index = bisect_left(self.bounds, distance)
+
+        if index < len(self.bounds) and self.bounds[index] == distance:
+            piece = self.pieces[2 * index]
+        elif index:
+            piece = self.pieces[2 * index - 1]
+        else:
+            return None
+
+        if piece < 0:
+            return None
+
+        return int(self.ids[piece]), self.charges_per_km[piece], float(self.rates[piece])
+
+    def price(self, distances):
+        """
+        Slab positions (-1 when unpriced) and transporter charges, NaN when
+        unpriced, for an array of distances in km.
+        """
+        distances = np.asarray(distances, dtype=float)
+
+        if not len(self.bounds):
+            return np.full(len(distances), -1), np.full(len(distances), np.nan)
+
+        # NaN sorts past the last bound, into the trailing gap that no slab covers
+        indexes = np.searchsorted(self.bounds, distances)
+        exact = self.bounds[np.minimum(indexes, len(self.bounds) - 1)] == distances
+        pieces = np.where(exact, 2 * indexes, 2 * indexes - 1)
+        slabs = np.where(pieces >= 0, self.pieces[np.clip(pieces, 0, None)], -1)
+        charges = np.where(slabs >= 0, np.round(distances * self.rates[slabs], 2), np.nan)
+
+        return slabs, charges
+
+
+_slab_index = (None, None)
+
+
+def get_slab_index():
+    """
+    The process-local ``SlabIndex``, rebuilt when the shared version key moves
+    on. Looking up a price costs a cache read, no queries.
+    """
+    global _slab_index
+
+    version = cache.get(SLAB_INDEX_VERSION_KEY)
+
+    if version is None:
+        cache.add(SLAB_INDEX_VERSION_KEY, time.time_ns(), SLAB_INDEX_TIMEOUT)
+        version = cache.get(SLAB_INDEX_VERSION_KEY)
+
+    if _slab_index[0] is None or _slab_index[0] != version:
+        _slab_index = (version, SlabIndex.build())
+
+    return _slab_index[1]
+
+
+def invalidate_slab_index():
+    transaction.on_commit(lambda: cache.set(SLAB_INDEX_VERSION_KEY, time.time_ns(), SLAB_INDEX_TIMEOUT))
+
+
+def quote_routes(pairs):
+    """
+    Transport quotes for ``(pickup_location, drop_location)`` pairs, priced the
+    way ``TransportationJobCreateAPIView`` prices a job. ``estimated`` marks
+    distances that come from coordinates while the road route is fetched.
+    """
+    distances, durations, estimated = calculate_distances(pairs)
+    index = get_slab_index()
+    slabs, charges = index.price(distances)
+    quotes = []
+
+    for (pickup, drop), distance, duration, is_estimate, slab, charge in zip(pairs, distances, durations, estimated, slabs, charges):
+        quotes.append({
+            "pickup_location": pickup.id,
+            "drop_location": drop.id,
+            "distance": None if np.isnan(distance) else format_distance(distance),
+            "duration": None if np.isnan(duration) else format_duration(duration),
+            "distance_km": None if np.isnan(distance) else round(float(distance), 1),
+            "estimated": bool(is_estimate),
+            "transportation_slab_id": int(index.ids[slab]) if slab >= 0 else None,
+            "charges_per_mile": index.charges_per_km[slab] if slab >= 0 else None,
+            "transport_charges": float(charge) if slab >= 0 else None,
+        })
+
+    return quotes
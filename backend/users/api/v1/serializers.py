@@ -7,9 +7,19 @@ from inspections.models import Inspector
 from users.models import Dealership, Role, DealerLocation, Transporter
 from utils.api.v1.serializers import StateSerializer, CitySerializer
 from utils.models import State, City
+from utils.prefetch import nested
 
 User = get_user_model()
 
+# Relations rendered by the nested serializers below, for list view prefetch plans
+USER_DETAIL_RELATED = ("role",)
+DEALERSHIP_RELATED = ("city__state__country", "state__country", "created_by", "updated_by")
+DEALER_LOCATION_RELATED = (
+    *nested("user", USER_DETAIL_RELATED),
+    *nested("dealership", DEALERSHIP_RELATED),
+    "city__state__country",
+)
+
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
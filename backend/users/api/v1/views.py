@@ -16,6 +16,7 @@ from users.api.v1.serializers import BuyerSellerRegistrationSerializer, UsersLis
 from users.models import Role, Dealership, DealerLocation
 from users.permissions import IsAdminUserPermission
 from users.tasks import send_dealership_registration_request
+from utils.paginations import AdminCursorPagination
 
 User = get_user_model()
 
@@ -49,6 +50,7 @@ class RegisterAPIView(CreateAPIView):
 
 class UsersListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = UsersListSerializer
     queryset = User.objects.filter(is_active=True).exclude(role__name__in=["BUYER", "SELLER", "BOTH"])
 
@@ -67,6 +69,7 @@ class UserRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
 
 class InactiveUsersListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = UsersListSerializer
     queryset = User.objects.filter(is_active=False).exclude(role__name__in=["BUYER", "SELLER", "BOTH"])
 
@@ -85,6 +88,7 @@ class UserAddAPIView(CreateAPIView):
 
 class RoleListCreateAPIView(ListCreateAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = None
     serializer_class = RoleSerializer
     queryset = Role.objects.filter(is_active=True).exclude(name__in=["BUYER", "SELLER", "BOTH"])
 
@@ -103,6 +107,7 @@ class RoleRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
 
 class InactiveRoleListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = None
     serializer_class = RoleSerializer
     queryset = Role.objects.filter(is_active=False).exclude(name__in=["BUYER", "SELLER", "BOTH"])
 
@@ -115,6 +120,7 @@ class DeleteInactiveRoleAPIView(RetrieveUpdateDestroyAPIView):
     
 class DealershipListCreateAPIView(ListCreateAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = DealershipSerializer
 
     def get_queryset(self):
@@ -139,6 +145,7 @@ class DealershipRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
 
 class InactiveDealershipListAPIView(ListAPIView):
     permission_classes = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsAdminUserPermission]
+    pagination_class = AdminCursorPagination
     serializer_class = DealershipSerializer
     queryset = Dealership.objects.filter(is_active=False)
 
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0014_remove_transporter_city_name_and_more'),
+        ('utils', '0004_alter_city_status_alter_country_status_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dealerlocation',
+            index=models.Index(fields=['created_at', 'id'], name='users_deale_created_cdd0c5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dealership',
+            index=models.Index(fields=['created_at', 'id'], name='users_deale_created_58cfb9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transporter',
+            index=models.Index(fields=['created_at', 'id'], name='users_trans_created_4e832a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['created_at', 'id'], name='users_user_created_cead48_idx'),
+        ),
+    ]
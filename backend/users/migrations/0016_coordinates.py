@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0015_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dealerlocation',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='dealerlocation',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
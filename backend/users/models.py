@@ -48,6 +48,11 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["first_name", "last_name"]
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+        ]
+
     def __str__(self):
         return self.email
 
@@ -112,6 +117,11 @@ class Dealership(models.Model):
     updated_at = models.DateTimeField(auto_now_add=True)
     deleted_at = models.DateTimeField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+        ]
+
     def __str__(self):
         return self.dealership_name
 
@@ -122,6 +132,8 @@ class DealerLocation(models.Model):
     title = models.CharField(max_length=255, blank=True, null=True)
     address = models.CharField(max_length=255, blank=True, null=True)
     zip = models.CharField(max_length=255, blank=True, null=True)
+    latitude = models.FloatField(blank=True, null=True)
+    longitude = models.FloatField(blank=True, null=True)
     city = models.ForeignKey("utils.City", related_name="dealer_locations", on_delete=models.SET_NULL, null=True, blank=True)
     state = models.ForeignKey("utils.State", related_name="dealer_locations", on_delete=models.SET_NULL, null=True, blank=True)
     email = models.TextField(blank=True, null=True)
@@ -140,6 +152,9 @@ class DealerLocation(models.Model):
 
     class Meta:
         verbose_name_plural = "Dealer Locations"
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+        ]
 
     def __str__(self):
         return self.title
@@ -167,6 +182,11 @@ class Transporter(models.Model):
     updated_at = models.DateTimeField(auto_now_add=True)
     deleted_at = models.DateTimeField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+        ]
+
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from utils.models import City, State, Country
+from utils.models import City, State, Country, OutgoingEmail, DistanceCache, MediaAsset
 
 
 @admin.register(City)
@@ -29,3 +29,37 @@ class CountryAdmin(admin.ModelAdmin):
         "code",
         "status",
     )
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "subject",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+    )
+
+
+@admin.register(DistanceCache)
+class DistanceCacheAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "origin",
+        "destination",
+        "distance",
+        "fetched_at",
+    )
+
+
+@admin.register(MediaAsset)
+class MediaAssetAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "folder",
+        "content_hash",
+        "url",
+        "created_at",
+    )
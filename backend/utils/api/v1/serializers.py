@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from utils.cloudinary import delivery_variants, read_upload_token, signed_upload_url
 from utils.models import State, City, Country
 
 
@@ -58,3 +59,48 @@ class CitySerializer(serializers.ModelSerializer):
             validated_data["state"] = state
 
         return super().create(validated_data)
+
+
+class SignedUploadSerializer(serializers.Serializer):
+    field = serializers.CharField(max_length=255, required=False)
+    public_id = serializers.CharField(max_length=255)
+    version = serializers.IntegerField()
+    signature = serializers.CharField(max_length=255)
+    resource_type = serializers.ChoiceField(choices=["image", "video", "raw"], default="image")
+    format = serializers.CharField(max_length=20, required=False, allow_blank=True)
+
+
+class RegisterSignedUploadsSerializer(serializers.Serializer):
+    """
+    Files a client uploaded with a ``sign_upload`` token. Expects the token's
+    target in the ``target`` context and adds the verified ``url`` (and the
+    resized ``variants`` of images) and the signed ``folder`` to the
+    validated data.
+    """
+    token = serializers.CharField()
+    files = SignedUploadSerializer(many=True, allow_empty=False)
+
+    def validate(self, attrs):
+        folder = read_upload_token(attrs["token"], self.context["target"])
+
+        if folder is None:
+            raise serializers.ValidationError({"error": "Upload token is invalid or has expired"})
+
+        for upload in attrs["files"]:
+            url = None
+
+            if upload["public_id"].startswith(f"{folder}/"):
+                url = signed_upload_url(upload["public_id"], upload["version"], upload["signature"], upload["resource_type"], upload.get("format"))
+
+            if url is None:
+                raise serializers.ValidationError({"error": f"{upload['public_id']} was not uploaded with this token"})
+
+            upload["url"] = url
+
+            if upload["resource_type"] == "image":
+                upload["variants"] = delivery_variants(upload["public_id"], upload["version"])
+
+        attrs["folder"] = folder
+
+        return attrs
+
@@ -8,6 +8,7 @@ from utils.models import City, State, Country
 
 
 class StateListCreateAPIView(ListCreateAPIView):
+    pagination_class = None
     serializer_class = StateSerializer
     queryset = State.objects.filter(status=1)
 
@@ -18,6 +19,7 @@ class StateListCreateAPIView(ListCreateAPIView):
         return [AllowAny()]
 
 class CountryListCreateAPIView(ListCreateAPIView):
+    pagination_class = None
     serializer_class = CountrySerializer
     queryset = Country.objects.filter(status=1)
 
@@ -36,6 +38,7 @@ class CountryListCreateAPIView(ListCreateAPIView):
 
 
 class CityListCreateAPIView(ListCreateAPIView):
+    pagination_class = None
     serializer_class = CitySerializer
     queryset = City.objects.filter(status=1)
 
@@ -1,16 +1,203 @@
+import hashlib
+import io
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging import getLogger
+
+from django.core import signing
 from dotenv import load_dotenv
 import cloudinary
-from cloudinary.uploader import upload
+import cloudinary.uploader
+from cloudinary.uploader import upload_large
+from cloudinary.utils import api_sign_request, cloudinary_api_url, cloudinary_url, verify_api_response_signature
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from utils.images import IMAGE_VARIANTS, VARIANT_QUALITY, get_image_pool, make_variants
+from utils.models import MediaAsset
 
 load_dotenv()
 
-def upload_file(file, folder):
-    cloudinary.config(
-        cloud_name=os.environ.get("CLOUDINARY_CLOUD_NAME"),
-        api_key=os.environ.get("CLOUDINARY_API_KEY"),
-        api_secret=os.environ.get("CLOUDINARY_API_SECRET")
-    )
+logger = getLogger("awd")
+
+UPLOAD_WORKERS = int(os.environ.get("CLOUDINARY_UPLOAD_WORKERS", 16))
+# Files go up in chunks of this size (Cloudinary's minimum is 5MB), so a worker never holds more than one chunk
+UPLOAD_CHUNK_SIZE = 6 * 1024 * 1024
+UPLOAD_TIMEOUT = 120
+# How long a client has between asking for an upload signature and registering the uploaded files
+SIGNED_UPLOAD_MAX_AGE = 15 * 60
+SIGNED_UPLOAD_SALT = "utils.cloudinary.signed-upload"
+
+cloudinary.config(
+    cloud_name=os.environ.get("CLOUDINARY_CLOUD_NAME"),
+    api_key=os.environ.get("CLOUDINARY_API_KEY"),
+    api_secret=os.environ.get("CLOUDINARY_API_SECRET"),
+    upload_prefix=os.environ.get("CLOUDINARY_UPLOAD_PREFIX") or None,
+)
+# The SDK's module level pool keeps a single connection per host, size it for the upload workers
+cloudinary.uploader._http = cloudinary.utils.get_http_connector(cloudinary.config(), {**cloudinary.CERT_KWARGS, "maxsize": UPLOAD_WORKERS})
+
+_executor = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS, thread_name_prefix="cloudinary-upload")
 
-    result = upload(file, folder=folder, resource_type="auto")
+
+class UploadFailed(APIException):
+    status_code = status.HTTP_502_BAD_GATEWAY
+    default_detail = "Some files could not be uploaded"
+
+    def __init__(self, uploads):
+        super().__init__({"error": self.default_detail, "uploads": uploads})
+
+
+def upload_file(file, folder):
+    result = upload_large(file, folder=folder, resource_type="auto", chunk_size=UPLOAD_CHUNK_SIZE, timeout=UPLOAD_TIMEOUT)
     return result["secure_url"]
+
+
+def content_hash(file):
+    digest = hashlib.sha256()
+    size = 0
+    file.seek(0)
+
+    for chunk in iter(lambda: file.read(UPLOAD_CHUNK_SIZE), b""):
+        digest.update(chunk)
+        size += len(chunk)
+
+    file.seek(0)
+
+    return digest.hexdigest(), size
+
+
+def upload_asset(file, folder, digest, size, variants=False):
+    resized = None
+
+    if variants:
+        # Files Django spooled to disk are resized from there, through their own handle since uploading closes the file
+        if hasattr(file, "temporary_file_path"):
+            resized = get_image_pool().submit(make_variants, file.temporary_file_path())
+            file = open(file.temporary_file_path(), "rb")
+        else:
+            resized = get_image_pool().submit(make_variants, file.read())
+            file.seek(0)
+
+    asset = MediaAsset(folder=folder, content_hash=digest, size=size, url=upload_file(file, folder))
+
+    if resized is not None:
+        try:
+            images = resized.result()
+        except Exception as e:
+            logger.warning(f"Resizing {asset.url} failed. Error {e}")
+            images = {}
+
+        asset.variants = {name: upload_file(io.BytesIO(data), f"{folder}/{name}") for name, data in images.items()}
+
+    return asset
+
+
+def upload_files(uploads, variants=False):
+    """
+    Uploads ``(label, file, folder)`` entries concurrently on the shared
+    worker pool and returns a ``MediaAsset`` for each, in the same order.
+
+    Files whose content was already uploaded to the same folder are not sent
+    again. With ``variants``, images also get the ``IMAGE_VARIANTS`` copies,
+    resized in the image process pool while the original uploads.
+
+    Every file is logged as it finishes; if any of them fails, ``UploadFailed``
+    reports the outcome of each file once the rest have finished.
+    """
+    started = time.monotonic()
+    results = [{"field": label, "file": getattr(file, "name", None)} for label, file, folder in uploads]
+    hashes = [content_hash(file) for label, file, folder in uploads]
+    known = {
+        (asset.folder, asset.content_hash): asset
+        for asset in MediaAsset.objects.filter(content_hash__in={digest for digest, size in hashes})
+    }
+    assets = [None] * len(uploads)
+    # One upload per distinct (folder, content), even when a request carries the same file twice
+    pending = {}
+
+    for index, ((label, file, folder), (digest, size)) in enumerate(zip(uploads, hashes)):
+        if (folder, digest) in known:
+            assets[index] = known[(folder, digest)]
+            results[index]["url"] = assets[index].url
+        elif (folder, digest) not in pending:
+            pending[(folder, digest)] = (_executor.submit(upload_asset, file, folder, digest, size, variants), [index])
+        else:
+            pending[(folder, digest)][1].append(index)
+
+    futures = dict(pending.values())
+    failed = False
+
+    for done, future in enumerate(as_completed(futures), 1):
+        for index in futures[future]:
+            result = results[index]
+
+            try:
+                assets[index] = future.result()
+                result["url"] = assets[index].url
+                logger.info(f"Uploaded {done}/{len(futures)} {result['field']} ({result['file']}) in {time.monotonic() - started:.1f}s")
+            except Exception as e:
+                result["error"] = str(e)
+                failed = True
+                logger.warning(f"Upload {done}/{len(futures)} {result['field']} ({result['file']}) failed. Error {e}")
+
+    # Kept even when the request fails, so retrying it only sends the files that didn't make it
+    uploaded = [future.result() for future in futures if not future.exception()]
+    MediaAsset.objects.bulk_create(uploaded, ignore_conflicts=True)
+
+    if failed:
+        raise UploadFailed(results)
+
+    return assets
+
+
+def delivery_variants(public_id, version):
+    """``IMAGE_VARIANTS`` sized copies of an image uploaded to Cloudinary, resized on delivery."""
+    return {
+        name: cloudinary_url(public_id, version=version, format="jpg", secure=True, width=width, height=height, crop="limit", quality=VARIANT_QUALITY)[0]
+        for name, (width, height) in IMAGE_VARIANTS.items()
+    }
+
+
+def sign_upload(folder, target):
+    """
+    Parameters for a client to upload straight to Cloudinary into ``folder``.
+    The ``token`` ties the folder to ``target`` (e.g. a report or ticket) and
+    has to come back, within ``SIGNED_UPLOAD_MAX_AGE``, with the uploads.
+    """
+    config = cloudinary.config()
+    timestamp = int(time.time())
+
+    return {
+        "upload_url": cloudinary_api_url("upload", resource_type="auto"),
+        "api_key": config.api_key,
+        "timestamp": timestamp,
+        "folder": folder,
+        "signature": api_sign_request({"folder": folder, "timestamp": timestamp}, config.api_secret, config.signature_algorithm, config.signature_version),
+        "token": signing.dumps({"folder": folder, "target": target}, salt=SIGNED_UPLOAD_SALT),
+        "expires_in": SIGNED_UPLOAD_MAX_AGE,
+    }
+
+
+def read_upload_token(token, target):
+    """The folder a ``sign_upload`` token was issued for, or ``None`` if it's expired, forged or for another target."""
+    try:
+        data = signing.loads(token, salt=SIGNED_UPLOAD_SALT, max_age=SIGNED_UPLOAD_MAX_AGE)
+    except signing.BadSignature:
+        return None
+
+    return data["folder"] if data.get("target") == target else None
+
+
+def signed_upload_url(public_id, version, signature, resource_type="image", format=None):
+    """
+    The delivery URL of a file the client uploaded, built from the upload
+    response fields only when Cloudinary's response signature checks out.
+    """
+    if not verify_api_response_signature(public_id, version, signature):
+        return None
+
+    url, _ = cloudinary_url(public_id, resource_type=resource_type, version=version, format=format or None, secure=True)
+
+    return url
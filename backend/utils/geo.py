@@ -0,0 +1,53 @@
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+# Road routes run longer than the great circle; 1.25 is the usual circuity for US road networks
+ROAD_CIRCUITY = 1.25
+AVERAGE_SPEED_KMH = 80
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distances in km, element-wise over arrays of degrees."""
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(value, dtype=float)) for value in (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def location_coordinates(location):
+    """A location's own coordinates, falling back to the centre of its city."""
+    if location.latitude is not None and location.longitude is not None:
+        return location.latitude, location.longitude
+
+    city = location.city
+
+    if city is not None and city.latitude is not None and city.longitude is not None:
+        return city.latitude, city.longitude
+
+    return None
+
+
+def estimate_routes(origins, destinations):
+    """
+    Road distance (km) and driving time (seconds) estimates for each pair of
+    ``(lat, lng)`` coordinates. Pairs with a missing side come back as NaN.
+    """
+    missing = (np.nan, np.nan)
+    origins = np.array([missing if coordinates is None else coordinates for coordinates in origins], dtype=float).reshape(-1, 2)
+    destinations = np.array([missing if coordinates is None else coordinates for coordinates in destinations], dtype=float).reshape(-1, 2)
+    distances = haversine_km(origins[:, 0], origins[:, 1], destinations[:, 0], destinations[:, 1]) * ROAD_CIRCUITY
+
+    return distances, distances / AVERAGE_SPEED_KMH * 3600
+
+
+def format_distance(km):
+    return f"{km:.1f} km"
+
+
+def format_duration(seconds):
+    minutes = max(int(round(seconds / 60)), 1)
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    parts = [(days, "day"), (hours, "hour")] if days else [(hours, "hour"), (minutes, "min")]
+
+    return " ".join(f"{value} {unit}{'s' if value != 1 else ''}" for value, unit in parts if value)
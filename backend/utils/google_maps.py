@@ -1,9 +1,37 @@
-import requests
+import hashlib
 import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from logging import getLogger
+
+import numpy as np
+import requests
+from django.db import connection
+from django.utils import timezone
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.geo import estimate_routes, format_distance, format_duration, location_coordinates
+from utils.models import DistanceCache
 
 load_dotenv()
 
+logger = getLogger("awd")
+
+DISTANCE_MATRIX_URL = os.environ.get("GOOGLE_DISTANCE_MATRIX_URL", "https://maps.googleapis.com/maps/api/distancematrix/json")
+# Road distances barely change; entries are served stale for a while longer and refreshed in the background
+DISTANCE_TTL = timedelta(days=30)
+DISTANCE_STALE_TTL = timedelta(days=7)
+DISTANCE_TIMEOUT = (3.05, 10)
+# Per-request limits of the Distance Matrix API
+MAX_MATRIX_SIDE = 25
+MAX_MATRIX_ELEMENTS = 100
+
+
 def validated_location(location):
     address = location.address if location.address else ""
     city = location.city.name if location.city else ""
@@ -13,38 +41,270 @@ def validated_location(location):
     return f"{address} {city} {state}, {country}"
 
 
-def calculate_distance(origin, destination):
-    origin_location = validated_location(origin)
-    destination_location = validated_location(destination)
+def normalize_address(address):
+    return re.sub(r"\s+", " ", re.sub(r"\s*,\s*", ", ", address.lower())).strip(" ,")
 
-    url = "https://maps.googleapis.com/maps/api/distancematrix/json"
-    api_key = os.environ.get("GOOGLE_API_KEY")
 
-    params = {
-        "origins": origin_location,
-        "destinations": destination_location,
-        "key": api_key
-    }
+def route_key(origin, destination):
+    return hashlib.sha256(f"{normalize_address(origin)}|{normalize_address(destination)}".encode()).hexdigest()
 
-    response = requests.get(url, params=params)
 
-    if response.status_code == 200:
-        data = response.json()
-        print("data", data)
+class DistanceMatrix:
+    """
+    Distance Matrix lookups behind two cache tiers: an in-process LRU and the
+    ``DistanceCache`` table keyed by the hash of the normalized addresses.
+    Entries older than ``ttl`` are still served for ``stale_ttl`` while a
+    background refresh runs; failed fetches fall back to whatever is cached.
+    """
 
-        if "rows" in data and len(data["rows"]) > 0:
-            elements = data["rows"][0]["elements"]
+    def __init__(self, url=None, api_key=None, lru_size=4096, ttl=DISTANCE_TTL, stale_ttl=DISTANCE_STALE_TTL):
+        self.url = url or DISTANCE_MATRIX_URL
+        self.api_key = api_key if api_key is not None else os.environ.get("GOOGLE_API_KEY")
+        self.lru_size = lru_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.lru = OrderedDict()
+        self.lock = threading.Lock()
+        self.refreshing = set()
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="distance-refresh")
 
-            if len(elements) > 0:
-                distance = elements[0].get("distance").get("text") if elements[0].get("distance") else None
-                duration = elements[0].get("duration").get("text") if elements[0].get("duration") else None
-                print(f"Distance: {distance}")
-                print(f"Duration: {duration}")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504), allowed_methods=("GET",)),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-                return distance, duration
-            else:
-                return None
+    def get(self, origin, destination, wait=True):
+        return self.get_many([(origin, destination)], wait)[(origin, destination)]
+
+    def get_many(self, pairs, wait=True):
+        """
+        Entries for many ``(origin, destination)`` pairs: LRU hits, then one
+        query for the rest, then batched matrix requests for anything missing
+        or expired. With ``wait=False`` those are fetched in the background and
+        the pairs come back as whatever is cached (possibly ``None``).
+        """
+        keys = {pair: route_key(*pair) for pair in pairs}
+        entries = {key: self.lru_get(key) for key in keys.values()}
+        missing = [key for key, entry in entries.items() if entry is None]
+
+        if missing:
+            for entry in DistanceCache.objects.filter(key__in=missing):
+                entries[entry.key] = entry
+                self.lru_set(entry.key, entry)
+
+        now = timezone.now()
+        stale, expired = {}, {}
+
+        for pair, key in keys.items():
+            entry = entries[key]
+            age = now - entry.fetched_at if entry is not None else None
+
+            if age is None or age >= self.ttl + self.stale_ttl:
+                expired[key] = pair
+            elif age >= self.ttl:
+                stale[key] = pair
+
+        if expired and wait:
+            entries.update({key: entry for key, entry in self.refresh(expired).items() if entry is not None})
         else:
-            return None
-    else:
-        return None
+            stale.update(expired)
+
+        if stale:
+            self.refresh_later(stale)
+
+        return {pair: entries[key] for pair, key in keys.items()}
+
+    def refresh(self, routes):
+        """
+        Fetches ``{key: (origin, destination)}`` routes in as few matrix requests
+        as the element limits allow and upserts them. Routes whose request
+        failed map to ``None``, as do all of them when no API key is configured.
+        """
+        if not self.api_key:
+            return dict.fromkeys(routes)
+
+        by_origin = {}
+        for origin, destination in routes.values():
+            by_origin.setdefault(origin, set()).add(destination)
+
+        origins = list(by_origin)
+        origins_per_request = min(MAX_MATRIX_SIDE, len(origins))
+        destinations_per_request = max(1, min(MAX_MATRIX_SIDE, MAX_MATRIX_ELEMENTS // origins_per_request))
+        fetched_at = timezone.now()
+        entries = {}
+
+        for start in range(0, len(origins), origins_per_request):
+            block = origins[start:start + origins_per_request]
+            destinations = sorted(set().union(*(by_origin[origin] for origin in block)))
+
+            for offset in range(0, len(destinations), destinations_per_request):
+                chunk = destinations[offset:offset + destinations_per_request]
+
+                try:
+                    results = self.fetch_matrix(block, chunk)
+                except (requests.RequestException, ValueError) as e:
+                    logger.warning(f"Distance Matrix request failed for {len(block)}x{len(chunk)} routes. Error {e}")
+                    continue
+
+                for (origin, destination), result in results.items():
+                    key = route_key(origin, destination)
+                    entries[key] = DistanceCache(key=key, origin=origin, destination=destination, fetched_at=fetched_at, **result)
+
+        if entries:
+            DistanceCache.objects.bulk_create(
+                list(entries.values()),
+                update_conflicts=True,
+                # MySQL upserts on any unique key and rejects an explicit target
+                unique_fields=["key"] if connection.features.supports_update_conflicts_with_target else None,
+                update_fields=["distance", "duration", "distance_meters", "duration_seconds", "fetched_at", "updated_at"],
+            )
+
+            for key, entry in entries.items():
+                self.lru_set(key, entry)
+
+        return {key: entries.get(key) for key in routes}
+
+    def refresh_later(self, routes):
+        with self.lock:
+            if not self.api_key:
+                return
+
+            routes = {key: pair for key, pair in routes.items() if key not in self.refreshing}
+            self.refreshing.update(routes)
+
+        if not routes:
+            return
+
+        def run():
+            try:
+                self.refresh(routes)
+            finally:
+                with self.lock:
+                    self.refreshing.difference_update(routes)
+
+                connection.close()
+
+        self.executor.submit(run)
+
+    def fetch(self, origin, destination):
+        return self.fetch_matrix([origin], [destination])[(origin, destination)]
+
+    def fetch_matrix(self, origins, destinations):
+        params = {
+            "origins": "|".join(origin.replace("|", " ") for origin in origins),
+            "destinations": "|".join(destination.replace("|", " ") for destination in destinations),
+            "key": self.api_key,
+        }
+        response = self.session.get(self.url, params=params, timeout=DISTANCE_TIMEOUT)
+        response.raise_for_status()
+        data = response.json()
+
+        if data.get("status", "OK") != "OK":
+            raise ValueError(f"Distance Matrix status {data.get('status')}")
+
+        rows = data.get("rows") or []
+        results = {}
+
+        for origin, row in zip(origins, rows):
+            for destination, element in zip(destinations, row.get("elements") or []):
+                # Unknown addresses are cached too so they don't hit the API on every request
+                results[(origin, destination)] = {
+                    "distance": element.get("distance", {}).get("text"),
+                    "duration": element.get("duration", {}).get("text"),
+                    "distance_meters": element.get("distance", {}).get("value"),
+                    "duration_seconds": element.get("duration", {}).get("value"),
+                }
+
+        if len(results) != len(origins) * len(destinations):
+            raise ValueError("Distance Matrix returned an incomplete matrix")
+
+        return results
+
+    def lru_get(self, key):
+        with self.lock:
+            entry = self.lru.get(key)
+
+            if entry is not None:
+                self.lru.move_to_end(key)
+
+            return entry
+
+    def lru_set(self, key, entry):
+        with self.lock:
+            self.lru[key] = entry
+            self.lru.move_to_end(key)
+
+            while len(self.lru) > self.lru_size:
+                self.lru.popitem(last=False)
+
+
+_distance_matrix = None
+
+
+def get_distance_matrix():
+    global _distance_matrix
+
+    if _distance_matrix is None:
+        _distance_matrix = DistanceMatrix()
+
+    return _distance_matrix
+
+
+def calculate_distance(origin, destination):
+    """
+    ``(distance, duration)`` texts between two locations. A cached Distance
+    Matrix route is preferred; otherwise locations with coordinates get a
+    haversine estimate right away and the route is fetched in the background.
+    Only locations that aren't geocoded wait on the API.
+    """
+    coordinates = location_coordinates(origin), location_coordinates(destination)
+    estimate = all(coordinates)
+    entry = get_distance_matrix().get(validated_location(origin), validated_location(destination), wait=not estimate)
+
+    if entry is not None and entry.distance:
+        return entry.distance, entry.duration
+
+    if estimate:
+        distances, durations = estimate_routes([coordinates[0]], [coordinates[1]])
+        return format_distance(distances[0]), format_duration(durations[0])
+
+    return None, None
+
+
+def calculate_distances(pairs):
+    """
+    Road distances (km) and durations (seconds) for many ``(origin, destination)``
+    location pairs, from the same sources as ``calculate_distance``: cached
+    routes, one batched Distance Matrix pass for pairs that aren't geocoded,
+    and haversine estimates for the rest. Returns the two arrays (NaN when
+    nothing is known) and a mask of the pairs that are estimates.
+    """
+    addresses = [(validated_location(origin), validated_location(destination)) for origin, destination in pairs]
+    coordinates = [(location_coordinates(origin), location_coordinates(destination)) for origin, destination in pairs]
+    geocoded = [address for address, pair in zip(addresses, coordinates) if all(pair)]
+    remote = [address for address, pair in zip(addresses, coordinates) if not all(pair)]
+    matrix = get_distance_matrix()
+    entries = {}
+
+    if geocoded:
+        entries.update(matrix.get_many(geocoded, wait=False))
+
+    if remote:
+        entries.update(matrix.get_many(remote, wait=True))
+
+    distances, durations = estimate_routes([pair[0] for pair in coordinates], [pair[1] for pair in coordinates])
+    estimated = np.ones(len(pairs), dtype=bool)
+
+    for index, address in enumerate(addresses):
+        entry = entries[address]
+
+        if entry is not None and entry.distance_meters is not None:
+            distances[index] = entry.distance_meters / 1000
+            durations[index] = entry.duration_seconds if entry.duration_seconds is not None else np.nan
+            estimated[index] = False
+
+    return distances, durations, estimated & ~np.isnan(distances)
@@ -0,0 +1,49 @@
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+# Bounding boxes of the resized copies made for every uploaded photo
+IMAGE_VARIANTS = {
+    "thumb": (320, 320),
+    "web": (1280, 1280),
+}
+VARIANT_QUALITY = 80
+IMAGE_WORKERS = int(os.environ.get("IMAGE_WORKERS", min(4, os.cpu_count() or 1)))
+
+
+def make_variants(source):
+    """
+    JPEG bytes of every ``IMAGE_VARIANTS`` size for an image given as a path
+    or bytes. Runs in the image pool; files that aren't images get none.
+    """
+    try:
+        with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as image:
+            image = ImageOps.exif_transpose(image).convert("RGB")
+            variants = {}
+
+            for name, size in IMAGE_VARIANTS.items():
+                variant = image.copy()
+                variant.thumbnail(size, Image.Resampling.LANCZOS)
+                buffer = io.BytesIO()
+                variant.save(buffer, "JPEG", quality=VARIANT_QUALITY, optimize=True, progressive=True)
+                variants[name] = buffer.getvalue()
+
+            return variants
+    except (UnidentifiedImageError, OSError):
+        return {}
+
+
+_image_pool = None
+
+
+def get_image_pool():
+    global _image_pool
+
+    if _image_pool is None:
+        # Spawned workers only import this module, not a copy of the forked web process
+        _image_pool = ProcessPoolExecutor(max_workers=IMAGE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+    return _image_pool
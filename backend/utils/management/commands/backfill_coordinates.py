@@ -0,0 +1,119 @@
+import csv
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.models import DealerLocation
+from utils.models import City
+
+ZIP_COLUMNS = ("zip", "zipcode", "zip_code", "postal_code", "geoid")
+CITY_COLUMNS = ("city", "name")
+STATE_COLUMNS = ("state", "state_code", "usps")
+LATITUDE_COLUMNS = ("latitude", "lat", "intptlat")
+LONGITUDE_COLUMNS = ("longitude", "lng", "lon", "intptlong")
+# Census Gazetteer place names carry their type, e.g. "Springfield city"
+PLACE_SUFFIX = re.compile(r"\s+(city|town|village|borough|municipality|CDP)$", re.IGNORECASE)
+
+
+def _column(header, names, path):
+    for name in names:
+        if name in header:
+            return header[name]
+
+    raise CommandError(f"{path} has none of the columns {', '.join(names)}")
+
+
+def read_geocode_table(path, key_columns):
+    """
+    Reads a CSV or tab separated geocode table (e.g. the Census Gazetteer ZCTA
+    or places files) into ``{key: (lat, lng)}``, where the key is built from
+    the first matching column of each entry in ``key_columns``.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        dialect = csv.Sniffer().sniff(file.readline())
+        file.seek(0)
+        reader = csv.reader(file, dialect)
+        header = {name.strip().lower(): index for index, name in enumerate(next(reader))}
+        keys = [_column(header, names, path) for names in key_columns]
+        lat, lng = _column(header, LATITUDE_COLUMNS, path), _column(header, LONGITUDE_COLUMNS, path)
+        table = {}
+
+        for row in reader:
+            try:
+                table[tuple(row[index].strip() for index in keys)] = (float(row[lat]), float(row[lng]))
+            except (IndexError, ValueError):
+                continue
+
+    return table
+
+
+def zip_key(value):
+    return (value or "").strip()[:5].zfill(5)
+
+
+def city_key(name, state):
+    return PLACE_SUFFIX.sub("", (name or "").strip()).lower(), (state or "").strip().lower()
+
+
+class Command(BaseCommand):
+    help = "Fills latitude/longitude of cities and dealer locations from local geocode tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--zip-table", help="Geocode table keyed by ZIP code")
+        parser.add_argument("--city-table", help="Geocode table keyed by city name and state")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--overwrite", action="store_true", help="Replace coordinates that are already set")
+
+    def handle(self, *args, **options):
+        if not options["zip_table"] and not options["city_table"]:
+            raise CommandError("Pass --zip-table and/or --city-table")
+
+        if options["city_table"]:
+            table = read_geocode_table(options["city_table"], (CITY_COLUMNS, STATE_COLUMNS))
+            cities = {city_key(name, state): coordinates for (name, state), coordinates in table.items()}
+            updated = self.backfill(
+                City.objects.select_related("state"),
+                lambda city: cities.get(city_key(city.name, city.state.code if city.state else ""))
+                or cities.get(city_key(city.name, city.state.name if city.state else "")),
+                options,
+            )
+            self.stdout.write(f"Updated {updated} cities from {len(cities)} geocoded places")
+
+        zips = {}
+        if options["zip_table"]:
+            zips = {zip_key(key[0]): coordinates for key, coordinates in read_geocode_table(options["zip_table"], (ZIP_COLUMNS,)).items()}
+
+        # Locations without a known ZIP take the centre of their city
+        updated = self.backfill(
+            DealerLocation.objects.select_related("city"),
+            lambda location: zips.get(zip_key(location.zip)) or (
+                (location.city.latitude, location.city.longitude)
+                if location.city and location.city.latitude is not None else None
+            ),
+            options,
+        )
+        self.stdout.write(f"Updated {updated} dealer locations from {len(zips)} geocoded ZIP codes")
+
+    def backfill(self, queryset, lookup, options):
+        if not options["overwrite"]:
+            queryset = queryset.filter(latitude__isnull=True)
+
+        batch_size = options["batch_size"]
+        last_id = 0
+        updated = 0
+
+        while batch := list(queryset.filter(id__gt=last_id).order_by("id")[:batch_size]):
+            last_id = batch[-1].id
+            changed = []
+
+            for instance in batch:
+                coordinates = lookup(instance)
+
+                if coordinates is not None:
+                    instance.latitude, instance.longitude = coordinates
+                    changed.append(instance)
+
+            queryset.model.objects.bulk_update(changed, ["latitude", "longitude"])
+            updated += len(changed)
+
+        return updated
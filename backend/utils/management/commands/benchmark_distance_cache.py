@@ -0,0 +1,108 @@
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from zlib import crc32
+
+import requests
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from utils.google_maps import DistanceMatrix
+
+
+class DistanceMatrixStandInHandler(BaseHTTPRequestHandler):
+    """
+    Answers Distance Matrix requests with a distance derived from the address
+    text, after ``server.latency`` seconds to stand in for the Google round trip.
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        self.server.requests += 1
+
+        query = parse_qs(urlparse(self.path).query)
+        body = json.dumps({
+            "status": "OK",
+            "rows": [
+                {"elements": [self.element(origin, destination) for destination in query["destinations"][0].split("|")]}
+                for origin in query["origins"][0].split("|")
+            ],
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def element(origin, destination):
+        meters = crc32(f"{origin}|{destination}".encode()) % 500000 + 1000
+
+        return {
+            "status": "OK",
+            "distance": {"text": f"{meters / 1000:.1f} km", "value": meters},
+            "duration": {"text": f"{meters // 1000} mins", "value": meters},
+        }
+
+    def log_message(self, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = "Measures calculate_distance lookups through the LRU, the DistanceCache table and a local Distance Matrix stand-in"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--routes", type=int, default=50, help="Distinct origin/destination pairs")
+        parser.add_argument("--lookups", type=int, default=2000)
+        parser.add_argument("--latency", type=float, default=0.1, help="Seconds the stand-in waits before answering")
+
+    def handle(self, *args, **options):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), DistanceMatrixStandInHandler)
+        server.latency = options["latency"]
+        server.requests = 0
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/maps/api/distancematrix/json"
+
+        routes = [(f"{index} Benchmark Road Springfield IL, USA", f"{index} Sample Avenue  Austin TX , USA") for index in range(options["routes"])]
+        lookups = [routes[index % len(routes)] for index in range(options["lookups"])]
+
+        # The previous behaviour: a new connection and a round trip per lookup
+        started = time.perf_counter()
+        for origin, destination in lookups[:len(routes)]:
+            requests.get(url, params={"origins": origin, "destinations": destination})
+        uncached = (time.perf_counter() - started) / len(routes)
+
+        with transaction.atomic():
+            matrix = DistanceMatrix(url=url, api_key="benchmark")
+            server.requests = 0
+            misses = self.measure(matrix, routes)
+            fetched = server.requests
+            lru = self.measure(matrix, lookups)
+
+            matrix.lru.clear()
+            database = self.measure(matrix, routes)
+            transaction.set_rollback(True)
+
+        server.shutdown()
+
+        self.stdout.write(f"Routes: {len(routes)}, lookups: {len(lookups)}, stand-in latency: {options['latency'] * 1000:.0f}ms")
+        self.stdout.write(f"Uncached requests.get per lookup: {uncached * 1000:.2f}ms")
+        self.stdout.write(f"Cache miss (pooled session + upsert): p50={statistics.median(misses) * 1000:.2f}ms, stand-in requests: {fetched}")
+        self.stdout.write(f"DistanceCache table hit: p50={statistics.median(database) * 1e6:.0f}us")
+        self.stdout.write(f"LRU hit: p50={statistics.median(lru) * 1e6:.1f}us, stand-in requests after warm-up: {server.requests - fetched}")
+
+    def measure(self, matrix, pairs):
+        timings = []
+
+        for origin, destination in pairs:
+            started = time.perf_counter()
+            matrix.get(origin, destination)
+            timings.append(time.perf_counter() - started)
+
+        return timings
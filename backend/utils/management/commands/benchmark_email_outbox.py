@@ -0,0 +1,109 @@
+import socketserver
+import threading
+import time
+
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from utils.models import OutgoingEmail
+from utils.tasks import send_email, send_queued_emails
+
+BENCHMARK_SUBJECT = "Outbox benchmark"
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """
+    Just enough SMTP to accept and discard messages. Every reply waits
+    ``server.latency`` seconds to stand in for the round trip to a remote relay.
+    """
+
+    def reply(self, line):
+        time.sleep(self.server.latency)
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.reply("220 localhost ready")
+
+        while line := self.rfile.readline():
+            command = line.decode(errors="replace").strip().upper()
+
+            if command.startswith("DATA"):
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+
+                while self.rfile.readline() not in (b".\r\n", b".\n", b""):
+                    pass
+
+                self.server.received += 1
+                self.reply("250 OK")
+            elif command.startswith("QUIT"):
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, latency):
+        super().__init__(("127.0.0.1", 0), SMTPSinkHandler)
+        self.latency = latency
+        self.received = 0
+
+
+class Command(BaseCommand):
+    help = "Compares inline SMTP sends with the email outbox against a local SMTP stand-in"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--emails", type=int, default=200)
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--latency", type=float, default=0.02, help="Seconds the stand-in server waits before each reply")
+
+    def handle(self, *args, **options):
+        sink = SMTPSink(options["latency"])
+        threading.Thread(target=sink.serve_forever, daemon=True).start()
+        host, port = sink.server_address
+
+        def connection(**kwargs):
+            return get_connection(
+                "django.core.mail.backends.smtp.EmailBackend",
+                host=host, port=port, username="", password="", use_tls=False, use_ssl=False, **kwargs
+            )
+
+        count = options["emails"]
+        recipients = [f"buyer{index}@example.com" for index in range(count)]
+        body = "<p>Benchmark</p>" * 20
+
+        # What a request thread used to pay: a new SMTP session per email
+        started = time.perf_counter()
+        for recipient in recipients:
+            message = EmailMessage(BENCHMARK_SUBJECT, body, "noreply@example.com", [recipient], connection=connection())
+            message.content_subtype = "html"
+            message.send()
+        inline = time.perf_counter() - started
+
+        with transaction.atomic():
+            started = time.perf_counter()
+            for recipient in recipients:
+                send_email(BENCHMARK_SUBJECT, body, [recipient])
+            enqueue = time.perf_counter() - started
+
+            worker_connection = connection()
+            queryset = OutgoingEmail.objects.filter(subject=BENCHMARK_SUBJECT)
+            started = time.perf_counter()
+            while send_queued_emails(worker_connection, batch_size=options["batch_size"], queryset=queryset):
+                pass
+            drain = time.perf_counter() - started
+            worker_connection.close()
+
+            sent = queryset.filter(status=1).count()
+            transaction.set_rollback(True)
+
+        sink.shutdown()
+
+        self.stdout.write(f"Emails: {count}, stand-in reply latency: {options['latency'] * 1000:.0f}ms, received by stand-in: {sink.received}")
+        self.stdout.write(f"Inline send, one connection per email: {inline:.2f}s ({inline / count * 1000:.1f}ms per request)")
+        self.stdout.write(f"Outbox enqueue: {enqueue:.2f}s ({enqueue / count * 1000:.2f}ms per request)")
+        self.stdout.write(f"Outbox worker, one connection: {drain:.2f}s for {sent} emails ({sent / drain:.0f} emails/s)")
@@ -0,0 +1,124 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cloudinary
+from cloudinary.utils import api_sign_request, cloudinary_url
+from django.core.management.base import BaseCommand
+
+from utils.cloudinary import UPLOAD_WORKERS, upload_file, upload_files
+
+
+class CloudinaryStandInHandler(BaseHTTPRequestHandler):
+    """
+    Accepts Cloudinary upload API posts, from the SDK or straight from a client
+    with a ``sign_upload`` signature. The request signature is checked with the
+    configured secret and, after ``server.latency`` seconds, the answer carries
+    the same signed ``public_id``/``version`` fields Cloudinary returns.
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        boundary = re.search(r"boundary=([^;]+)", self.headers["Content-Type"]).group(1).strip('"').encode()
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        fields = {}
+
+        # Only the form fields matter here, the file part is skipped without decoding
+        for part in body.split(b"--" + boundary)[1:-1]:
+            headers, _, value = part.partition(b"\r\n\r\n")
+            name = re.search(rb'name="([^"]*)"', headers)
+
+            if name and b"filename=" not in headers:
+                fields[name.group(1).decode()] = value[:-2].decode()
+
+        time.sleep(self.server.latency)
+
+        with self.server.lock:
+            self.server.requests += 1
+
+        config = cloudinary.config()
+        signed = {name: value for name, value in fields.items() if name not in ("api_key", "signature", "resource_type", "cloud_name")}
+
+        if fields.get("signature") != api_sign_request(signed, config.api_secret, config.signature_algorithm, config.signature_version):
+            self.respond(401, {"error": {"message": "Invalid Signature"}})
+            return
+
+        public_id = "/".join(filter(None, (fields.get("folder"), uuid.uuid4().hex)))
+        version = int(time.time())
+        self.respond(200, {
+            "public_id": public_id,
+            "version": version,
+            "signature": api_sign_request({"public_id": public_id, "version": version}, config.api_secret, config.signature_algorithm, 1),
+            "resource_type": "image",
+            "format": "jpg",
+            "secure_url": cloudinary_url(public_id, version=version, format="jpg", secure=True)[0],
+        })
+
+    def respond(self, status, data):
+        body = json.dumps(data).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stand_in(latency):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CloudinaryStandInHandler)
+    server.latency = latency
+    server.requests = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+class Command(BaseCommand):
+    help = "Compares serial and pooled uploads of an inspection's photos against a local Cloudinary stand-in"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--files", type=int, default=40)
+        parser.add_argument("--size", type=int, default=2 * 1024 * 1024, help="Bytes per file")
+        parser.add_argument("--latency", type=float, default=0.5, help="Seconds the stand-in takes per upload")
+
+    def handle(self, *args, **options):
+        server = start_stand_in(options["latency"])
+        cloudinary.config(
+            upload_prefix=f"http://127.0.0.1:{server.server_address[1]}",
+            cloud_name="benchmark",
+            api_key="benchmark",
+            api_secret="benchmark",
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for index in range(options["files"]):
+                path = os.path.join(directory, f"photo-{index}.jpg")
+                with open(path, "wb") as file:
+                    file.write(os.urandom(options["size"]))
+                paths.append(path)
+
+            started = time.perf_counter()
+            for path in paths:
+                upload_file(open(path, "rb"), "benchmark/serial")
+            serial = time.perf_counter() - started
+
+            started = time.perf_counter()
+            upload_files([("exterior", open(path, "rb"), "benchmark/pooled") for path in paths])
+            pooled = time.perf_counter() - started
+
+        server.shutdown()
+
+        self.stdout.write(f"Files: {options['files']} x {options['size']} bytes, stand-in latency: {options['latency'] * 1000:.0f}ms, workers: {UPLOAD_WORKERS}")
+        self.stdout.write(f"Serial: {serial:.2f}s")
+        self.stdout.write(f"Pooled: {pooled:.2f}s ({serial / pooled:.1f}x), stand-in requests: {server.requests}")
@@ -0,0 +1,35 @@
+import time
+
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+
+from utils.tasks import send_queued_emails
+
+
+class Command(BaseCommand):
+    help = "Delivers queued OutgoingEmail rows over a single reused SMTP connection"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--interval", type=float, default=1.0, help="Seconds to sleep when the outbox is empty")
+        parser.add_argument("--once", action="store_true", help="Drain the outbox once and exit")
+
+    def handle(self, *args, **options):
+        connection = get_connection()
+
+        try:
+            while True:
+                processed = send_queued_emails(connection, batch_size=options["batch_size"])
+
+                if processed:
+                    self.stdout.write(f"Processed {processed} emails")
+
+                if options["once"] and not processed:
+                    break
+
+                if not processed:
+                    # Idle SMTP sessions get dropped by the server, reconnect on the next email
+                    connection.close()
+                    time.sleep(options["interval"])
+        finally:
+            connection.close()
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:24
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utils', '0004_alter_city_status_alter_country_status_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+                ('to', models.JSONField(default=list)),
+                ('status', models.IntegerField(db_comment='0=queued,1=sent,2=failed', default=0)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Outgoing Emails',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='utils_outgo_status_1ef994_idx')],
+            },
+        ),
+    ]
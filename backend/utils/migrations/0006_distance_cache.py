@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utils', '0005_outgoing_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DistanceCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(db_comment='sha256 of the normalized origin and destination', max_length=64, unique=True)),
+                ('origin', models.TextField()),
+                ('destination', models.TextField()),
+                ('distance', models.CharField(blank=True, max_length=255, null=True)),
+                ('duration', models.CharField(blank=True, max_length=255, null=True)),
+                ('distance_meters', models.IntegerField(blank=True, null=True)),
+                ('duration_seconds', models.IntegerField(blank=True, null=True)),
+                ('fetched_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Distance Cache',
+            },
+        ),
+    ]
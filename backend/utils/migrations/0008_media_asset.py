@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utils', '0007_coordinates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaAsset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('folder', models.CharField(max_length=255)),
+                ('content_hash', models.CharField(db_comment='sha256 of the uploaded file', max_length=64)),
+                ('url', models.TextField()),
+                ('variants', models.JSONField(blank=True, default=dict)),
+                ('size', models.BigIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Media Assets',
+                'constraints': [models.UniqueConstraint(fields=('folder', 'content_hash'), name='unique_media_asset_content')],
+            },
+        ),
+    ]
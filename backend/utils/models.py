@@ -1,10 +1,13 @@
 from django.db import models
+from django.utils import timezone
 
 
 class City(models.Model):
     name = models.CharField(max_length=255)
     code = models.CharField(max_length=50, blank=True, null=True)
     state = models.ForeignKey("utils.State", related_name="cities", on_delete=models.SET_NULL, null=True, blank=True)
+    latitude = models.FloatField(blank=True, null=True)
+    longitude = models.FloatField(blank=True, null=True)
     # is_active = models.BooleanField(default=True)
     status = models.IntegerField(default=0)
     created_at = models.DateTimeField(blank=True, null=True)
@@ -52,3 +55,63 @@ class Country(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class OutgoingEmail(models.Model):
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    to = models.JSONField(default=list)
+    status = models.IntegerField(default=0, db_comment='0=queued,1=sent,2=failed')
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, null=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Outgoing Emails"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self):
+        return self.subject
+
+
+class DistanceCache(models.Model):
+    key = models.CharField(max_length=64, unique=True, db_comment='sha256 of the normalized origin and destination')
+    origin = models.TextField()
+    destination = models.TextField()
+    distance = models.CharField(max_length=255, blank=True, null=True)
+    duration = models.CharField(max_length=255, blank=True, null=True)
+    distance_meters = models.IntegerField(blank=True, null=True)
+    duration_seconds = models.IntegerField(blank=True, null=True)
+    fetched_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Distance Cache"
+
+    def __str__(self):
+        return f"{self.origin} -> {self.destination}"
+
+
+class MediaAsset(models.Model):
+    folder = models.CharField(max_length=255)
+    content_hash = models.CharField(max_length=64, db_comment='sha256 of the uploaded file')
+    url = models.TextField()
+    variants = models.JSONField(default=dict, blank=True)
+    size = models.BigIntegerField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Media Assets"
+        constraints = [
+            models.UniqueConstraint(fields=["folder", "content_hash"], name="unique_media_asset_content"),
+        ]
+
+    def __str__(self):
+        return self.url
@@ -0,0 +1,258 @@
+import base64
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db import connections
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def cursor_ordering(model):
+    """
+    Newest first on ``(created_at, id)``. Models whose ``created_at`` may be
+    NULL (legacy imports) page on ``id`` alone, since NULLs can't be compared.
+    """
+    field_names = {field.name: field for field in model._meta.concrete_fields}
+    created_at = field_names.get("created_at")
+
+    if created_at is not None and not created_at.null:
+        return ("created_at", "id")
+
+    return ("id",)
+
+
+def estimated_count(queryset, timeout=300):
+    """
+    Row count for admin lists, served from the cache. Unfiltered MySQL tables
+    use the InnoDB statistics, anything else is counted once per ``timeout``.
+    """
+    queryset = queryset.order_by()
+    sql, params = queryset.query.sql_with_params()
+    key = f"list-count:{hashlib.md5(f'{sql}:{params}'.encode()).hexdigest()}"
+    count = cache.get(key)
+
+    if count is None:
+        connection = connections[queryset.db]
+
+        if connection.vendor == "mysql" and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+                count = row[0] if row else None
+
+        if count is None:
+            count = queryset.count()
+
+        cache.set(key, count, timeout)
+
+    return count
+
+
+class CursorPagination(BasePagination):
+    """
+    Keyset pagination in the queryset's own order: the view's ``order_by`` or
+    a ``?ordering=`` from ``OrderingFilter``, newest first on the model's
+    ``cursor_ordering`` when it has none. The body stays the plain list the
+    clients already read; the neighbouring pages are linked from the ``Link``
+    header.
+    """
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    cursor_query_param = "cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not isinstance(queryset, QuerySet):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        position, self.reverse = self.decode_cursor(request)
+
+        if position is not None:
+            queryset = self.after(queryset, position, self.reverse)
+
+        ordering = [f"{'' if descending == self.reverse else '-'}{field.attname}" for field, descending in self.ordering]
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = rows
+
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(data, headers=self.get_headers())
+
+    def get_headers(self):
+        links = []
+
+        if self.page and self.has_next:
+            links.append(f'<{self.get_link(self.page[-1], reverse=False)}>; rel="next"')
+
+        if self.page and self.has_previous:
+            links.append(f'<{self.get_link(self.page[0], reverse=True)}>; rel="prev"')
+
+        return {"Link": ", ".join(links)} if links else {}
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_ordering(self, queryset):
+        # ``(field, descending)`` pairs ending on a unique column, so every row has
+        # exactly one position. NULLs can't be compared in the keyset, and neither
+        # can expressions or columns of related tables, so those orderings are refused.
+        opts = queryset.model._meta
+        terms = queryset.query.order_by or opts.ordering or [f"-{name}" for name in cursor_ordering(queryset.model)]
+        ordering = []
+
+        for term in terms:
+            if not isinstance(term, str) or term == "?":
+                raise ValidationError({"error": "This list can't be paged in that order"})
+
+            name = term.removeprefix("-")
+
+            try:
+                field = opts.pk if name == "pk" else opts.get_field(name)
+            except FieldDoesNotExist:
+                raise ValidationError({"error": f"This list can't be ordered by {name}"})
+
+            if not field.concrete or field.many_to_many or field.null:
+                raise ValidationError({"error": f"This list can't be ordered by {name}"})
+
+            ordering.append((field, term.startswith("-")))
+
+            if field.primary_key or field.unique:
+                return ordering
+
+        return [*ordering, (opts.pk, ordering[-1][1])]
+
+    def after(self, queryset, position, reverse):
+        # Rows strictly past the position in the page order, or before it when
+        # ``reverse``. The leading range on the first column lets MySQL walk the
+        # index instead of the OR.
+        lookups = ["lt" if descending != reverse else "gt" for _, descending in self.ordering]
+        fields = [field.attname for field, _ in self.ordering]
+        keyset = Q()
+
+        for index, field in enumerate(fields):
+            keyset |= Q(
+                **{previous: position[offset] for offset, previous in enumerate(fields[:index])},
+                **{f"{field}__{lookups[index]}": position[index]},
+            )
+
+        return queryset.filter(**{f"{fields[0]}__{lookups[0]}e": position[0]}).filter(keyset)
+
+    def get_link(self, row, reverse):
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.encode_cursor(row, reverse))
+
+    def get_signature(self):
+        return [f"{'-' if descending else ''}{field.attname}" for field, descending in self.ordering]
+
+    def encode_cursor(self, row, reverse=False):
+        payload = {"o": self.get_signature(), "p": [field.value_to_string(row) for field, _ in self.ordering], "r": int(reverse)}
+
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    def decode_cursor(self, request, query_param=None):
+        cursor = request.query_params.get(query_param or self.cursor_query_param)
+
+        if not cursor:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+            # A cursor only points into the ordering it was taken from
+            if payload["o"] != self.get_signature() or len(payload["p"]) != len(self.ordering):
+                raise ValueError
+
+            position = [field.to_python(value) for (field, _), value in zip(self.ordering, payload["p"])]
+
+            if None in position:
+                raise ValueError
+        except (TypeError, ValueError, KeyError, DjangoValidationError):
+            raise NotFound("Invalid cursor")
+
+        return position, bool(payload.get("r"))
+
+
+class AdminCursorPagination(CursorPagination):
+    """
+    Adds an ``X-Total-Count`` header from ``estimated_count`` when the admin
+    asks for it with ``?count=true``.
+    """
+    count_query_param = "count"
+    count_cache_timeout = 300
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+
+        if isinstance(queryset, QuerySet) and request.query_params.get(self.count_query_param, "").lower() in ("1", "true"):
+            self.count = estimated_count(queryset, self.count_cache_timeout)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_headers(self):
+        headers = super().get_headers()
+
+        if self.count is not None:
+            headers["X-Total-Count"] = str(self.count)
+
+        return headers
+
+
+class SyncCursorPagination(CursorPagination):
+    """
+    Incremental sync on top of the keyset pages. The first page carries an
+    ``X-Sync-Cursor`` for its first row; sending it back as ``?since=`` limits
+    the list to rows ahead of it in the page order (newer ones by default), so
+    polling only reads the delta.
+    """
+    since_query_param = "since"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not isinstance(queryset, QuerySet):
+            return None
+
+        self.ordering = self.get_ordering(queryset)
+        self.since = request.query_params.get(self.since_query_param)
+        since, _ = self.decode_cursor(request, self.since_query_param)
+
+        if since is not None:
+            queryset = self.after(queryset, since, reverse=True)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_headers(self):
+        headers = super().get_headers()
+
+        if self.request.query_params.get(self.cursor_query_param):
+            return headers
+
+        if self.page:
+            headers["X-Sync-Cursor"] = self.encode_cursor(self.page[0])
+        elif self.since:
+            headers["X-Sync-Cursor"] = self.since
+
+        return headers
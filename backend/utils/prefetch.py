@@ -0,0 +1,75 @@
+from collections import defaultdict
+
+
+def nested(prefix, paths):
+    return tuple(f"{prefix}__{path}" for path in paths)
+
+
+def instance_values(instances):
+    """
+    Same rows as ``queryset.values()`` but built from already loaded instances.
+    """
+    return [
+        {field.attname: getattr(instance, field.attname) for field in instance._meta.concrete_fields}
+        for instance in instances
+    ]
+
+
+def attach_by_auction_id(instances, plan):
+    """
+    Loads rows keyed by the string ``auction_id`` for all instances in one query
+    per entry of ``plan`` and stores them on ``prefetched_<name>``.
+    """
+    auction_ids = {instance.auction_id for instance in instances if instance.auction_id}
+
+    for name, queryset in plan.items():
+        grouped = defaultdict(list)
+
+        if auction_ids:
+            for row in queryset.filter(auction_id__in=auction_ids):
+                grouped[row.auction_id].append(row)
+
+        for instance in instances:
+            setattr(instance, f"prefetched_{name}", grouped.get(instance.auction_id, []))
+
+
+def auction_related(instance, name, queryset):
+    """
+    Rows attached by ``attach_by_auction_id``, or a query when the instance was
+    loaded without the plan (detail views).
+    """
+    rows = getattr(instance, f"prefetched_{name}", None)
+
+    if rows is None:
+        rows = list(queryset.filter(auction_id=instance.auction_id))
+
+    return rows
+
+
+class PrefetchPlanMixin:
+    """
+    Applies the view's query plan so nested serializers read from the
+    select/prefetch caches instead of querying per row.
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    prefetch_by_auction_id = {}
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*self.prefetch_related_fields)
+
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        if kwargs.get("many") and args and self.prefetch_by_auction_id:
+            instances = list(args[0])
+            attach_by_auction_id(instances, self.prefetch_by_auction_id)
+            args = (instances, *args[1:])
+
+        return super().get_serializer(*args, **kwargs)
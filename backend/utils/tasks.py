@@ -1,21 +1,108 @@
+from datetime import timedelta
 from logging import getLogger
 
 from django.conf import settings
 from django.core.mail import EmailMessage
+from django.db import transaction
+from django.utils import timezone
+
+from utils.models import OutgoingEmail
 
 logger = getLogger("awd")
 
+MAX_EMAIL_ATTEMPTS = 5
+EMAIL_RETRY_BACKOFF = timedelta(seconds=30)
+EMAIL_CLAIM_TIMEOUT = timedelta(minutes=10)
+
 
 def send_email(email_subject, email_message, to_email):
-    email = EmailMessage(
-        subject=email_subject,
-        body=email_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        to=to_email,
-    )
-    email.content_subtype = "html"
+    # Queued in the outbox with the rendered body; the send_emails worker delivers it
+    recipients = [address for address in to_email if address]
+
+    if not recipients:
+        logger.warning(f"Dropped email {email_subject!r} without recipients")
+        return
 
     try:
-        email.send()
+        OutgoingEmail.objects.create(subject=email_subject, body=email_message, to=recipients)
     except Exception as e:
-        logger.exception(f"Failed to send email to {to_email}. Error {e}")
+        logger.exception(f"Failed to queue email to {to_email}. Error {e}")
+
+
+def send_queued_emails(connection, batch_size=50, queryset=None):
+    """
+    Delivers up to ``batch_size`` due outbox rows over ``connection``, which is
+    kept open across batches. The rows are claimed in a short transaction (SKIP
+    LOCKED, so several workers can drain the outbox), then each message is sent
+    and its result recorded on its own with no locks held, so one refused
+    message doesn't hold back or resend the others. Failures are retried with
+    exponential backoff.
+    """
+    queryset = OutgoingEmail.objects.all() if queryset is None else queryset
+
+    with transaction.atomic():
+        emails = list(
+            queryset.select_for_update(skip_locked=True)
+            .filter(status=0, next_attempt_at__lte=timezone.now())
+            .order_by("id")[:batch_size]
+        )
+
+        if not emails:
+            return 0
+
+        # Leased until the claim runs out, so a worker that dies mid-send has its rows picked up again
+        leased_until = timezone.now() + EMAIL_CLAIM_TIMEOUT
+        OutgoingEmail.objects.filter(id__in=[email.id for email in emails]).update(next_attempt_at=leased_until)
+
+        for email in emails:
+            email.next_attempt_at = leased_until
+
+    for index, email in enumerate(emails):
+        try:
+            connection.open()
+        except Exception as e:
+            for pending in emails[index:]:
+                retry_email(pending, e)
+                record_email(pending)
+            break
+
+        message = EmailMessage(
+            subject=email.subject,
+            body=email.body,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=email.to,
+            connection=connection,
+        )
+        message.content_subtype = "html"
+
+        try:
+            connection.send_messages([message])
+        except Exception as e:
+            retry_email(email, e)
+            # Reconnect for the next message in case the failure left the session unusable
+            connection.close()
+        else:
+            email.status = 1
+            email.attempts += 1
+            email.sent_at = timezone.now()
+            email.last_error = None
+
+        # Recorded as soon as it's known, so a worker dying mid-batch doesn't resend what went out
+        record_email(email)
+
+    return len(emails)
+
+
+def record_email(email):
+    email.save(update_fields=["status", "attempts", "next_attempt_at", "last_error", "sent_at", "updated_at"])
+
+
+def retry_email(email, error):
+    email.attempts += 1
+    email.last_error = str(error)
+
+    if email.attempts >= MAX_EMAIL_ATTEMPTS:
+        email.status = 2
+        logger.error(f"Giving up on email {email.id} to {email.to} after {email.attempts} attempts. Error {error}")
+    else:
+        email.next_attempt_at = timezone.now() + EMAIL_RETRY_BACKOFF * 2 ** (email.attempts - 1)
@@ -1,3 +1,158 @@
+import re
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from utils.google_maps import DistanceMatrix
+from utils.models import OutgoingEmail, State
+from utils.paginations import CursorPagination
+from utils.tasks import EMAIL_RETRY_BACKOFF, MAX_EMAIL_ATTEMPTS, send_email, send_queued_emails
+
+
+class CursorPaginationTestCase(TestCase):
+    def setUp(self):
+        for index, status in enumerate((1, 0, 1, 0, 1)):
+            State.objects.create(name=f"S{index}", status=status)
+
+    def paginate(self, queryset, url="/states/?page_size=2"):
+        paginator = CursorPagination()
+        rows = paginator.paginate_queryset(queryset, Request(APIRequestFactory().get(url)))
+        links = dict((rel, link) for link, rel in re.findall(r'<([^>]+)>; rel="(\w+)"', paginator.get_headers().get("Link", "")))
+
+        return [row.name for row in rows], links
+
+    def walk(self, queryset):
+        names, links = self.paginate(queryset)
+
+        while "next" in links:
+            page, links = self.paginate(queryset, links["next"])
+            names += page
+
+        return names
+
+    def test_pages_newest_first_by_default(self):
+        names, links = self.paginate(State.objects.all())
+
+        self.assertEqual(names, ["S4", "S3"])
+        self.assertEqual(set(links), {"next"})
+        self.assertEqual(self.walk(State.objects.all()), ["S4", "S3", "S2", "S1", "S0"])
+
+    def test_prev_link_returns_the_page_before(self):
+        _, links = self.paginate(State.objects.all())
+        names, links = self.paginate(State.objects.all(), links["next"])
+
+        self.assertEqual(names, ["S2", "S1"])
+        self.assertEqual(self.paginate(State.objects.all(), links["prev"])[0], ["S4", "S3"])
+
+    def test_pages_follow_the_querysets_ordering(self):
+        queryset = State.objects.order_by("status", "-id")
+
+        self.assertEqual(self.walk(queryset), [state.name for state in queryset])
+        self.assertEqual(self.walk(State.objects.order_by("id")), ["S0", "S1", "S2", "S3", "S4"])
+
+    def test_ordering_that_cant_be_paged_is_refused(self):
+        for queryset in (State.objects.order_by("code"), State.objects.order_by("country__name"), State.objects.order_by("?")):
+            with self.subTest(queryset.query.order_by), self.assertRaises(ValidationError):
+                self.paginate(queryset)
+
+    def test_cursor_from_another_ordering_is_invalid(self):
+        _, links = self.paginate(State.objects.all())
+
+        with self.assertRaises(NotFound):
+            self.paginate(State.objects.order_by("id"), links["next"])
+
+
+class RecordingBackend(EmailBackend):
+    def __init__(self, *args, error=None, refused=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.error = error
+        self.refused = set(refused)
+        self.calls = []
+
+    def send_messages(self, messages):
+        self.calls.append(len(messages))
+
+        if self.error:
+            raise self.error
+
+        if any(address in self.refused for message in messages for address in message.to):
+            raise OSError("Recipient refused")
+
+        return super().send_messages(messages)
+
+
+class EmailOutboxTestCase(TestCase):
+    def setUp(self):
+        for index in range(3):
+            send_email(f"Email {index}", "<p>Body</p>", [f"user{index}@example.com"])
+
+    def test_messages_go_out_over_one_connection(self):
+        connection = RecordingBackend()
+
+        self.assertEqual(send_queued_emails(connection), 3)
+        self.assertEqual(connection.calls, [1, 1, 1])
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(set(OutgoingEmail.objects.values_list("status", "attempts")), {(1, 1)})
+        self.assertEqual(send_queued_emails(connection), 0)
+
+    def test_refused_message_only_retries_its_row(self):
+        self.assertEqual(send_queued_emails(RecordingBackend(refused={"user1@example.com"})), 3)
+
+        self.assertEqual([message.to for message in mail.outbox], [["user0@example.com"], ["user2@example.com"]])
+        self.assertEqual(
+            list(OutgoingEmail.objects.order_by("id").values_list("status", "attempts", "last_error")),
+            [(1, 1, None), (0, 1, "Recipient refused"), (1, 1, None)],
+        )
+
+    def test_failed_sends_back_off_exponentially(self):
+        connection = RecordingBackend(error=OSError("Connection refused"))
+
+        for attempt in (1, 2):
+            OutgoingEmail.objects.update(next_attempt_at=timezone.now())
+            started = timezone.now()
+
+            self.assertEqual(send_queued_emails(connection), 3)
+
+            for email in OutgoingEmail.objects.all():
+                self.assertEqual((email.status, email.attempts, email.last_error), (0, attempt, "Connection refused"))
+                self.assertGreaterEqual(email.next_attempt_at, started + EMAIL_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+            # Not due again until the backoff runs out
+            self.assertEqual(send_queued_emails(connection), 0)
+
+        self.assertEqual(mail.outbox, [])
+
+    def test_gives_up_after_the_last_attempt(self):
+        OutgoingEmail.objects.update(attempts=MAX_EMAIL_ATTEMPTS - 1)
+
+        with self.assertLogs("awd", "ERROR"):
+            send_queued_emails(RecordingBackend(error=OSError("Connection refused")))
+
+        self.assertEqual(set(OutgoingEmail.objects.values_list("status", "attempts")), {(2, MAX_EMAIL_ATTEMPTS)})
+
+    def test_rows_are_claimed_before_sending(self):
+        due = []
+        connection = RecordingBackend()
+        connection.send_messages = lambda messages: due.append(OutgoingEmail.objects.filter(next_attempt_at__lte=timezone.now()).count())
+        send_queued_emails(connection, batch_size=2)
+
+        # Only the row left out of the batch was still due while the batch was out
+        self.assertEqual(due, [1, 1])
+        self.assertEqual(OutgoingEmail.objects.filter(status=0).count(), 1)
+
+
+class DistanceMatrixTestCase(TestCase):
+    def test_nothing_is_requested_without_an_api_key(self):
+        matrix = DistanceMatrix(api_key="")
+
+        with mock.patch.object(matrix.session, "get") as get:
+            self.assertEqual(matrix.get_many([("Austin, TX", "Dallas, TX")]), {("Austin, TX", "Dallas, TX"): None})
+            matrix.get_many([("Austin, TX", "Houston, TX")], wait=False)
 
-# Create your tests here.
+        get.assert_not_called()
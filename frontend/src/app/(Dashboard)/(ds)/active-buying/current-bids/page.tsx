@@ -4,6 +4,7 @@ import DataTable from "@/components/common/DataTable";
 import AuctionSearchBar from "@/components/ds/AuctionSearchBar";
 import OfferNowModal from "@/components/modals/OfferNowModal";
 import axios from "axios";
+import { useNextPage } from "@/hooks/useNextPage";
 
 // Status code to label mapping for request status (following tasks page mapping)
 const REQUEST_STATUS_MAP: Record<number, string> = {
@@ -138,6 +139,26 @@ export default function DsActiveBuyingCurrentBids() {
   const [expandedRowKey, setExpandedRowKey] = useState<number | null>(null);
   const [offerModalOpen, setOfferModalOpen] = useState(false);
   const [offerRowKey, setOfferRowKey] = useState<number | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapCurrentBid = (item: any, index: number) => {
+    const req = item.request_id || {};
+    return {
+      key: item.id || index + 1,
+      vin: req.vin ? req.vin.slice(-6) : '-',
+      auctionId: item.auction_id || item.id || '',
+      vehicle: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
+      bidPrice: item.last_bid_id?.bid || 0,
+      status: req.status || 0, // Use status from request_id object
+      image: req.image || "/images/auth-background.jpg",
+      bids: item.bids ? item.bids.map((bid: any) => ({
+        buyer: bid.buyer_name || bid.buyer || 'Unknown',
+        bidDate: bid.created_at ? new Date(bid.created_at).toLocaleString("en-GB").replace(",", "") : new Date().toLocaleString("en-GB").replace(",", ""),
+        bidPrice: bid.amount || bid.bid_price || 0,
+        status: bid.status || 'Pending',
+      })) : [],
+    };
+  };
 
   useEffect(() => {
     const fetchData = async () => {
@@ -148,26 +169,10 @@ export default function DsActiveBuyingCurrentBids() {
         const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         const response = await axios.get(`${apiUrl}/auctions/api/v1/current-buying/`, { headers });
+        trackPage(response);
         
         // Map API response to table data shape
-        const mapped = (response.data || []).map((item: any, index: number) => {
-          const req = item.request_id || {};
-          return {
-            key: item.id || index + 1,
-            vin: req.vin ? req.vin.slice(-6) : '-',
-            auctionId: item.auction_id || item.id || '',
-            vehicle: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
-            bidPrice: item.last_bid_id?.bid || 0,
-            status: req.status || 0, // Use status from request_id object
-            image: req.image || "/images/auth-background.jpg",
-            bids: item.bids ? item.bids.map((bid: any) => ({
-              buyer: bid.buyer_name || bid.buyer || 'Unknown',
-              bidDate: bid.created_at ? new Date(bid.created_at).toLocaleString("en-GB").replace(",", "") : new Date().toLocaleString("en-GB").replace(",", ""),
-              bidPrice: bid.amount || bid.bid_price || 0,
-              status: bid.status || 'Pending',
-            })) : [],
-          };
-        });
+        const mapped = (response.data || []).map(mapCurrentBid);
         setData(mapped);
       } catch (err: any) {
         setError(err?.response?.data?.detail || err?.message || "Failed to fetch current bids.");
@@ -250,6 +255,9 @@ export default function DsActiveBuyingCurrentBids() {
           onExpand: handleExpand,
         }}
         tableData={{ isEnableFilterInput: false }}
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapCurrentBid)]))}
       />
       <OfferNowModal
         open={offerModalOpen}
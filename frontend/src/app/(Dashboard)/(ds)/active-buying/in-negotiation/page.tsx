@@ -7,6 +7,7 @@ import { Button } from "antd";
 import { CheckCircleOutlined, CloseCircleOutlined, EditOutlined } from "@ant-design/icons";
 import axios from "axios";
 import { showErrorToast, showSuccessToast } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
 
 export default function DsActiveBuyingInNegotiation() {
   const [search, setSearch] = useState("");
@@ -16,6 +17,40 @@ export default function DsActiveBuyingInNegotiation() {
   const [changeModalOpen, setChangeModalOpen] = useState(false);
   const [selectedRecord, setSelectedRecord] = useState<any>(null);
   const [changeLoading, setChangeLoading] = useState(false);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapNegotiation = (item: any, index: number) => {
+    const req = item.request_id || {};
+
+    const bidPrice = item.amount || item.last_bid_id?.bid || 0;
+    const changedAmount = item.changed_amount || 0;
+
+    // Status logic based on the flags
+    let status = 'Pending';
+    if (item.is_accepted === 1) {
+      status = 'Accepted';
+    } else if (item.is_rejected === 1) {
+      status = 'Rejected';
+    } else if (item.is_expire === 1) {
+      status = 'Expired';
+    } else if (item.price_change_requested_by_buyer === true) {
+      status = 'Change Requested by Buyer';
+    } else if (item.price_change_requested_by_seller === true) {
+      status = 'Change Requested by Seller';
+    }
+
+    return {
+      key: item.id || index + 1,
+      vin: req.vin ? req.vin.slice(-6) : '-',
+      auctionId: item.auction_id || item.id || '',
+      vehicle: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
+      bidPrice,
+      changedAmount,
+      status,
+      image: req.image || "/images/auth-background.jpg",
+      originalData: item, // Keep original data for API calls
+    };
+  };
 
   const handleConfirm = async (record: any) => {
     try {
@@ -233,40 +268,10 @@ export default function DsActiveBuyingInNegotiation() {
         const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         const response = await axios.get(`${apiUrl}/auctions/api/v1/buying-in-negotiation/`, { headers });
+        trackPage(response);
         
         // Map API response to table data shape
-        const mapped = (response.data || []).map((item: any, index: number) => {
-          const req = item.request_id || {};
-          
-          const bidPrice = item.amount || item.last_bid_id?.bid || 0;
-          const changedAmount = item.changed_amount || 0;
-          
-          // Status logic based on the flags
-          let status = 'Pending';
-          if (item.is_accepted === 1) {
-            status = 'Accepted';
-          } else if (item.is_rejected === 1) {
-            status = 'Rejected';
-          } else if (item.is_expire === 1) {
-            status = 'Expired';
-          } else if (item.price_change_requested_by_buyer === true) {
-            status = 'Change Requested by Buyer';
-          } else if (item.price_change_requested_by_seller === true) {
-            status = 'Change Requested by Seller';
-          }
-          
-          return {
-            key: item.id || index + 1,
-            vin: req.vin ? req.vin.slice(-6) : '-',
-            auctionId: item.auction_id || item.id || '',
-            vehicle: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
-            bidPrice,
-            changedAmount,
-            status,
-            image: req.image || "/images/auth-background.jpg",
-            originalData: item, // Keep original data for API calls
-          };
-        });
+        const mapped = (response.data || []).map(mapNegotiation);
         setData(mapped);
       } catch (err: any) {
         setError(err?.response?.data?.detail || err?.message || "Failed to fetch buying in negotiation data.");
@@ -309,6 +314,9 @@ export default function DsActiveBuyingInNegotiation() {
         columns={columns}
         data={filteredData}
         tableData={{ isEnableFilterInput: false }}
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapNegotiation)]))}
       />
       
       <ChangeBidPriceModal
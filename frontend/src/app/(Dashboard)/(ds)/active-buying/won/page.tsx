@@ -8,6 +8,8 @@ const { TextArea } = Input;
 import DataTable from "@/components/common/DataTable";
 import axios from "axios";
 import { showErrorToast, showSuccessToast } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
+import { fetchAllPages } from "@/lib/pagination";
 
 // Status code to label mapping
 const STATUS_MAP: Record<number, string> = {
@@ -480,8 +482,9 @@ function ConfirmationTab({ bid, onConfirm }: { bid: WonBid; onConfirm: (values:
       const apiUrl = process.env.NEXT_PUBLIC_API_URL;
       const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
-      const response = await axios.get(`${apiUrl}/users/api/v1/dealer-locations/`, { headers });
-      setLocations(response.data || []);
+      // Every location is an option, so read all the pages of the list
+      const locationList = await fetchAllPages(`${apiUrl}/users/api/v1/dealer-locations/`, { headers });
+      setLocations(locationList || []);
     } catch (error) {
       console.error('Failed to fetch locations:', error);
       showErrorToast(error, "Locations");
@@ -921,6 +924,31 @@ export default function DsActiveBuyingWon() {
   const [wonBids, setWonBids] = useState<WonBid[]>([]);
   const [loading, setLoading] = useState(true);
   const [expandedRowKey, setExpandedRowKey] = useState<string | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapWonBid = (item: any, idx: number) => {
+    const req = item.request_id || {};
+    const reservePrice = item.reserve_price || req.reserve_price || null;
+    const status = req.status || 0;
+    const statusLabel = STATUS_MAP[status] || 'Unknown';
+    const wonPrice = item.last_bid_id?.bid || 0;
+
+    return {
+      key: item.id || idx,
+      auctionId: item.auction_id,
+      wonAt: item.won_at,
+      expectedPrice: item.expected_price,
+      wonPrice: wonPrice,
+      reservePrice: reservePrice,
+      vehicleInfo: req ? `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() : 'N/A',
+      vin: req.vin || 'N/A',
+      stockNo: req.stock_no || 'N/A',
+      odometer: req.odometer || 'N/A',
+      originalData: item, // Store full original data
+      status: status,
+      statusLabel: statusLabel,
+    };
+  };
 
   const fetchData = async () => {
     setLoading(true);
@@ -930,30 +958,9 @@ export default function DsActiveBuyingWon() {
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       
       const response = await axios.get(`${apiUrl}/auctions/api/v1/buying-won/`, { headers });
+      trackPage(response);
       
-      const mapped = (response.data || []).map((item: any, idx: number) => {
-        const req = item.request_id || {};
-        const reservePrice = item.reserve_price || req.reserve_price || null;
-        const status = req.status || 0;
-        const statusLabel = STATUS_MAP[status] || 'Unknown';
-        const wonPrice = item.last_bid_id?.bid || 0;
-        
-        return {
-          key: item.id || idx,
-          auctionId: item.auction_id,
-          wonAt: item.won_at,
-          expectedPrice: item.expected_price,
-          wonPrice: wonPrice,
-          reservePrice: reservePrice,
-          vehicleInfo: req ? `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() : 'N/A',
-          vin: req.vin || 'N/A',
-          stockNo: req.stock_no || 'N/A',
-          odometer: req.odometer || 'N/A',
-          originalData: item, // Store full original data
-          status: status,
-          statusLabel: statusLabel,
-        };
-      });
+      const mapped = (response.data || []).map(mapWonBid);
       
       setWonBids(mapped);
     } catch (error) {
@@ -1101,6 +1108,9 @@ export default function DsActiveBuyingWon() {
             setExpandedRowKey(expanded ? record.key : null);
           },
         }}
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={() => loadMore(rows => setWonBids(prev => [...prev, ...rows.map(mapWonBid)]))}
       />
     </div>
   );
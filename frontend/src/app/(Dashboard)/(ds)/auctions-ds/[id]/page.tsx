@@ -4,6 +4,7 @@ import { useParams } from "next/navigation";
 import { useSelector } from "react-redux";
 import { RootState } from "@/store";
 import axios from "axios";
+import { parseReportSection } from "@/lib/utils";
 
 const SECTION_FIELDS: { [key: string]: { key: string; label: string }[] } = {
   EXTERIOR: [
@@ -102,25 +103,25 @@ function getSectionData(section: string, data: any) {
   let sectionData = {};
   switch (section) {
     case "EXTERIOR":
-      sectionData = req.exterior ? JSON.parse(req.exterior) : {};
+      sectionData = parseReportSection(req.exterior);
       break;
     case "FRAME & UNIBODY":
-      sectionData = req.frame ? JSON.parse(req.frame) : {};
+      sectionData = parseReportSection(req.frame);
       break;
     case "MECHANICALS":
-      sectionData = req.mechanical ? JSON.parse(req.mechanical) : {};
+      sectionData = parseReportSection(req.mechanical);
       break;
     case "DRIVEABILITY":
-      sectionData = req.drivability ? JSON.parse(req.drivability) : {};
+      sectionData = parseReportSection(req.drivability);
       break;
     case "WARNING LIGHTS":
-      sectionData = req.warning_lights ? JSON.parse(req.warning_lights) : {};
+      sectionData = parseReportSection(req.warning_lights);
       break;
     case "INTERIOR":
-      sectionData = req.interior ? JSON.parse(req.interior) : {};
+      sectionData = parseReportSection(req.interior);
       break;
     case "WHEEL & TIRES":
-      sectionData = req.wheels ? JSON.parse(req.wheels) : {};
+      sectionData = parseReportSection(req.wheels);
       break;
     default:
       sectionData = {};
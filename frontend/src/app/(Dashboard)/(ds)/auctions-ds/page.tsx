@@ -6,6 +6,8 @@ import AuctionListCard from "@/components/ds/AuctionListCard";
 import AuctionListPagination from "@/components/ds/AuctionListPagination";
 import AuctionListEmptyState from "@/components/ds/AuctionListEmptyState";
 import axios from "axios";
+import { useNextPage } from "@/hooks/useNextPage";
+import LoadMoreButton from "@/components/common/LoadMoreButton";
 
 const filterOptions = {
   makeModel: [
@@ -53,6 +55,73 @@ export default function DsAuctions() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [auctions, setAuctions] = useState<any[]>([]);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapAuction = (item: any) => {
+    const req = item.request_id || item; // fallback to item if no request_id
+    const colors = Array.isArray(req.lights)
+      ? req.lights.map((color: string) => ({ color, label: color.charAt(0).toUpperCase() + color.slice(1) }))
+      : [];
+    // Map status number to label and color
+    let labelText = '';
+    let labelColor = '';
+    let statusLabel = '';
+    if (typeof item.status === 'number') {
+      switch (item.status) {
+        case 0:
+          labelText = 'Coming Soon';
+          labelColor = '#64748b';
+          statusLabel = 'Coming Soon';
+          break;
+        case 1:
+          labelText = 'Live';
+          labelColor = '#22c55e';
+          statusLabel = 'Live';
+          break;
+        case 2:
+          labelText = 'In Negotiation';
+          labelColor = '#eab308';
+          statusLabel = 'In Negotiation';
+          break;
+        case 3:
+          labelText = 'Ended';
+          labelColor = '#ef4444';
+          statusLabel = 'Ended';
+          break;
+        default:
+          labelText = 'Unknown';
+          labelColor = '#64748b';
+          statusLabel = 'Unknown';
+      }
+    } else if (typeof item.status === 'string') {
+      labelText = item.status;
+      labelColor = '#64748b';
+      statusLabel = item.status;
+    }
+
+    const safe = (v: any) => v === undefined || v === null || v === '' ? '-' : v;
+
+    return {
+      id: item.id || req.id,
+      auctionId: item.auction_id || req.auction_id,
+      image: req.image || "/images/auth-background.jpg",
+      title: `${safe(req.year)} ${safe(req.make)} ${safe(req.model)}`.replace(/-/g, '').trim() || 'Vehicle',
+      vin: req.vin ? req.vin.slice(-6) : '-',
+      colors,
+      specs: [
+        { label: 'Mileage', value: safe(req.odometer) },
+        { label: 'Transmission', value: safe(req.transmission) },
+        { label: 'Drivetrain', value: safe(req.drivetrain) },
+      ],
+      status: statusLabel,
+      labelText,
+      labelColor,
+      price: req.expected_price ? `$${Number(req.expected_price).toLocaleString()}` : 'N/A',
+      miles: req.odometer ? `${Number(req.odometer).toLocaleString()}` : null,
+      hasBids: item.last_bid_id !== null,
+      currentBid: item.last_bid_id?.bid || null,
+    };
+  };
 
   // Fetch auctions function
   const fetchAuctions = async () => {
@@ -63,72 +132,9 @@ export default function DsAuctions() {
       const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       const response = await axios.get(`${apiUrl}/auctions/api/v1/marketplace/`, { headers });
+      trackPage(response);
       // Robust mapping as in upcoming-auctions
-      const mapped = (response.data || []).map((item: any) => {
-        const req = item.request_id || item; // fallback to item if no request_id
-        const colors = Array.isArray(req.lights)
-          ? req.lights.map((color: string) => ({ color, label: color.charAt(0).toUpperCase() + color.slice(1) }))
-          : [];
-        // Map status number to label and color
-        let labelText = '';
-        let labelColor = '';
-        let statusLabel = '';
-        if (typeof item.status === 'number') {
-          switch (item.status) {
-            case 0:
-              labelText = 'Coming Soon';
-              labelColor = '#64748b';
-              statusLabel = 'Coming Soon';
-              break;
-            case 1:
-              labelText = 'Live';
-              labelColor = '#22c55e';
-              statusLabel = 'Live';
-              break;
-            case 2:
-              labelText = 'In Negotiation';
-              labelColor = '#eab308';
-              statusLabel = 'In Negotiation';
-              break;
-            case 3:
-              labelText = 'Ended';
-              labelColor = '#ef4444';
-              statusLabel = 'Ended';
-              break;
-            default:
-              labelText = 'Unknown';
-              labelColor = '#64748b';
-              statusLabel = 'Unknown';
-          }
-        } else if (typeof item.status === 'string') {
-          labelText = item.status;
-          labelColor = '#64748b';
-          statusLabel = item.status;
-        }
-        
-        const safe = (v: any) => v === undefined || v === null || v === '' ? '-' : v;
-        
-        return {
-          id: item.id || req.id,
-          auctionId: item.auction_id || req.auction_id,
-          image: req.image || "/images/auth-background.jpg",
-          title: `${safe(req.year)} ${safe(req.make)} ${safe(req.model)}`.replace(/-/g, '').trim() || 'Vehicle',
-          vin: req.vin ? req.vin.slice(-6) : '-',
-          colors,
-          specs: [
-            { label: 'Mileage', value: safe(req.odometer) },
-            { label: 'Transmission', value: safe(req.transmission) },
-            { label: 'Drivetrain', value: safe(req.drivetrain) },
-          ],
-          status: statusLabel,
-          labelText,
-          labelColor,
-          price: req.expected_price ? `$${Number(req.expected_price).toLocaleString()}` : 'N/A',
-          miles: req.odometer ? `${Number(req.odometer).toLocaleString()}` : null,
-          hasBids: item.last_bid_id !== null,
-          currentBid: item.last_bid_id?.bid || null,
-        };
-      });
+      const mapped = (response.data || []).map(mapAuction);
       setAuctions(mapped);
     } catch (err: any) {
       setError(err?.response?.data?.detail || err?.message || "Failed to fetch auctions.");
@@ -222,6 +228,7 @@ export default function DsAuctions() {
             onPageChange={setPage}
             onPageSizeChange={size => { setPageSize(size); setPage(1); }}
           />
+          <LoadMoreButton nextPage={nextPage} loading={loadingMore} onClick={() => loadMore(rows => setAuctions(prev => [...prev, ...rows.map(mapAuction)]))} />
         </div>
         
         {/* Desktop sidebar */}
@@ -6,6 +6,7 @@ import AuctionSearchBar from "@/components/ds/AuctionSearchBar";
 import OfferNowModal from "@/components/modals/OfferNowModal";
 import axios from "axios";
 import { showErrorToast, showSuccessToast } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
 
 // Status code to label mapping
 const STATUS_MAP: Record<number, string> = {
@@ -163,6 +164,23 @@ export default function DsEndedAuctionsOfferNow() {
   const [offerModalOpen, setOfferModalOpen] = useState(false);
   const [selectedAuctionKey, setSelectedAuctionKey] = useState<number | null>(null);
   const [submitting, setSubmitting] = useState(false);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapOfferAuction = (item: any, idx: number) => {
+    const req = item.request_id || {};
+
+    return {
+      key: item.id || idx + 1,
+      vin: req.vin ? String(req.vin).slice(-6) : '-',
+      auctionId: req.auction_id || item.id || '',
+      vehicle: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
+      reservePrice: req.reserve_price || 0,
+      highestBid: item.last_bid_id?.bid ?? null,
+      status: item.status || 0, // Pass status number directly like in tasks page
+      image: "/images/auth-background.jpg",
+      offers: item.offers || [],
+    };
+  };
 
   // Fetch auctions from API
   const fetchAuctions = useCallback(async () => {
@@ -173,21 +191,8 @@ export default function DsEndedAuctionsOfferNow() {
       const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       const response = await axios.get(`${apiUrl}/auctions/api/v1/offer-now/`, { headers });
-      const mapped = (response.data || []).map((item: any, idx: number) => {
-        const req = item.request_id || {};
-        
-        return {
-          key: item.id || idx + 1,
-          vin: req.vin ? String(req.vin).slice(-6) : '-',
-          auctionId: req.auction_id || item.id || '',
-          vehicle: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
-          reservePrice: req.reserve_price || 0,
-          highestBid: item.last_bid_id?.bid ?? null,
-          status: item.status || 0, // Pass status number directly like in tasks page
-          image: "/images/auth-background.jpg",
-          offers: item.offers || [],
-        };
-      });
+      trackPage(response);
+      const mapped = (response.data || []).map(mapOfferAuction);
       setAuctionData(mapped);
     } catch (err: any) {
       setError(err?.response?.data?.detail || err?.message || "Failed to fetch offer-now auctions.");
@@ -271,6 +276,9 @@ export default function DsEndedAuctionsOfferNow() {
           },
           rowExpandable: () => true,
         }}
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={() => loadMore(rows => setAuctionData(prev => [...prev, ...rows.map(mapOfferAuction)]))}
       />
       <OfferNowModal
         open={offerModalOpen}
@@ -3,6 +3,7 @@ import React, { useState, useEffect, useCallback } from "react";
 import DataTable from "@/components/common/DataTable";
 import AuctionSearchBar from "@/components/ds/AuctionSearchBar";
 import axios from "axios";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const columns = [
   {
@@ -92,6 +93,51 @@ export default function DsEndedAuctionsSold() {
   const [data, setData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapSoldAuction = (item: any, idx: number) => {
+    const req = item.request_id || {};
+    // Determine yourBid/offer: max of offers.amount and bids.bid
+    let offerAmount = null;
+    if (Array.isArray(item.offers) && item.offers.length > 0) {
+      offerAmount = Math.max(...item.offers.map((o: any) => Number(o.amount) || 0));
+    } else if (item.offers && typeof item.offers === 'object' && item.offers.amount) {
+      offerAmount = Number(item.offers.amount);
+    }
+    let bidAmount = null;
+    if (Array.isArray(item.bids) && item.bids.length > 0) {
+      bidAmount = Math.max(...item.bids.map((b: any) => Number(b.bid) || 0));
+    } else if (item.bids && typeof item.bids === 'object' && item.bids.bid) {
+      bidAmount = Number(item.bids.bid);
+    }
+    let yourBid = null;
+    if (offerAmount !== null && bidAmount !== null) {
+      yourBid = Math.max(offerAmount, bidAmount);
+    } else if (offerAmount !== null) {
+      yourBid = offerAmount;
+    } else if (bidAmount !== null) {
+      yourBid = bidAmount;
+    } else {
+      yourBid = null;
+    }
+    // Sold For: from won_bid_id.bid if exists
+    let soldFor = null;
+    if (item.won_bid_id && typeof item.won_bid_id === 'object' && item.won_bid_id.bid) {
+      soldFor = item.won_bid_id.bid;
+    } else {
+      soldFor = null;
+    }
+    return {
+      key: item.id || idx + 1,
+      vin: req.vin ? String(req.vin).slice(-6) : '-',
+      auctionId: req.auction_id || item.id || '',
+      vehicle: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
+      yourBid: yourBid,
+      soldFor: soldFor,
+      status: req.status || item.status || '-',
+      image: "/images/auth-background.jpg",
+    };
+  };
 
   const fetchSoldAuctions = useCallback(async () => {
     setLoading(true);
@@ -101,49 +147,8 @@ export default function DsEndedAuctionsSold() {
       const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       const response = await axios.get(`${apiUrl}/auctions/api/v1/sold/`, { headers });
-      const mapped = (response.data || []).map((item: any, idx: number) => {
-        const req = item.request_id || {};
-        // Determine yourBid/offer: max of offers.amount and bids.bid
-        let offerAmount = null;
-        if (Array.isArray(item.offers) && item.offers.length > 0) {
-          offerAmount = Math.max(...item.offers.map((o: any) => Number(o.amount) || 0));
-        } else if (item.offers && typeof item.offers === 'object' && item.offers.amount) {
-          offerAmount = Number(item.offers.amount);
-        }
-        let bidAmount = null;
-        if (Array.isArray(item.bids) && item.bids.length > 0) {
-          bidAmount = Math.max(...item.bids.map((b: any) => Number(b.bid) || 0));
-        } else if (item.bids && typeof item.bids === 'object' && item.bids.bid) {
-          bidAmount = Number(item.bids.bid);
-        }
-        let yourBid = null;
-        if (offerAmount !== null && bidAmount !== null) {
-          yourBid = Math.max(offerAmount, bidAmount);
-        } else if (offerAmount !== null) {
-          yourBid = offerAmount;
-        } else if (bidAmount !== null) {
-          yourBid = bidAmount;
-        } else {
-          yourBid = null;
-        }
-        // Sold For: from won_bid_id.bid if exists
-        let soldFor = null;
-        if (item.won_bid_id && typeof item.won_bid_id === 'object' && item.won_bid_id.bid) {
-          soldFor = item.won_bid_id.bid;
-        } else {
-          soldFor = null;
-        }
-        return {
-          key: item.id || idx + 1,
-          vin: req.vin ? String(req.vin).slice(-6) : '-',
-          auctionId: req.auction_id || item.id || '',
-          vehicle: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
-          yourBid: yourBid,
-          soldFor: soldFor,
-          status: req.status || item.status || '-',
-          image: "/images/auth-background.jpg",
-        };
-      });
+      trackPage(response);
+      const mapped = (response.data || []).map(mapSoldAuction);
       setData(mapped);
     } catch (err: any) {
       setError(err?.response?.data?.detail || err?.message || "Failed to fetch sold auctions.");
@@ -189,6 +194,9 @@ export default function DsEndedAuctionsSold() {
         columns={columns}
         data={filteredData}
         tableData={{ isEnableFilterInput: false }}
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapSoldAuction)]))}
       />
     </div>
   );
@@ -5,6 +5,7 @@ import { FormField } from "@/components/common/FormField";
 import axios from "axios";
 import { showErrorToast, showSuccessToast, COMMON_ERROR_MESSAGES, COMMON_SUCCESS_MESSAGES } from "@/utils/errorHandler";
 import { useRouter } from "next/navigation";
+import { fetchAllPages } from "@/lib/pagination";
 
 const { Title, Text } = Typography;
 
@@ -59,12 +60,13 @@ const DsRequestInspectionNew = () => {
         const fetchLocations = async () => {
             try {
                 const token = localStorage.getItem('access');
-                const response = await axios.get('https://dev.awdauctions.com/users/api/v1/dealer-locations/', {
+                // Every location is an option, so read all the pages of the list
+                const locationList = await fetchAllPages('https://dev.awdauctions.com/users/api/v1/dealer-locations/', {
                     headers: {
                         Authorization: `Bearer ${token}`
                     }
                 });
-                setLocations(response.data);
+                setLocations(locationList);
             } catch (error) {
                 console.error('Failed to fetch locations:', error);
                 showErrorToast(error, "Inspection locations");
@@ -6,6 +6,7 @@ import axios from "axios";
 import { showErrorToast, showSuccessToast, COMMON_ERROR_MESSAGES, COMMON_SUCCESS_MESSAGES } from "@/utils/errorHandler";
 import SendToAuctionModal from '@/components/modals/SendToAuctionModal';
 import ConfirmModal from '@/components/modals/ConfirmModal';
+import { useNextPage } from "@/hooks/useNextPage";
 
 const { Title, Text } = Typography;
 
@@ -151,6 +152,7 @@ const DsRequestInspectionPage = () => {
     const [confirmModalOpen, setConfirmModalOpen] = useState(false);
     const [auctionPayload, setAuctionPayload] = useState<any>(null);
     const [sendingAuction, setSendingAuction] = useState(false);
+    const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
 
     const fetchRequests = async () => {
         setLoading(true);
@@ -161,6 +163,7 @@ const DsRequestInspectionPage = () => {
                     Authorization: `Bearer ${token}`
                 }
             });
+            trackPage(response);
             const data = response.data?.results || response.data?.data || (Array.isArray(response.data) ? response.data : []);
             setRequests(data);
         } catch (error) {
@@ -296,6 +299,9 @@ const DsRequestInspectionPage = () => {
                         expandedRowKeys,
                         onExpand: handleExpand,
                     }}
+                    nextPage={nextPage}
+                    loadingMore={loadingMore}
+                    onLoadMore={() => loadMore(rows => setRequests(prev => [...prev, ...rows]))}
                 />
             </div>
         </div>
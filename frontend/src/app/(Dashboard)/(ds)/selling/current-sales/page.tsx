@@ -4,6 +4,7 @@ import DataTable from "@/components/common/DataTable";
 import AuctionSearchBar from "@/components/ds/AuctionSearchBar";
 import axios from "axios";
 import { DownOutlined, RightOutlined } from "@ant-design/icons";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const STATUS_MAP: Record<number, { label: string; color: string }> = {
   1: { label: 'Waiting for Buyer Confirmation', color: 'gray' },
@@ -60,6 +61,32 @@ export default function DsSellingCurrentSales() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [expandedRowKeys, setExpandedRowKeys] = useState<string[]>([]);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapCurrentSale = (item: any, index: number) => {
+    const req = item.request_id || {};
+    // Bid amount: last_bid_id.bid or request_id.expected_price
+    let bidPrice = item.last_bid_id?.bid || req.expected_price || item.expected_price || 0;
+    // Won date: request_id.auction_date or request_id.inspected_date
+    let wonDate = req.auction_date || req.inspected_date || item.won_at || item.created_at || '';
+    if (wonDate) {
+      try {
+        wonDate = new Date(wonDate).toLocaleDateString();
+      } catch {}
+    }
+    return {
+      key: item.id || index + 1,
+      image: req.image || "/images/auth-background.jpg",
+      vin: req.vin ? req.vin.slice(-6) : '-',
+      vehicle: `${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
+      wonDate,
+      bidPrice,
+      reserved: item.reserved_price ? true : false,
+      status: item.status,
+      auctionId: req.auction_id || item.auction_id || item.id || '',
+      proxyWon: item.proxy_won || false,
+    };
+  };
 
   useEffect(() => {
     const fetchData = async () => {
@@ -70,31 +97,9 @@ export default function DsSellingCurrentSales() {
         const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         const response = await axios.get(`${apiUrl}/auctions/api/v1/current-selling/`, { headers });
+        trackPage(response);
         // Map API response to table data shape
-        const mapped = (response.data || []).map((item: any, index: number) => {
-          const req = item.request_id || {};
-          // Bid amount: last_bid_id.bid or request_id.expected_price
-          let bidPrice = item.last_bid_id?.bid || req.expected_price || item.expected_price || 0;
-          // Won date: request_id.auction_date or request_id.inspected_date
-          let wonDate = req.auction_date || req.inspected_date || item.won_at || item.created_at || '';
-          if (wonDate) {
-            try {
-              wonDate = new Date(wonDate).toLocaleDateString();
-            } catch {}
-          }
-          return {
-            key: item.id || index + 1,
-            image: req.image || "/images/auth-background.jpg",
-            vin: req.vin ? req.vin.slice(-6) : '-',
-            vehicle: `${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
-            wonDate,
-            bidPrice,
-            reserved: item.reserved_price ? true : false,
-            status: item.status,
-            auctionId: req.auction_id || item.auction_id || item.id || '',
-            proxyWon: item.proxy_won || false,
-          };
-        });
+        const mapped = (response.data || []).map(mapCurrentSale);
         setData(mapped);
       } catch (err: any) {
         setError(err?.response?.data?.detail || err?.message || "Failed to fetch active selling data.");
@@ -177,6 +182,9 @@ export default function DsSellingCurrentSales() {
           },
         }}
         tableData={{ isEnableFilterInput: false }}
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapCurrentSale)]))}
       />
     </div>
   );
@@ -3,6 +3,7 @@ import React, { useState, useEffect, useCallback } from "react";
 import DataTable from "@/components/common/DataTable";
 import AuctionSearchBar from "@/components/ds/AuctionSearchBar";
 import axios from "axios";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const columns = [
   {
@@ -92,6 +93,33 @@ export default function DsSellingSold() {
   const [data, setData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapSoldAuction = (item: any, idx: number) => {
+    const req = item.request_id || {};
+
+    // Use reserve_price from the API response
+    const reservePrice = item.reserve_price || req.reserve_price || null;
+
+    // Sold For: from won_bid_id.bid if exists
+    let soldFor = null;
+    if (item.won_bid_id && typeof item.won_bid_id === 'object' && item.won_bid_id.bid) {
+      soldFor = item.won_bid_id.bid;
+    } else {
+      soldFor = null;
+    }
+
+    return {
+      key: item.id || idx + 1,
+      vin: req.vin ? String(req.vin).slice(-6) : '-',
+      auctionId: req.auction_id || item.id || '',
+      vehicle: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
+      reservePrice: reservePrice,
+      soldFor: soldFor,
+      status: req.status || item.status || '-',
+      image: "/images/auth-background.jpg",
+    };
+  };
 
   const fetchSellingWon = useCallback(async () => {
     setLoading(true);
@@ -101,31 +129,8 @@ export default function DsSellingSold() {
       const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       const response = await axios.get(`${apiUrl}/auctions/api/v1/selling-won/`, { headers });
-      const mapped = (response.data || []).map((item: any, idx: number) => {
-        const req = item.request_id || {};
-        
-        // Use reserve_price from the API response
-        const reservePrice = item.reserve_price || req.reserve_price || null;
-        
-        // Sold For: from won_bid_id.bid if exists
-        let soldFor = null;
-        if (item.won_bid_id && typeof item.won_bid_id === 'object' && item.won_bid_id.bid) {
-          soldFor = item.won_bid_id.bid;
-        } else {
-          soldFor = null;
-        }
-        
-        return {
-          key: item.id || idx + 1,
-          vin: req.vin ? String(req.vin).slice(-6) : '-',
-          auctionId: req.auction_id || item.id || '',
-          vehicle: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
-          reservePrice: reservePrice,
-          soldFor: soldFor,
-          status: req.status || item.status || '-',
-          image: "/images/auth-background.jpg",
-        };
-      });
+      trackPage(response);
+      const mapped = (response.data || []).map(mapSoldAuction);
       setData(mapped);
     } catch (err: any) {
       setError(err?.response?.data?.detail || err?.message || "Failed to fetch selling-won auctions.");
@@ -170,6 +175,9 @@ export default function DsSellingSold() {
         columns={columns}
         data={filteredData}
         tableData={{ isEnableFilterInput: false }}
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapSoldAuction)]))}
       />
     </div>
   );
@@ -7,6 +7,8 @@ import AuctionListPagination from "@/components/ds/AuctionListPagination";
 import AuctionListEmptyState from "@/components/ds/AuctionListEmptyState";
 import axios from "axios";
 import { useRouter } from "next/navigation";
+import { useNextPage } from "@/hooks/useNextPage";
+import LoadMoreButton from "@/components/common/LoadMoreButton";
 
 // Mock filter options
 const filterOptions = {
@@ -49,6 +51,31 @@ export default function DsUpcomingAuctions() {
   const [auctions, setAuctions] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapAuction = (item: any) => {
+    const req = item.request_id || {};
+    // Map lights array to colors
+    const colors = Array.isArray(req.lights)
+      ? req.lights.map((color: string) => ({ color, label: color.charAt(0).toUpperCase() + color.slice(1) }))
+      : [];
+    return {
+      image: "/images/auth-background.jpg", // Placeholder, replace if you have real image
+      title: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim(),
+      vin: req.vin || '',
+      colors,
+      specs: [
+        { label: "Miles", value: req.odometer || '' },
+        { label: "ENG", value: req.engine || '' },
+        { label: "Cyl", value: req.cylinders || '' },
+        { label: "Transmission", value: req.transmission || '' },
+      ],
+      status: "Coming Soon",
+      labelText: "Coming Soon",
+      id: item.id, // Assuming item.id is available from the API
+    };
+  };
+
   const router = useRouter();
 
   useEffect(() => {
@@ -60,29 +87,9 @@ export default function DsUpcomingAuctions() {
         const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         const response = await axios.get(`${apiUrl}/auctions/api/v1/upcoming/`, { headers });
+        trackPage(response);
         // Map API response to UI shape
-        const mapped = (response.data || []).map((item: any) => {
-          const req = item.request_id || {};
-          // Map lights array to colors
-          const colors = Array.isArray(req.lights)
-            ? req.lights.map((color: string) => ({ color, label: color.charAt(0).toUpperCase() + color.slice(1) }))
-            : [];
-          return {
-            image: "/images/auth-background.jpg", // Placeholder, replace if you have real image
-            title: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim(),
-            vin: req.vin || '',
-            colors,
-            specs: [
-              { label: "Miles", value: req.odometer || '' },
-              { label: "ENG", value: req.engine || '' },
-              { label: "Cyl", value: req.cylinders || '' },
-              { label: "Transmission", value: req.transmission || '' },
-            ],
-            status: "Coming Soon",
-            labelText: "Coming Soon",
-            id: item.id, // Assuming item.id is available from the API
-          };
-        });
+        const mapped = (response.data || []).map(mapAuction);
         setAuctions(mapped);
       } catch (err: any) {
         setError(err?.response?.data?.detail || err?.message || "Failed to fetch auctions.");
@@ -167,6 +174,7 @@ export default function DsUpcomingAuctions() {
             onPageChange={setPage}
             onPageSizeChange={size => { setPageSize(size); setPage(1); }}
           />
+          <LoadMoreButton nextPage={nextPage} loading={loadingMore} onClick={() => loadMore(rows => setAuctions(prev => [...prev, ...rows.map(mapAuction)]))} />
         </div>
         {/* Desktop sidebar */}
         <div className="hidden md:block md:w-80 w-full flex-shrink-0">
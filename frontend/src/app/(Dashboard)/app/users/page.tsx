@@ -12,10 +12,12 @@ import axios from "axios";
 import DeleteConfirmModal from "@/components/modals/DeleteConfirmModal";
 import { showErrorToast, showSuccessToast, COMMON_ERROR_MESSAGES, COMMON_SUCCESS_MESSAGES } from "@/utils/errorHandler";
 import { getUserColumns } from "@/components/common/userColumns";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const UsersPage = () => {
   const [usersData, setUsersData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
   const [error, setError] = useState<string | null>(null);
   const [deleteLoading, setDeleteLoading] = useState(false);
   const [deleteModalOpen, setDeleteModalOpen] = useState(false);
@@ -70,6 +72,7 @@ const UsersPage = () => {
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         const apiUrl = process.env.NEXT_PUBLIC_API_URL;
         const res = await axios.get(`${apiUrl}/users/api/v1/admin/users-list/`, { headers });
+        trackPage(res);
         setUsersData(res.data);
         showSuccessToast('Users fetched successfully!', 'Users');
       } catch (err: any) {
@@ -95,7 +98,7 @@ const UsersPage = () => {
   return (
     <div className="p-6">
       <Breadcrumbs items={[{ label: "Users", href: "/app/users" }]} />
-        <DataTable columns={columns} data={mappedUsers} tableData={tableData} loading={loading} />
+        <DataTable columns={columns} data={mappedUsers} tableData={tableData} loading={loading} nextPage={nextPage} loadingMore={loadingMore} onLoadMore={() => loadMore(rows => setUsersData(prev => [...prev, ...rows]))} />
         <div className="flex gap-4 mt-4">
           <Link href="/app/users/trash" className="text-blue-700 hover:underline">
             View Trash Records
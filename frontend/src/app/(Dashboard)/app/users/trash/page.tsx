@@ -10,10 +10,12 @@ import { showErrorToast, showSuccessToast } from "@/utils/errorHandler";
 import { ReloadOutlined, DeleteOutlined, DownOutlined } from "@ant-design/icons";
 import { Dropdown } from "antd";
 import DeleteConfirmModal from "@/components/modals/DeleteConfirmModal";
+import { useNextPage } from "@/hooks/useNextPage";
 
 export default function TrashUsersPage() {
   const [usersData, setUsersData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
   const [deleteLoading, setDeleteLoading] = useState(false);
   const [deleteModalOpen, setDeleteModalOpen] = useState(false);
   const [selectedUserId, setSelectedUserId] = useState<number | null>(null);
@@ -155,6 +157,7 @@ export default function TrashUsersPage() {
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         const apiUrl = process.env.NEXT_PUBLIC_API_URL;
         const res = await axios.get(`${apiUrl}/users/api/v1/admin/inactive-users/`, { headers });
+        trackPage(res);
         setUsersData(res.data);
         showSuccessToast('Trash users fetched successfully!', 'Users');
       } catch (err: any) {
@@ -179,7 +182,7 @@ export default function TrashUsersPage() {
   return (
     <div className="p-6">
       <Breadcrumbs items={[{ label: "Users", href: "/app/users" }, { label: "Trash", href: "/app/users/trash" }]} />
-      <DataTable columns={columns} data={mappedUsers} loading={loading} />
+      <DataTable columns={columns} data={mappedUsers} loading={loading} nextPage={nextPage} loadingMore={loadingMore} onLoadMore={() => loadMore(rows => setUsersData(prev => [...prev, ...rows]))} />
       <DeleteConfirmModal
         isOpen={deleteModalOpen}
         onClose={() => {
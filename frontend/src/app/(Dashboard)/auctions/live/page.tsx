@@ -6,6 +6,7 @@ import DataTable from "@/components/common/DataTable";
 import { useState, useEffect } from "react";
 import axios from "axios";
 import { showErrorToast, showSuccessToast } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
 
 // Static data for fallback (keeping the same structure)
 const staticData = [
@@ -111,6 +112,28 @@ export default function AuctionsLivePage() {
   const [stopLoading, setStopLoading] = useState(false);
   const [stopModalVisible, setStopModalVisible] = useState(false);
   const [selectedAuction, setSelectedAuction] = useState<any>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapLiveAuction = (item: any, index: number) => {
+    const req = item.request_id || {};
+
+    // Debug logging to check the structure
+    console.log('API Item:', item);
+    console.log('Last Bid ID:', item.last_bid_id);
+    console.log('Bid Amount:', item.last_bid_id?.bid);
+
+    return {
+      key: item.id || index + 1,
+      name: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
+      img: req.image || "https://images.pexels.com/photos/358070/pexels-photo-358070.jpeg?auto=compress&w=60",
+      auctionId: item.auction_id || req.auction_id || item.id || '',
+      vin: req.vin ? req.vin.slice(-6) : '-',
+      expected: req.expected_price || 0,
+      lastBid: item.last_bid_id?.bid || 0,
+      timer: "10:00", // Static timer for now
+      status: item.status === 1 ? "On Going" : item.status === 2 ? "In Negotiation" : item.status === 3 ? "Ended" : "On Going",
+    };
+  };
 
   // Handle stop auction
   const handleStopAuction = async (auction: any) => {
@@ -158,28 +181,10 @@ export default function AuctionsLivePage() {
       const apiUrl = process.env.NEXT_PUBLIC_API_URL;
       
       const response = await axios.get(`${apiUrl}/auctions/api/v1/live/`, { headers });
+      trackPage(response);
       
       // Map API response to match the existing data structure
-      const mappedData = (response.data || []).map((item: any, index: number) => {
-        const req = item.request_id || {};
-        
-        // Debug logging to check the structure
-        console.log('API Item:', item);
-        console.log('Last Bid ID:', item.last_bid_id);
-        console.log('Bid Amount:', item.last_bid_id?.bid);
-        
-        return {
-          key: item.id || index + 1,
-          name: `${req.year || ''} ${req.make || ''} ${req.model || ''}`.trim() || 'Vehicle',
-          img: req.image || "https://images.pexels.com/photos/358070/pexels-photo-358070.jpeg?auto=compress&w=60",
-          auctionId: item.auction_id || req.auction_id || item.id || '',
-          vin: req.vin ? req.vin.slice(-6) : '-',
-          expected: req.expected_price || 0,
-          lastBid: item.last_bid_id?.bid || 0,
-          timer: "10:00", // Static timer for now
-          status: item.status === 1 ? "On Going" : item.status === 2 ? "In Negotiation" : item.status === 3 ? "Ended" : "On Going",
-        };
-      });
+      const mappedData = (response.data || []).map(mapLiveAuction);
       
       setData(mappedData);
     } catch (err: any) {
@@ -281,6 +286,9 @@ export default function AuctionsLivePage() {
               showAddButton: false,
             }} 
             loading={loading}
+            nextPage={nextPage}
+            loadingMore={loadingMore}
+            onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapLiveAuction)]))}
           />
         </Card>
         
@@ -7,6 +7,7 @@ import { showToast } from "@/components/common/Toaster";
 import { useState, useEffect } from "react";
 import { showErrorToast, showSuccessToast, COMMON_ERROR_MESSAGES, COMMON_SUCCESS_MESSAGES } from "@/utils/errorHandler";
 import axios from "axios";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const columns = [
   { title: "Auction ID", dataIndex: "auctionId", key: "auctionId" },
@@ -60,6 +61,32 @@ export default function AuctionsRunListPage() {
   const [data, setData] = useState<any[]>([]);
   const [tableLoading, setTableLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapRunListItem = (item: any) => ({
+    key: item.id || item.auctionId || item.request_id || Math.random(),
+    auctionId: item.auctionId || item.id || '',
+    vehicleDetails: {
+      vin: item.vin || (item.request_id && item.request_id.vin) || '',
+      name: `${(item.request_id && item.request_id.year) || ''} ${(item.request_id && item.request_id.make) || ''} ${(item.request_id && item.request_id.model) || ''}`.trim(),
+    },
+    seller: {
+      name: (item.dealer && item.dealer.dealership_name) || '',
+      address: [
+        item.dealer?.street_name,
+        item.dealer?.city?.name,
+        item.dealer?.state?.name,
+        item.dealer?.zipcode
+      ].filter(Boolean).join(', '),
+      phone: (item.dealer && item.dealer.phone_number) || '',
+    },
+    buyer: {
+      name: (item.buyer && item.buyer.name) || '',
+      address: (item.buyer && item.buyer.address) || '',
+      phone: (item.buyer && item.buyer.phone) || '',
+    },
+    status: 'In a Run List',
+  });
 
   useEffect(() => {
     const fetchData = async () => {
@@ -70,31 +97,9 @@ export default function AuctionsRunListPage() {
         const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         const response = await axios.get(`${apiUrl}/auctions/api/v1/on-run-list/`, { headers });
+        trackPage(response);
         // Map API response to table data shape
-        const mapped = (response.data || []).map((item: any) => ({
-          key: item.id || item.auctionId || item.request_id || Math.random(),
-          auctionId: item.auctionId || item.id || '',
-          vehicleDetails: {
-            vin: item.vin || (item.request_id && item.request_id.vin) || '',
-            name: `${(item.request_id && item.request_id.year) || ''} ${(item.request_id && item.request_id.make) || ''} ${(item.request_id && item.request_id.model) || ''}`.trim(),
-          },
-          seller: {
-            name: (item.dealer && item.dealer.dealership_name) || '',
-            address: [
-              item.dealer?.street_name,
-              item.dealer?.city?.name,
-              item.dealer?.state?.name,
-              item.dealer?.zipcode
-            ].filter(Boolean).join(', '),
-            phone: (item.dealer && item.dealer.phone_number) || '',
-          },
-          buyer: {
-            name: (item.buyer && item.buyer.name) || '',
-            address: (item.buyer && item.buyer.address) || '',
-            phone: (item.buyer && item.buyer.phone) || '',
-          },
-          status: 'In a Run List',
-        }));
+        const mapped = (response.data || []).map(mapRunListItem);
         setData(mapped);
       } catch (err: any) {
         setError(err?.response?.data?.detail || err?.message || "Failed to fetch run list.");
@@ -124,30 +129,8 @@ export default function AuctionsRunListPage() {
       setTableLoading(true);
       try {
         const response = await axios.get(`${apiUrl}/auctions/api/v1/on-run-list/`, { headers });
-        const mapped = (response.data || []).map((item: any) => ({
-          key: item.id || item.auctionId || item.request_id || Math.random(),
-          auctionId: item.auctionId || item.id || '',
-          vehicleDetails: {
-            vin: item.vin || (item.request_id && item.request_id.vin) || '',
-            name: `${(item.request_id && item.request_id.year) || ''} ${(item.request_id && item.request_id.make) || ''} ${(item.request_id && item.request_id.model) || ''}`.trim(),
-          },
-          seller: {
-            name: (item.dealer && item.dealer.dealership_name) || '',
-            address: [
-              item.dealer?.street_name,
-              item.dealer?.city?.name,
-              item.dealer?.state?.name,
-              item.dealer?.zipcode
-            ].filter(Boolean).join(', '),
-            phone: (item.dealer && item.dealer.phone_number) || '',
-          },
-          buyer: {
-            name: (item.buyer && item.buyer.name) || '',
-            address: (item.buyer && item.buyer.address) || '',
-            phone: (item.buyer && item.buyer.phone) || '',
-          },
-          status: 'In a Run List',
-        }));
+        trackPage(response);
+        const mapped = (response.data || []).map(mapRunListItem);
         setData(mapped);
       } catch (err: any) {
         setError(err?.response?.data?.detail || err?.message || "Failed to fetch run list.");
@@ -188,6 +171,9 @@ export default function AuctionsRunListPage() {
             onChange: setSelectedRowKeys,
           }}
           loading={tableLoading}
+          nextPage={nextPage}
+          loadingMore={loadingMore}
+          onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapRunListItem)]))}
         />
         <ConfirmModal
           open={showModal}
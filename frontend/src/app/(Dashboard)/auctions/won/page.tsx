@@ -6,6 +6,7 @@ import DataTable from "@/components/common/DataTable";
 import { useState, useEffect } from "react";
 import axios from "axios";
 import { useRouter } from "next/navigation";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const statusColor = (status: string) => {
   switch (status) {
@@ -28,6 +29,33 @@ export default function AuctionsWonPage() {
   const [data, setData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapWonAuction = (item: any) => ({
+    key: item.id || item.auctionId || item.request_id || Math.random(),
+    auctionId: item.auctionId || item.id || '',
+    vehicleDetails: {
+      vin: item.vin || (item.request_id && item.request_id.vin) || '',
+      name: `${(item.request_id && item.request_id.year) || ''} ${(item.request_id && item.request_id.make) || ''} ${(item.request_id && item.request_id.model) || ''}`.trim(),
+    },
+    seller: {
+      name: (item.dealer && item.dealer.dealership_name) || '',
+      address: [
+        item.dealer?.street_name,
+        item.dealer?.city?.name,
+        item.dealer?.state?.name,
+        item.dealer?.zipcode
+      ].filter(Boolean).join(', '),
+      phone: (item.dealer && item.dealer.phone_number) || '',
+    },
+    buyer: {
+      name: (item.buyer && item.buyer.name) || '',
+      address: (item.buyer && item.buyer.address) || '',
+      phone: (item.buyer && item.buyer.phone) || '',
+    },
+    status: Array.isArray(item.status) ? item.status : [item.status || ''],
+  });
+
   const router = useRouter();
 
   // Move columns inside the component to access router
@@ -116,31 +144,9 @@ export default function AuctionsWonPage() {
         const token = typeof window !== 'undefined' ? localStorage.getItem("access") : null;
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         const response = await axios.get(`${apiUrl}/auctions/api/v1/won/`, { headers });
+        trackPage(response);
         // Map API response to table data shape
-        const mapped = (response.data || []).map((item: any) => ({
-          key: item.id || item.auctionId || item.request_id || Math.random(),
-          auctionId: item.auctionId || item.id || '',
-          vehicleDetails: {
-            vin: item.vin || (item.request_id && item.request_id.vin) || '',
-            name: `${(item.request_id && item.request_id.year) || ''} ${(item.request_id && item.request_id.make) || ''} ${(item.request_id && item.request_id.model) || ''}`.trim(),
-          },
-          seller: {
-            name: (item.dealer && item.dealer.dealership_name) || '',
-            address: [
-              item.dealer?.street_name,
-              item.dealer?.city?.name,
-              item.dealer?.state?.name,
-              item.dealer?.zipcode
-            ].filter(Boolean).join(', '),
-            phone: (item.dealer && item.dealer.phone_number) || '',
-          },
-          buyer: {
-            name: (item.buyer && item.buyer.name) || '',
-            address: (item.buyer && item.buyer.address) || '',
-            phone: (item.buyer && item.buyer.phone) || '',
-          },
-          status: Array.isArray(item.status) ? item.status : [item.status || ''],
-        }));
+        const mapped = (response.data || []).map(mapWonAuction);
         setData(mapped);
       } catch (err: any) {
         setError(err?.response?.data?.detail || err?.message || "Failed to fetch won auctions.");
@@ -165,6 +171,9 @@ export default function AuctionsWonPage() {
             isEnableFilterInput: true,
           }}
           loading={loading}
+          nextPage={nextPage}
+          loadingMore={loadingMore}
+          onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapWonAuction)]))}
         />
       </div>
     </div>
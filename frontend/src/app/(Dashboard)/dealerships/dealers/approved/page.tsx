@@ -8,6 +8,7 @@ import { useEffect, useState } from "react";
 import axios from "axios";
 import DeleteConfirmModal from "@/components/modals/DeleteConfirmModal";
 import { showErrorToast, COMMON_ERROR_MESSAGES, showSuccessToast } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const interestMap: Record<string, string> = {
   1: "Sell a vehicle",
@@ -18,6 +19,7 @@ const interestMap: Record<string, string> = {
 export default function DealersApprovedPage() {
   const [data, setData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
   const [deleteModalOpen, setDeleteModalOpen] = useState(false);
   const [deleteLoading, setDeleteLoading] = useState(false);
   const [selectedDealerId, setSelectedDealerId] = useState<number | null>(null);
@@ -30,6 +32,7 @@ export default function DealersApprovedPage() {
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       try {
         const res = await axios.get(`${apiUrl}/users/api/v1/dealership/?approved=1`, { headers });
+        trackPage(res);
         setData(res.data.results || res.data);
       } catch (error) {
         showErrorToast(error, "Approved dealers");
@@ -137,7 +140,7 @@ export default function DealersApprovedPage() {
         ]}
       />
       <div className="p-6">
-        <DataTable columns={columns} data={data} tableData={tableData} loading={loading} />
+        <DataTable columns={columns} data={data} tableData={tableData} loading={loading} nextPage={nextPage} loadingMore={loadingMore} onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows]))} />
         <DeleteConfirmModal
           isOpen={deleteModalOpen}
           onClose={() => {
@@ -10,10 +10,12 @@ import { useEffect, useState } from "react";
 import axios from "axios";
 import DeleteConfirmModal from "@/components/modals/DeleteConfirmModal";
 import { showErrorToast, COMMON_ERROR_MESSAGES } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
 
 export default function DealersPendingPage() {
   const [data, setData] = useState([]);
   const [loading, setLoading] = useState(true);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
   const role = useSelector((state: RootState) => state.user.role);
   const [deleteModalOpen, setDeleteModalOpen] = useState(false);
   const [deleteLoading, setDeleteLoading] = useState(false);
@@ -115,6 +117,7 @@ export default function DealersPendingPage() {
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       try {
         const res = await axios.get(`${apiUrl}/users/api/v1/dealership/?approved=0`, { headers });
+        trackPage(res);
         setData(res.data.results || res.data);
       } catch (error) {
         showErrorToast(error, "Pending dealers");
@@ -137,7 +140,7 @@ export default function DealersPendingPage() {
     <div>
       <Breadcrumbs items={[{ label: "Dealerships", href: "/dealerships" }, { label: "Dealers", href: "/dealerships/dealers" }, { label: "Pending" }]} />
       <div className="p-6">
-        <DataTable columns={columns} data={data} tableData={tableData} loading={loading} />
+        <DataTable columns={columns} data={data} tableData={tableData} loading={loading} nextPage={nextPage} loadingMore={loadingMore} onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows]))} />
       </div>
       <DeleteConfirmModal
         isOpen={deleteModalOpen}
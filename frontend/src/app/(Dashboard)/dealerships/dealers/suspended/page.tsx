@@ -8,10 +8,12 @@ import { useEffect, useState } from "react";
 import axios from "axios";
 import DeleteConfirmModal from "@/components/modals/DeleteConfirmModal";
 import { showErrorToast, COMMON_ERROR_MESSAGES } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
 
 export default function DealersSuspendedPage() {
   const [data, setData] = useState([]);
   const [loading, setLoading] = useState(true);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
   const [deleteModalOpen, setDeleteModalOpen] = useState(false);
   const [deleteLoading, setDeleteLoading] = useState(false);
   const [selectedDealerId, setSelectedDealerId] = useState<number | null>(null);
@@ -112,6 +114,7 @@ export default function DealersSuspendedPage() {
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       try {
         const res = await axios.get(`${apiUrl}/users/api/v1/dealership/?approved=2`, { headers });
+        trackPage(res);
         setData(res.data.results || res.data);
       } catch (error) {
         showErrorToast(error, "Suspended dealers");
@@ -133,7 +136,7 @@ export default function DealersSuspendedPage() {
     <div>
       <Breadcrumbs items={[{ label: "Dealerships", href: "/dealerships" }, { label: "Dealers", href: "/dealerships/dealers" }, { label: "Suspended" }]} />
       <div className="p-6">
-        <DataTable columns={columns} data={data} tableData={tableData} loading={loading} />
+        <DataTable columns={columns} data={data} tableData={tableData} loading={loading} nextPage={nextPage} loadingMore={loadingMore} onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows]))} />
       </div>
       <DeleteConfirmModal
         isOpen={deleteModalOpen}
@@ -8,6 +8,7 @@ import { ReloadOutlined, DeleteOutlined, SettingOutlined, DownOutlined } from "@
 import DeleteConfirmModal from "@/components/modals/DeleteConfirmModal";
 import { showSuccessToast, showErrorToast } from "@/utils/errorHandler";
 import axios from "axios";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const interestMap: Record<string, string> = {
   1: "Sell a vehicle",
@@ -18,6 +19,7 @@ const interestMap: Record<string, string> = {
 export default function TrashedDealersPage() {
   const [data, setData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
   const [deleteLoading, setDeleteLoading] = useState(false);
   const [deleteModalOpen, setDeleteModalOpen] = useState(false);
   const [selectedId, setSelectedId] = useState<number | null>(null);
@@ -74,6 +76,7 @@ export default function TrashedDealersPage() {
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         const apiUrl = process.env.NEXT_PUBLIC_API_URL;
         const res = await axios.get(`${apiUrl}/users/api/v1/admin/inactive-dealership/`, { headers });
+        trackPage(res);
         setData(res.data);
         showSuccessToast('Trashed dealers fetched successfully!', 'Dealers');
       } catch (err) {
@@ -109,7 +112,7 @@ export default function TrashedDealersPage() {
   return (
     <div className="p-6">
       <Breadcrumbs items={[{ label: "Dealerships", href: "/dealerships" }, { label: "Dealers", href: "/dealerships/dealers" }, { label: "Trashed Dealers" }]} />
-      <DataTable columns={columns} data={data} loading={loading} />
+      <DataTable columns={columns} data={data} loading={loading} nextPage={nextPage} loadingMore={loadingMore} onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows]))} />
       <DeleteConfirmModal
         isOpen={deleteModalOpen}
         onClose={() => { setDeleteModalOpen(false); setSelectedId(null); }}
@@ -7,6 +7,7 @@ import Link from "next/link";
 import { useEffect, useState } from "react";
 import axios from "axios";
 import { showErrorToast } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const columns = [
   { 
@@ -49,6 +50,7 @@ const columns = [
 export default function InspectorsListPage() {
   const [data, setData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
 
   useEffect(() => {
     const fetchInspectors = async () => {
@@ -58,6 +60,7 @@ export default function InspectorsListPage() {
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         const apiUrl = process.env.NEXT_PUBLIC_API_URL;
         const res = await axios.get(`${apiUrl}/inspections/api/v1/inspectors/`, { headers });
+        trackPage(res);
         setData(res.data.results || res.data);
       } catch (error) {
         showErrorToast(error, "Inspectors");
@@ -80,7 +83,7 @@ export default function InspectorsListPage() {
     <div>
       <Breadcrumbs items={[{ label: "Inspection", href: "/inspection" }, { label: "Inspectors" }]} />
       <div className="p-6">
-          <DataTable columns={columns} data={data} tableData={tableData} loading={loading} />
+          <DataTable columns={columns} data={data} tableData={tableData} loading={loading} nextPage={nextPage} loadingMore={loadingMore} onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows]))} />
       </div>
     </div>
   );
@@ -6,6 +6,7 @@ import axios from "axios";
 import { Card, Spin, Select, Button, message } from "antd";
 import Breadcrumbs from "@/components/common/Breadcrumbs";
 import { showErrorToast, showSuccessToast, COMMON_ERROR_MESSAGES, COMMON_SUCCESS_MESSAGES } from "@/utils/errorHandler";
+import { fetchAllPages } from "@/lib/pagination";
 
 const InfoPair = ({ label, value }: { label: string, value: React.ReactNode }) => (
   <div className="flex justify-between py-2 border-b">
@@ -35,12 +36,13 @@ export default function AssignInspectorPage() {
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
 
         const requestDetailsPromise = axios.get(`${apiUrl}/inspections/api/v1/requests/${id}/`, { headers });
-        const inspectorsPromise = axios.get(`${apiUrl}/inspections/api/v1/inspectors`, { headers });
+        // Every inspector is an option, so read all the pages of the list
+        const inspectorsPromise = fetchAllPages(`${apiUrl}/inspections/api/v1/inspectors/`, { headers });
         
-        const [requestRes, inspectorsRes] = await Promise.all([requestDetailsPromise, inspectorsPromise]);
+        const [requestRes, inspectorList] = await Promise.all([requestDetailsPromise, inspectorsPromise]);
         
         setRequestData(requestRes.data);
-        setInspectors(inspectorsRes.data || []);
+        setInspectors(inspectorList || []);
         if (requestRes.data.inspector_assigned) {
           setSelectedInspector(requestRes.data.inspector_assigned.id);
         }
@@ -9,6 +9,7 @@ import { useRouter } from "next/navigation";
 import AssignCarAttributesModal from "@/components/modals/AssignCarAttributesModal";
 import { showErrorToast, COMMON_ERROR_MESSAGES } from "@/utils/errorHandler";
 import { getInspectionStatusLabel, getInspectionStatusColor } from "@/utils/inspectionStatusMapping";
+import { useNextPage } from "@/hooks/useNextPage";
 
 export default function Page() {
   const router = useRouter();
@@ -17,6 +18,29 @@ export default function Page() {
   const [error, setError] = useState<string | null>(null);
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [selectedRequestId, setSelectedRequestId] = useState<number | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapRequest = (item: any) => ({
+    id: item.id, // Add explicit id field for sorting
+    key: item.id.toString(),
+    vin: item.vin || "N/A",
+    location: (
+      <div>
+        <b>{item.inspection_location?.title || "N/A"}</b><br />
+        {item.inspection_location?.address || "N/A"}<br />
+        {item.inspection_location?.phone || "N/A"}
+      </div>
+    ),
+    vehicle: (
+      <div>
+        Year : {item.year || "N/A"}<br />
+        Make : {item.make || "N/A"}<br />
+        Model : {item.model || "N/A"}
+      </div>
+    ),
+    price: item.expected_price || 0,
+    status: item.status || 0, // Use the status from API response
+  });
 
   const openModal = (requestId: number) => {
     setSelectedRequestId(requestId);
@@ -38,27 +62,8 @@ export default function Page() {
       message.success("Inspector unassigned successfully.");
       // Refresh the list
       const response = await axios.get(`${apiUrl}/inspections/api/v1/admin-requests/?status=Requests`, { headers });
-      const transformedData = response.data.map((item: any) => ({
-        id: item.id, // Add explicit id field for sorting
-        key: item.id.toString(),
-        vin: item.vin || "N/A",
-        location: (
-          <div>
-            <b>{item.inspection_location?.title || "N/A"}</b><br />
-            {item.inspection_location?.address || "N/A"}<br />
-            {item.inspection_location?.phone || "N/A"}
-          </div>
-        ),
-        vehicle: (
-          <div>
-            Year : {item.year || "N/A"}<br />
-            Make : {item.make || "N/A"}<br />
-            Model : {item.model || "N/A"}
-          </div>
-        ),
-        price: item.expected_price || 0,
-        status: item.status || 0,
-      }));
+      trackPage(response);
+      const transformedData = response.data.map(mapRequest);
       setData(transformedData);
     } catch (err: any) {
       showErrorToast(err, "Unassign Inspector");
@@ -165,28 +170,9 @@ export default function Page() {
         const headers = token ? { Authorization: `Bearer ${token}` } : {};
         
         const response = await axios.get(`${apiUrl}/inspections/api/v1/admin-requests/?status=Requests`, { headers });
+        trackPage(response);
         
-        const transformedData = response.data.map((item: any) => ({
-          id: item.id, // Add explicit id field for sorting
-          key: item.id.toString(),
-          vin: item.vin || "N/A",
-          location: (
-            <div>
-              <b>{item.inspection_location?.title || "N/A"}</b><br />
-              {item.inspection_location?.address || "N/A"}<br />
-              {item.inspection_location?.phone || "N/A"}
-            </div>
-          ),
-          vehicle: (
-            <div>
-              Year : {item.year || "N/A"}<br />
-              Make : {item.make || "N/A"}<br />
-              Model : {item.model || "N/A"}
-            </div>
-          ),
-          price: item.expected_price || 0,
-          status: item.status || 0, // Use the status from API response
-        }));
+        const transformedData = response.data.map(mapRequest);
 
         setData(transformedData);
       } catch (err: any) {
@@ -218,7 +204,15 @@ export default function Page() {
     <main>
       <Breadcrumbs items={[{ label: "Inspection", href: "/inspection" }, { label: "Requests" }]} />
       <div className="p-6">
-          <DataTable columns={columns} data={data} tableData={{}} loading={loading} />
+          <DataTable
+            columns={columns}
+            data={data}
+            tableData={{}}
+            loading={loading}
+            nextPage={nextPage}
+            loadingMore={loadingMore}
+            onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapRequest)]))}
+          />
       </div>
       <AssignCarAttributesModal
         isOpen={isModalOpen}
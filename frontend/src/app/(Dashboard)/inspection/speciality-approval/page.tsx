@@ -9,11 +9,23 @@ import { CheckOutlined, DeleteOutlined, DownOutlined, SettingOutlined, EyeOutlin
 import ConfirmModal from "@/components/modals/ConfirmModal";
 import DataTable from "@/components/common/DataTable";
 import { getInspectionStatusLabel, getInspectionStatusColor } from "@/utils/inspectionStatusMapping";
+import { useNextPage } from "@/hooks/useNextPage";
 
 export default function SpecialityApprovalPage() {
   const [data, setData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapTask = (item: any) => ({
+    key: item.id.toString(),
+    id: item.id,
+    vehicle: item.vehicle || item.vehicle_name || 'N/A',
+    status: item.status || 0,
+    expected_price: item.expected_price || 0,
+    // Add more fields as needed from the API response
+  });
+
   const [confirmModalOpen, setConfirmModalOpen] = useState(false);
   const [selectedTask, setSelectedTask] = useState<any | null>(null);
   const router = useRouter();
@@ -61,16 +73,10 @@ export default function SpecialityApprovalPage() {
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       const apiUrl = process.env.NEXT_PUBLIC_API_URL;
       const res = await axios.get(`${apiUrl}/inspections/api/v1/speciality-vehicle/requests/`, { headers });
+      trackPage(res);
       const rawData = res.data.results || res.data.data || (Array.isArray(res.data) ? res.data : []);
       
-      const transformedData = rawData.map((item: any) => ({
-        key: item.id.toString(),
-        id: item.id,
-        vehicle: item.vehicle || item.vehicle_name || 'N/A',
-        status: item.status || 0,
-        expected_price: item.expected_price || 0,
-        // Add more fields as needed from the API response
-      }));
+      const transformedData = rawData.map(mapTask);
 
       setData(transformedData);
     } catch (err: any) {
@@ -168,7 +174,10 @@ export default function SpecialityApprovalPage() {
           columns={columns} 
           data={data} 
           tableData={{}} 
-          loading={loading} 
+          loading={loading}
+          nextPage={nextPage}
+          loadingMore={loadingMore}
+          onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapTask)]))}
         />
       </div>
       <ConfirmModal
@@ -5,6 +5,7 @@ import { Form, Button } from "antd";
 import { FormField } from "@/components/common/FormField";
 import { useParams, useRouter, useSearchParams } from "next/navigation";
 import { showErrorToast, showSuccessToast, COMMON_ERROR_MESSAGES, COMMON_SUCCESS_MESSAGES } from "@/utils/errorHandler";
+import { parseReportSection } from "@/lib/utils";
 
 // Field name mapping: UI field name -> API field name
 const fieldNameMap: Record<string, string> = {
@@ -103,7 +104,7 @@ export default function InspectionFormPage() {
         // Parse exterior section
         if (data.exterior) {
           try {
-            const exterior = JSON.parse(data.exterior);
+            const exterior = parseReportSection(data.exterior);
             console.log("[Resume Inspection Debug] Parsed exterior:", exterior);
             
             // Map radio buttons
@@ -153,7 +154,7 @@ export default function InspectionFormPage() {
         // Parse interior section
         if (data.interior) {
           try {
-            const interior = JSON.parse(data.interior);
+            const interior = parseReportSection(data.interior);
             console.log("[Resume Inspection Debug] Parsed interior:", interior);
             
             if (interior.radio) {
@@ -199,7 +200,7 @@ export default function InspectionFormPage() {
         // Parse mechanical section
         if (data.mechanical) {
           try {
-            const mechanical = JSON.parse(data.mechanical);
+            const mechanical = parseReportSection(data.mechanical);
             console.log("[Resume Inspection Debug] Parsed mechanical:", mechanical);
             
             if (mechanical.radio) {
@@ -260,7 +261,7 @@ export default function InspectionFormPage() {
         // Parse wheels section
         if (data.wheels) {
           try {
-            const wheels = JSON.parse(data.wheels);
+            const wheels = parseReportSection(data.wheels);
             console.log("[Resume Inspection Debug] Parsed wheels:", wheels);
             
             if (wheels.input) {
@@ -287,7 +288,7 @@ export default function InspectionFormPage() {
         // Parse warning_lights section
         if (data.warning_lights) {
           try {
-            const warningLights = JSON.parse(data.warning_lights);
+            const warningLights = parseReportSection(data.warning_lights);
             console.log("[Resume Inspection Debug] Parsed warning_lights:", warningLights);
             
             if (warningLights.radio) {
@@ -345,7 +346,7 @@ export default function InspectionFormPage() {
         // Parse frame section
         if (data.frame) {
           try {
-            const frame = JSON.parse(data.frame);
+            const frame = parseReportSection(data.frame);
             console.log("[Resume Inspection Debug] Parsed frame:", frame);
             
             if (frame.radio) {
@@ -369,7 +370,7 @@ export default function InspectionFormPage() {
         // Parse drivability section
         if (data.drivability) {
           try {
-            const drivability = JSON.parse(data.drivability);
+            const drivability = parseReportSection(data.drivability);
             console.log("[Resume Inspection Debug] Parsed drivability:", drivability);
             
             if (drivability.radio) {
@@ -389,7 +390,7 @@ export default function InspectionFormPage() {
         // Parse damage_and_rust section
         if (data.demage_and_rust) {
           try {
-            const damageAndRust = JSON.parse(data.demage_and_rust);
+            const damageAndRust = parseReportSection(data.demage_and_rust);
             console.log("[Resume Inspection Debug] Parsed damage_and_rust:", damageAndRust);
             
             newInspectionData.damageNotes = damageAndRust.demage_notes ?? "";
@@ -6,6 +6,7 @@ import { EyeOutlined, CheckCircleOutlined, DownOutlined, CloseOutlined, CheckOut
 import { useState, useEffect, useRef } from "react";
 import axios from "axios";
 import { showErrorToast, showSuccessToast } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
 
 // Status code to label mapping
 const STATUS_MAP: Record<number, string> = {
@@ -37,6 +38,7 @@ export default function TasksPage() {
   const [tasks, setTasks] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
   const [actionLoading, setActionLoading] = useState<number | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
   const hasFetched = useRef(false);
 
   // API function to mark inspection as complete/reject
@@ -82,6 +84,7 @@ export default function TasksPage() {
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       const apiUrl = process.env.NEXT_PUBLIC_API_URL;
       const res = await axios.get(`${apiUrl}/inspections/api/v1/inspector-tasks/`, { headers });
+      trackPage(res);
       console.log("Tasks fetched:", res.data?.length || 0, "items");
       setTasks(res.data || []);
       showSuccessToast('Tasks fetched successfully!', 'Tasks');
@@ -185,7 +188,7 @@ export default function TasksPage() {
 
   return (
     <div className="p-6">
-      <DataTable columns={columns} data={mappedTasks} loading={loading} />
+      <DataTable columns={columns} data={mappedTasks} loading={loading} nextPage={nextPage} loadingMore={loadingMore} onLoadMore={() => loadMore(rows => setTasks(prev => [...prev, ...rows]))} />
     </div>
   );
 } 
\ No newline at end of file
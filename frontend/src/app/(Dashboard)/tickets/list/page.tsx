@@ -7,12 +7,32 @@ import React, { useState, useEffect } from "react";
 import { useRouter } from "next/navigation";
 import axios from "axios";
 import { showErrorToast, showSuccessToast } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
 
 export default function TicketListPage() {
   const [data, setData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const router = useRouter();
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  // Map API response to table format
+  const mapTicket = (item: any, index: number) => ({
+    key: item.id || index + 1,
+    ticketNo: item.id || `TKT-${index + 1}`,
+    updated: item.updated_at ? new Date(item.updated_at).toLocaleDateString() : "N/A",
+    name: item.name || "N/A",
+    email: item.email || "N/A",
+    auctionId: item.auction_id || "N/A",
+    subject: item.subject || "No subject",
+    message: item.message || "No message",
+    status: item.status?.name || "New",
+    statusColor: item.status?.color || "default",
+    priority: item.priority || "2",
+    category: item.category_id?.name || "N/A",
+    createdAt: item.created_at ? new Date(item.created_at).toLocaleDateString() : "N/A",
+    originalData: item
+  });
 
   // Fetch tickets from API
   const fetchTickets = async () => {
@@ -25,23 +45,8 @@ export default function TicketListPage() {
       
       const response = await axios.get(`${apiUrl}/arbitration/api/v1/tickets/`, { headers });
       
-      // Map API response to table format
-      const mappedData = (response.data || []).map((item: any, index: number) => ({
-        key: item.id || index + 1,
-        ticketNo: item.id || `TKT-${index + 1}`,
-        updated: item.updated_at ? new Date(item.updated_at).toLocaleDateString() : "N/A",
-        name: item.name || "N/A",
-        email: item.email || "N/A",
-        auctionId: item.auction_id || "N/A",
-        subject: item.subject || "No subject",
-        message: item.message || "No message",
-        status: item.status?.name || "New",
-        statusColor: item.status?.color || "default",
-        priority: item.priority || "2",
-        category: item.category_id?.name || "N/A",
-        createdAt: item.created_at ? new Date(item.created_at).toLocaleDateString() : "N/A",
-        originalData: item
-      }));
+      const mappedData = (response.data || []).map(mapTicket);
+      trackPage(response);
       
       setData(mappedData);
       showSuccessToast("Tickets loaded successfully!", "Tickets");
@@ -188,6 +193,9 @@ export default function TicketListPage() {
             isEnableFilterInput: true,
             selectableRows: true,
           }}
+          nextPage={nextPage}
+          loadingMore={loadingMore}
+          onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapTicket)]))}
         />
       </div>
     </div>
@@ -4,7 +4,7 @@ import { useTransportationJobs } from "@/hooks/useTransportationJobs";
 import JobsTable from "@/components/transportation/JobsTable";
 
 export default function JobsAcceptedPage() {
-  const { data, loading } = useTransportationJobs('Accepted');
+  const { data, loading, nextPage, loadingMore, loadMore } = useTransportationJobs('Accepted');
 
   if (loading) {
     return (
@@ -26,6 +26,9 @@ export default function JobsAcceptedPage() {
         loading={loading} 
         status="Accepted" 
         title="Accepted Jobs" 
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={loadMore}
       />
     </div>
   );
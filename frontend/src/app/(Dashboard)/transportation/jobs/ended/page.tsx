@@ -4,7 +4,7 @@ import { useTransportationJobs } from "@/hooks/useTransportationJobs";
 import JobsTable from "@/components/transportation/JobsTable";
 
 export default function JobsEndedPage() {
-  const { data, loading } = useTransportationJobs('Ended');
+  const { data, loading, nextPage, loadingMore, loadMore } = useTransportationJobs('Ended');
 
   if (loading) {
     return (
@@ -26,6 +26,9 @@ export default function JobsEndedPage() {
         loading={loading} 
         status="Ended" 
         title="Completed Jobs" 
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={loadMore}
       />
     </div>
   );
@@ -4,7 +4,7 @@ import { useTransportationJobs } from "@/hooks/useTransportationJobs";
 import JobsTable from "@/components/transportation/JobsTable";
 
 export default function JobsUnpickedPage() {
-  const { data, loading } = useTransportationJobs('UnPicked');
+  const { data, loading, nextPage, loadingMore, loadMore } = useTransportationJobs('UnPicked');
 
   if (loading) {
     return (
@@ -26,6 +26,9 @@ export default function JobsUnpickedPage() {
         loading={loading} 
         status="UnPicked" 
         title="Un-Picked Jobs" 
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={loadMore}
       />
     </div>
   );
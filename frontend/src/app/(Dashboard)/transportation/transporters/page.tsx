@@ -6,6 +6,7 @@ import { SettingOutlined, DownOutlined } from "@ant-design/icons";
 import Link from "next/link";
 import { useState, useEffect } from "react";
 import axios from "axios";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const columns = [
   { title: "Business Name", dataIndex: "businessName", key: "businessName" },
@@ -46,6 +47,7 @@ const columns = [
 export default function TransportersPage() {
   const [data, setData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
@@ -59,6 +61,7 @@ export default function TransportersPage() {
         
         // Send the GET request to the transportation API endpoint
         const res = await axios.get(`${apiUrl}/transportation/api/v1/transporter/`, { headers });
+        trackPage(res);
         
         // Update the state with the fetched data
         setData(res.data);
@@ -94,6 +97,9 @@ export default function TransportersPage() {
             addButtonLabel: "Add Transporter",
             addButtonHref: "/transportation/transporters/add",
           }}
+          nextPage={nextPage}
+          loadingMore={loadingMore}
+          onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows]))}
         />
       </div>
     </div>
@@ -6,6 +6,8 @@ import { useState, useEffect } from "react";
 import axios from "axios";
 import { showErrorToast, showSuccessToast } from "@/utils/errorHandler";
 import { useRouter } from "next/navigation";
+import { useNextPage } from "@/hooks/useNextPage";
+import LoadMoreButton from "@/components/common/LoadMoreButton";
 
 export default function TransporterAcceptedJobsPage() {
   const [data, setData] = useState<any[]>([]);
@@ -15,6 +17,29 @@ export default function TransporterAcceptedJobsPage() {
   const [updateLoading, setUpdateLoading] = useState(false);
   const [selectedJobId, setSelectedJobId] = useState<string | null>(null);
   const [selectedAction, setSelectedAction] = useState<string | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapJob = (item: any, index: number) => {
+    return {
+      key: item.id || index + 1,
+      vehicle: item.vehicle || item.vehicle_name || `${item.year || ''} ${item.make || ''} ${item.model || ''}`.trim() || 'Vehicle',
+      vin: item.vin ? item.vin.slice(-6) : item.vin || '-',
+      image: item.image || item.vehicle_image || "/images/car1.jpg",
+      pickup: {
+        name: item.pickup_location?.name || item.pickup_name || "Pickup Location",
+        address: item.pickup_location?.address || item.pickup_address || "Address not available",
+      },
+      dropoff: {
+        name: item.dropoff_location?.name || item.dropoff_name || "Dropoff Location", 
+        address: item.dropoff_location?.address || item.dropoff_address || "Address not available",
+      },
+      progress: item.progress || item.completion_percentage || 0,
+      transportFee: item.transport_fee || item.fee || 0,
+      status: item.status || "In Progress",
+      originalData: item, // Keep original data for actions
+    };
+  };
+
   const router = useRouter();
   
   const handleViewDetails = (id: string) => {
@@ -186,28 +211,10 @@ export default function TransporterAcceptedJobsPage() {
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       
       const response = await axios.get(`${apiUrl}/transportation/api/v1/accepted-jobs/`, { headers });
+      trackPage(response);
       
       // Map API response to match the existing data structure
-      const mappedData = (response.data || []).map((item: any, index: number) => {
-        return {
-          key: item.id || index + 1,
-          vehicle: item.vehicle || item.vehicle_name || `${item.year || ''} ${item.make || ''} ${item.model || ''}`.trim() || 'Vehicle',
-          vin: item.vin ? item.vin.slice(-6) : item.vin || '-',
-          image: item.image || item.vehicle_image || "/images/car1.jpg",
-          pickup: {
-            name: item.pickup_location?.name || item.pickup_name || "Pickup Location",
-            address: item.pickup_location?.address || item.pickup_address || "Address not available",
-          },
-          dropoff: {
-            name: item.dropoff_location?.name || item.dropoff_name || "Dropoff Location", 
-            address: item.dropoff_location?.address || item.dropoff_address || "Address not available",
-          },
-          progress: item.progress || item.completion_percentage || 0,
-          transportFee: item.transport_fee || item.fee || 0,
-          status: item.status || "In Progress",
-          originalData: item, // Keep original data for actions
-        };
-      });
+      const mappedData = (response.data || []).map(mapJob);
       
       setData(mappedData);
       showSuccessToast("Accepted jobs loaded successfully!", "Jobs");
@@ -298,7 +305,8 @@ export default function TransporterAcceptedJobsPage() {
               `${range[0]}-${range[1]} of ${total} items`,
           }}
           className="custom-table"
-                />
+        />
+        <LoadMoreButton nextPage={nextPage} loading={loadingMore} onClick={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapJob)]))} />
       </Card>
 
       {/* Confirmation Modal */}
@@ -5,6 +5,8 @@ import Breadcrumbs from "@/components/common/Breadcrumbs";
 import { useState, useEffect } from "react";
 import axios from "axios";
 import { showErrorToast, showSuccessToast } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
+import LoadMoreButton from "@/components/common/LoadMoreButton";
 
 const columns = [
   {
@@ -92,6 +94,41 @@ export default function TransporterCompletedJobsPage() {
   const [data, setData] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapJob = (item: any, index: number) => {
+    // Format dates
+    const completedDate = item.completed_date || item.completion_date ? 
+      new Date(item.completed_date || item.completion_date).toLocaleDateString() : 
+      'N/A';
+
+    // Calculate duration if start and end dates are available
+    let duration = item.duration || 'N/A';
+    if (item.start_date && (item.completed_date || item.completion_date)) {
+      const start = new Date(item.start_date);
+      const end = new Date(item.completed_date || item.completion_date);
+      const diffTime = Math.abs(end.getTime() - start.getTime());
+      const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
+      duration = `${diffDays} day${diffDays !== 1 ? 's' : ''}`;
+    }
+
+    return {
+      key: item.id || index + 1,
+      vehicle: item.vehicle || item.vehicle_name || `${item.year || ''} ${item.make || ''} ${item.model || ''}`.trim() || 'Vehicle',
+      vin: item.vin ? item.vin.slice(-6) : item.vin || '-',
+      image: item.image || item.vehicle_image || "/images/car1.jpg",
+      route: {
+        from: item.pickup_location?.name || item.pickup_name || item.from_location || "Pickup Location",
+        to: item.dropoff_location?.name || item.dropoff_name || item.to_location || "Dropoff Location",
+        distance: item.distance || item.distance_km || 0
+      },
+      completedDate: completedDate,
+      duration: duration,
+      earnings: item.earnings || item.transport_fee || item.fee || 0,
+      status: item.status || "Completed",
+      originalData: item, // Keep original data for actions
+    };
+  };
 
   const fetchCompletedJobs = async () => {
     setLoading(true);
@@ -102,41 +139,10 @@ export default function TransporterCompletedJobsPage() {
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       
       const response = await axios.get(`${apiUrl}/transportation/api/v1/completed-jobs/`, { headers });
+      trackPage(response);
       
       // Map API response to match the existing data structure
-      const mappedData = (response.data || []).map((item: any, index: number) => {
-        // Format dates
-        const completedDate = item.completed_date || item.completion_date ? 
-          new Date(item.completed_date || item.completion_date).toLocaleDateString() : 
-          'N/A';
-        
-        // Calculate duration if start and end dates are available
-        let duration = item.duration || 'N/A';
-        if (item.start_date && (item.completed_date || item.completion_date)) {
-          const start = new Date(item.start_date);
-          const end = new Date(item.completed_date || item.completion_date);
-          const diffTime = Math.abs(end.getTime() - start.getTime());
-          const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
-          duration = `${diffDays} day${diffDays !== 1 ? 's' : ''}`;
-        }
-
-        return {
-          key: item.id || index + 1,
-          vehicle: item.vehicle || item.vehicle_name || `${item.year || ''} ${item.make || ''} ${item.model || ''}`.trim() || 'Vehicle',
-          vin: item.vin ? item.vin.slice(-6) : item.vin || '-',
-          image: item.image || item.vehicle_image || "/images/car1.jpg",
-          route: {
-            from: item.pickup_location?.name || item.pickup_name || item.from_location || "Pickup Location",
-            to: item.dropoff_location?.name || item.dropoff_name || item.to_location || "Dropoff Location",
-            distance: item.distance || item.distance_km || 0
-          },
-          completedDate: completedDate,
-          duration: duration,
-          earnings: item.earnings || item.transport_fee || item.fee || 0,
-          status: item.status || "Completed",
-          originalData: item, // Keep original data for actions
-        };
-      });
+      const mappedData = (response.data || []).map(mapJob);
       
       setData(mappedData);
       showSuccessToast("Completed jobs loaded successfully!", "Jobs");
@@ -228,6 +234,7 @@ export default function TransporterCompletedJobsPage() {
           }}
           className="custom-table"
         />
+        <LoadMoreButton nextPage={nextPage} loading={loadingMore} onClick={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapJob)]))} />
       </Card>
     </div>
   );
@@ -7,6 +7,7 @@ import ExpandableRowContent from "@/components/common/ExpandableRowContent";
 import { useState, useEffect } from "react";
 import axios from "axios";
 import { showErrorToast, showSuccessToast } from "@/utils/errorHandler";
+import { useNextPage } from "@/hooks/useNextPage";
 
 const columns = [
   {
@@ -71,6 +72,33 @@ export default function TransporterNewJobsPage() {
   const [confirmModalOpen, setConfirmModalOpen] = useState(false);
   const [selectedJob, setSelectedJob] = useState<any>(null);
   const [acceptingJob, setAcceptingJob] = useState(false);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
+
+  const mapJob = (item: any, index: number) => {
+    return {
+      key: item.id || index + 1,
+      vehicle: item.vehicle || item.vehicle_name || `${item.year || ''} ${item.make || ''} ${item.model || ''}`.trim() || 'Vehicle',
+      vin: item.vin ? item.vin.slice(-6) : item.vin || '-',
+      image: item.image || item.vehicle_image || "/images/car1.jpg",
+      pickupTime: item.pickup_time || item.pickup_date || "Not decided",
+      dropTime: item.drop_time || item.drop_date || "Not decided",
+      transportFee: item.transport_fee || item.fee || 0,
+      transportRate: item.transport_rate || item.rate_per_km || 0,
+      selected: item.selected || false,
+      pickup: {
+        name: item.pickup_location?.name || item.pickup_name || "Pickup Location",
+        address: item.pickup_location?.address || item.pickup_address || "Address not available",
+        phone: item.pickup_location?.phone || item.pickup_phone || "Phone not available",
+      },
+      dropoff: {
+        name: item.dropoff_location?.name || item.dropoff_name || "Dropoff Location",
+        address: item.dropoff_location?.address || item.dropoff_address || "Address not available",
+        phone: item.dropoff_location?.phone || item.dropoff_phone || "Phone not available",
+      },
+      distance: item.distance || item.distance_km || 0,
+      originalData: item, // Keep original data for API calls
+    };
+  };
 
   const fetchNewJobs = async () => {
     setLoading(true);
@@ -81,33 +109,10 @@ export default function TransporterNewJobsPage() {
       const headers = token ? { Authorization: `Bearer ${token}` } : {};
       
       const response = await axios.get(`${apiUrl}/transportation/api/v1/new-jobs/`, { headers });
+      trackPage(response);
       
       // Map API response to match the existing data structure
-      const mappedData = (response.data || []).map((item: any, index: number) => {
-        return {
-          key: item.id || index + 1,
-          vehicle: item.vehicle || item.vehicle_name || `${item.year || ''} ${item.make || ''} ${item.model || ''}`.trim() || 'Vehicle',
-          vin: item.vin ? item.vin.slice(-6) : item.vin || '-',
-          image: item.image || item.vehicle_image || "/images/car1.jpg",
-          pickupTime: item.pickup_time || item.pickup_date || "Not decided",
-          dropTime: item.drop_time || item.drop_date || "Not decided",
-          transportFee: item.transport_fee || item.fee || 0,
-          transportRate: item.transport_rate || item.rate_per_km || 0,
-          selected: item.selected || false,
-          pickup: {
-            name: item.pickup_location?.name || item.pickup_name || "Pickup Location",
-            address: item.pickup_location?.address || item.pickup_address || "Address not available",
-            phone: item.pickup_location?.phone || item.pickup_phone || "Phone not available",
-          },
-          dropoff: {
-            name: item.dropoff_location?.name || item.dropoff_name || "Dropoff Location",
-            address: item.dropoff_location?.address || item.dropoff_address || "Address not available",
-            phone: item.dropoff_location?.phone || item.dropoff_phone || "Phone not available",
-          },
-          distance: item.distance || item.distance_km || 0,
-          originalData: item, // Keep original data for API calls
-        };
-      });
+      const mappedData = (response.data || []).map(mapJob);
       
       setData(mappedData);
       showSuccessToast("New jobs fetched successfully!", "Jobs");
@@ -281,6 +286,9 @@ export default function TransporterNewJobsPage() {
             isEnableFilterInput: false,
           }}
           expandable={expandableConfig}
+          nextPage={nextPage}
+          loadingMore={loadingMore}
+          onLoadMore={() => loadMore(rows => setData(prev => [...prev, ...rows.map(mapJob)]))}
         />
       </Card>
 
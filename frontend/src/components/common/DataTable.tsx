@@ -3,6 +3,7 @@ import { useState, useMemo } from "react";
 import { SearchOutlined, LoadingOutlined } from "@ant-design/icons";
 import Link from "next/link";
 import { Button } from "antd";
+import LoadMoreButton from "@/components/common/LoadMoreButton";
 
 interface DataTableProps {
   columns: any[];
@@ -18,9 +19,13 @@ interface DataTableProps {
   rowSelection?: any;
   expandable?: any;
   loading?: boolean;
+  // Link to the next API page, shown as a "Load more" button under the table
+  nextPage?: string | null;
+  onLoadMore?: () => void;
+  loadingMore?: boolean;
 }
 
-export default function DataTable({ columns, data, tableData = {}, rowSelection, expandable, loading }: DataTableProps) {
+export default function DataTable({ columns, data, tableData = {}, rowSelection, expandable, loading, nextPage, onLoadMore, loadingMore }: DataTableProps) {
   const [search, setSearch] = useState("");
   const [pagination, setPagination] = useState({
     current: 1,
@@ -105,6 +110,7 @@ export default function DataTable({ columns, data, tableData = {}, rowSelection,
           loading={loading ? { spinning: true, indicator: sky700Spinner } : false}
         />
       </div>
+      {onLoadMore && <LoadMoreButton nextPage={nextPage ?? null} loading={loadingMore} onClick={onLoadMore} />}
     </div>
   );
 } 
\ No newline at end of file
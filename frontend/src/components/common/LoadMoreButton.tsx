@@ -0,0 +1,22 @@
+"use client";
+
+import { Button } from "antd";
+
+interface LoadMoreButtonProps {
+  nextPage: string | null;
+  loading?: boolean;
+  onClick: () => void;
+}
+
+// Shown under a list while the API links a further page
+export default function LoadMoreButton({ nextPage, loading, onClick }: LoadMoreButtonProps) {
+  if (!nextPage) return null;
+
+  return (
+    <div className="flex justify-center mt-4">
+      <Button onClick={onClick} loading={loading}>
+        Load more
+      </Button>
+    </div>
+  );
+}
@@ -12,9 +12,12 @@ interface JobsTableProps {
   loading: boolean;
   status: JobStatus;
   title: string;
+  nextPage?: string | null;
+  loadingMore?: boolean;
+  onLoadMore?: () => void;
 }
 
-const JobsTable = ({ data, loading, status, title }: JobsTableProps) => {
+const JobsTable = ({ data, loading, status, title, nextPage, loadingMore, onLoadMore }: JobsTableProps) => {
   const [expandedRowKeys, setExpandedRowKeys] = useState<any[]>([]);
   const [activeTabs, setActiveTabs] = useState<{ [key: string]: string }>({});
 
@@ -265,6 +268,9 @@ const JobsTable = ({ data, loading, status, title }: JobsTableProps) => {
         tableData={{}}
         loading={loading}
         expandable={expandableConfig}
+        nextPage={nextPage}
+        loadingMore={loadingMore}
+        onLoadMore={onLoadMore}
       />
     </div>
   );
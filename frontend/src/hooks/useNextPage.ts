@@ -0,0 +1,35 @@
+import { useState } from 'react';
+import axios, { type AxiosResponse } from 'axios';
+import { showErrorToast } from '@/utils/errorHandler';
+import { nextPageUrl } from '@/lib/pagination';
+
+// Keeps the Link header's next page of a list and loads it on demand
+export const useNextPage = () => {
+  const [nextPage, setNextPage] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  // Call with every first-page response, so a reload starts over
+  const trackPage = (response: AxiosResponse) => {
+    setNextPage(nextPageUrl(response.headers?.link));
+  };
+
+  const loadMore = async (append: (rows: any[]) => void) => {
+    if (!nextPage) return;
+
+    setLoadingMore(true);
+    try {
+      const token = typeof window !== "undefined" ? localStorage.getItem("access") : null;
+      const headers = token ? { Authorization: `Bearer ${token}` } : {};
+      const response = await axios.get(nextPage, { headers });
+
+      append(Array.isArray(response.data) ? response.data : []);
+      trackPage(response);
+    } catch (err) {
+      showErrorToast(err, "Load more");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  return { nextPage, loadingMore, trackPage, loadMore };
+};
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import axios from 'axios';
 import { showErrorToast, showSuccessToast } from '@/utils/errorHandler';
+import { useNextPage } from '@/hooks/useNextPage';
 
 export type JobStatus = 'UnPicked' | 'Accepted' | 'Ended';
 
@@ -49,6 +50,7 @@ export interface JobData {
 export const useTransportationJobs = (status: JobStatus) => {
   const [data, setData] = useState<JobData[]>([]);
   const [loading, setLoading] = useState(true);
+  const { nextPage, loadingMore, trackPage, loadMore } = useNextPage();
 
   const mapJobData = (job: any, index: number): JobData => {
     const baseJob = {
@@ -114,6 +116,11 @@ export const useTransportationJobs = (status: JobStatus) => {
     return baseJob;
   };
 
+  const hasStatus = (job: any) => {
+    const jobStatus = job.status || job.job_status || 'UnPicked';
+    return jobStatus.toLowerCase() === status.toLowerCase();
+  };
+
   const fetchJobs = async () => {
     setLoading(true);
     try {
@@ -123,16 +130,14 @@ export const useTransportationJobs = (status: JobStatus) => {
       
       // Try without status parameter first
       const response = await axios.get(`${apiUrl}/transportation/api/v1/jobs/`, { headers });
+      trackPage(response);
       
       // Filter data based on status on client side
       let filteredData = response.data || [];
       
       // If the API returns all jobs, filter by status
       if (Array.isArray(filteredData)) {
-        filteredData = filteredData.filter((job: any) => {
-          const jobStatus = job.status || job.job_status || 'UnPicked';
-          return jobStatus.toLowerCase() === status.toLowerCase();
-        });
+        filteredData = filteredData.filter(hasStatus);
       }
       
       const mappedData = filteredData.map(mapJobData);
@@ -153,6 +158,9 @@ export const useTransportationJobs = (status: JobStatus) => {
   return {
     data,
     loading,
-    refetch: fetchJobs
+    refetch: fetchJobs,
+    nextPage,
+    loadingMore,
+    loadMore: () => loadMore(rows => setData(prev => [...prev, ...rows.filter(hasStatus).map(mapJobData)]))
   };
 }; 
\ No newline at end of file
@@ -0,0 +1,31 @@
+import axios, { type AxiosRequestConfig } from "axios";
+
+// List endpoints return one page of rows and link the following page from the
+// Link header. Screens load further pages on demand with nextPageUrl; only
+// small reference lists (dropdown options) are read in full with fetchAllPages.
+
+export function nextPageUrl(link?: string | null): string | null {
+  if (!link) return null;
+
+  for (const part of link.split(",")) {
+    const match = part.match(/<([^>]+)>\s*;\s*rel="next"/);
+    if (match) return match[1];
+  }
+
+  return null;
+}
+
+export async function fetchAllPages<T = any>(url: string, config?: AxiosRequestConfig): Promise<T[]> {
+  const rows: T[] = [];
+  let next: string | null = url;
+
+  while (next) {
+    const response = await axios.get(next, config);
+    if (!Array.isArray(response.data)) return response.data;
+
+    rows.push(...response.data);
+    next = nextPageUrl(response.headers?.link);
+  }
+
+  return rows;
+}
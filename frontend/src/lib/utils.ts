@@ -3,4 +3,13 @@ import { twMerge } from "tailwind-merge"
 
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
-} 
\ No newline at end of file
+} 
+// Inspection report sections arrive as objects, or as JSON text from older API versions
+export function parseReportSection(value: any): any {
+  if (typeof value !== "string") return value ?? {}
+  try {
+    return JSON.parse(value)
+  } catch {
+    return {}
+  }
+}